@@ -0,0 +1,50 @@
+"""
+Throughput benchmark for ElixirDB.bulk_insert against sqlite.
+
+Inserts N generated rows into a temporary sqlite database with each insert
+method and batch size, and reports rows per second.
+
+    python benchmarks/bench_bulk_insert.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+from elixirdb import ElixirDB
+
+
+def rows(count: int):
+    for i in range(count):
+        yield {"id": i, "name": f"name_{i}", "amount": i * 0.5}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        db = ElixirDB(config={"dialect": "sqlite", "url": url})
+        db.execute(
+            "CREATE TABLE rows (id INTEGER PRIMARY KEY, name TEXT, amount REAL)"
+        )
+        # The multi-row VALUES method binds 3 parameters per row and sqlite
+        # allows 32766 parameters per statement.
+        for method, batch_size in (
+            ("executemany", 1000),
+            ("executemany", 10_000),
+            ("values", 1000),
+            ("values", 10_000),
+        ):
+            db.execute("DELETE FROM rows")
+            result = db.bulk_insert("rows", rows(count), batch_size, method=method)
+            db.commit()
+            print(
+                f"{method:<12} batch={batch_size:<6} rows={result.rows:,} "
+                f"time={result.elapsed:.2f}s rows/s={result.rows_per_second:,.0f}"
+            )
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
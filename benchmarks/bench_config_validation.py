@@ -0,0 +1,75 @@
+"""
+Benchmark of ElixirDB construction time.
+
+Compares constructing instances from a configuration mapping, validated on
+every construction or once per process with `share_config`, and from a
+discovered configuration file, found, parsed and validated on every
+construction or taken from the process-wide cache (a copy per instance).
+
+    python benchmarks/bench_config_validation.py [iterations]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+import yaml
+from elixirdb import ElixirDB
+from elixirdb import clear_config_cache
+from elixirdb.utils.files import CONFIG_ENV_VAR
+
+
+ENGINE = {
+    "dialect": "postgres",
+    "url_params": {
+        "host": "localhost",
+        "port": 5432,
+        "database": "app",
+        "username": "user",
+        "password": "secret",
+    },
+    "engine_options": {"pool_size": 10, "pool_recycle": 3600},
+    "auto_connect": False,
+}
+
+CONFIG = {
+    "defaults": {"engine_options": {"pool_pre_ping": True}},
+    "engines": {f"region_{i}": {**ENGINE, "default": i == 0} for i in range(12)},
+}
+
+
+def report(name: str, function, iterations: int) -> None:
+    elapsed = timeit.timeit(function, number=iterations)
+    print(f"{name:<22} {elapsed / iterations * 1e6:,.1f} us/instance")
+
+
+def uncached_file() -> None:
+    clear_config_cache()
+    ElixirDB()
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    report("dict", lambda: ElixirDB(CONFIG), iterations)
+    report(
+        "dict, share_config",
+        lambda: ElixirDB(CONFIG, share_config=True),
+        iterations,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "elixir.yaml"
+        path.write_text(yaml.safe_dump(CONFIG))
+        os.environ[CONFIG_ENV_VAR] = str(path)
+
+        report("file, uncached", uncached_file, iterations)
+        clear_config_cache()
+        report("file, cached", ElixirDB, iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark of DateFormatter as a result handler on a list of dict rows.
+
+Compares formatting every cell recursively with the column-wise mode, which
+only formats the detected date columns.
+
+    python benchmarks/bench_date_formatter.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from elixirdb.handlers import DateFormatter
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "name": f"user {i}",
+            "email": f"user{i}@example.com",
+            "created": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "updated": f"{i % 12 + 1}/{i % 28 + 1}/2024",
+            "login": f"2024-01-{i % 28 + 1:02d} 12:{i % 60:02d}:00",
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+
+    for name, formatter in (
+        ("recursive", DateFormatter()),
+        ("columnwise", DateFormatter(columnwise=True)),
+    ):
+        elapsed = timeit.timeit(lambda f=formatter: f(rows), number=1)
+        print(f"{name:<11} {elapsed * 1e3:,.1f} ms for {count:,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Micro-benchmark for ElixirDB.__getattr__ dispatch.
+
+Measures calls/sec of ``db.execute(...)`` against an in-memory sqlite
+database with the dispatch cache in use, and with the cache cleared before
+every call (the previous behavior of building a new wrapper per access).
+
+    python benchmarks/bench_dispatch.py
+"""
+
+from __future__ import annotations
+
+import time
+from elixirdb import ElixirDB
+
+
+ITERATIONS = 50_000
+
+
+def run(db: ElixirDB, clear_cache: bool) -> float:
+    """Return calls/sec for ``db.execute("SELECT 1")``."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        if clear_cache:
+            db._dispatch_cache.clear()
+        db.execute("SELECT 1")
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite:///:memory:"})
+    # Warm up the engine and the statement cache.
+    run(db, clear_cache=False)
+
+    uncached = run(db, clear_cache=True)
+    cached = run(db, clear_cache=False)
+    print(f"uncached dispatch: {uncached:,.0f} calls/sec")
+    print(f"cached dispatch:   {cached:,.0f} calls/sec")
+    print(f"speedup:           {cached / uncached:.2f}x")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
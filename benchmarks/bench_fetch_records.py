@@ -0,0 +1,85 @@
+"""
+Benchmark of fetching read-only rows from SQLite.
+
+Compares ORM instances, RowMapping dicts (fetch_results) and __slots__
+records built from the raw cursor tuples (fetch_records), in time and in
+memory held by the fetched rows.
+
+    python benchmarks/bench_fetch_records.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+from elixirdb import ElixirDB
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    customer: Mapped[str]
+    quantity: Mapped[int]
+    total: Mapped[float]
+    note: Mapped[str | None]
+
+
+def measure(name: str, count: int, fetch: Callable[[], Any]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = fetch()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(rows) == count
+    print(
+        f"{name:<8} {elapsed:6.2f} s  {count / elapsed:10,.0f} rows/s  "
+        f"{memory / count:6.0f} bytes/row"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://"})
+    Base.metadata.create_all(db.connection)
+    db.connection.execute(
+        insert(Order),
+        [
+            {"customer": f"c{i}", "quantity": i % 10, "total": i * 1.5}
+            for i in range(count)
+        ],
+    )
+    query = "SELECT id, customer, quantity, total, note FROM orders"
+
+    with Session(db.connection) as session:
+        measure("orm", count, lambda: session.scalars(select(Order)).all())
+
+    def mappings() -> Any:
+        db.execute(query)
+        return db.fetch_results(0)
+
+    def records() -> Any:
+        db.execute(query)
+        return db.fetch_records()
+
+    measure("mappings", count, mappings)
+    measure("records", count, records)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
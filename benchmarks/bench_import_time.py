@@ -0,0 +1,46 @@
+"""
+Import time benchmark for elixirdb.
+
+Runs `python -X importtime -c "import elixirdb"` several times in fresh
+interpreters and reports the median cumulative import time of elixirdb and
+the slowest modules it imports.
+
+    python benchmarks/bench_import_time.py [runs]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+
+def import_times() -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import elixirdb"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    samples = [import_times() for _ in range(runs)]
+    total = statistics.median(sample["elixirdb"] for sample in samples)
+    print(f"import elixirdb: {total / 1000:,.1f} ms (median of {runs})")
+
+    slowest = sorted(samples[-1].items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in slowest[1:11]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
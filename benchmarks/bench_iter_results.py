@@ -0,0 +1,73 @@
+"""
+Memory benchmark for ElixirDB.iter_results against sqlite.
+
+Loads N rows into a temporary sqlite database and compares the peak
+Python memory (tracemalloc) of fetch_results(0) with iter_results().
+
+    python benchmarks/bench_iter_results.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from elixirdb import ElixirDB
+
+
+STATEMENT = "SELECT id, name, amount FROM rows"
+
+
+def populate(db: ElixirDB, rows: int) -> None:
+    db.execute(
+        "CREATE TABLE rows (id INTEGER PRIMARY KEY, name TEXT, amount REAL)"
+    )
+    batch = 50_000
+    for start in range(0, rows, batch):
+        db.execute(
+            "INSERT INTO rows (id, name, amount) VALUES (:id, :name, :amount)",
+            [
+                {"id": i, "name": f"name_{i}", "amount": i * 0.5}
+                for i in range(start, min(start + batch, rows))
+            ],
+        )
+    db.commit()
+
+
+def measure(label: str, func) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<16} rows={count:,} peak={peak / 2**20:,.1f} MiB "
+        f"time={elapsed:.2f}s"
+    )
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        db = ElixirDB(config={"dialect": "sqlite", "url": url})
+        populate(db, rows)
+
+        def fetch_all() -> int:
+            db.execute(STATEMENT)
+            return len(db.fetch_results(0))
+
+        def stream() -> int:
+            batches = db.iter_results(STATEMENT, batch_size=5000)
+            return sum(len(batch) for batch in batches)
+
+        measure("fetch_results", fetch_all)
+        measure("iter_results", stream)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
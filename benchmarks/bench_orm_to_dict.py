@@ -0,0 +1,87 @@
+"""
+Benchmark of converting ORM objects loaded from SQLite to dicts.
+
+Compares walking __table__.columns with a getattr per column for every
+object with the cached column keys and attrgetter per mapped class.
+
+    python benchmarks/bench_orm_to_dict.py [objects]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+from elixirdb.handlers import orm_result_to_list_of_dicts
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    customer: Mapped[str]
+    status: Mapped[str]
+    quantity: Mapped[int]
+    total: Mapped[float]
+    note: Mapped[str | None]
+
+
+def naive_to_dicts(objects: list[Any]) -> list[dict[str, Any]]:
+    """The previous implementation."""
+    return [
+        {c.key: getattr(obj, c.key) for c in obj.__table__.columns}
+        for obj in objects
+    ]
+
+
+def timed(name: str, count: int, func: Any) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<8} {elapsed:6.2f} s  {count / elapsed:12,.0f} objects/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Order),
+            [
+                {
+                    "customer": f"customer {i % 1000}",
+                    "status": "shipped",
+                    "quantity": i % 10,
+                    "total": i * 1.5,
+                    "note": None,
+                }
+                for i in range(count)
+            ],
+        )
+
+    with Session(engine) as session:
+        objects = session.scalars(select(Order)).all()
+        print(f"loaded {len(objects):,} objects")
+        timed("naive", count, lambda: naive_to_dicts(objects))
+        timed("cached", count, lambda: orm_result_to_list_of_dicts(objects))
+        timed(
+            "subset",
+            count,
+            lambda: orm_result_to_list_of_dicts(objects, columns=["id", "total"]),
+        )
+
+
+if __name__ == "__main__":
+    main()
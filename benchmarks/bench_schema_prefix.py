@@ -0,0 +1,98 @@
+"""
+Benchmark for apply_schema_prefix over large generated reporting queries.
+
+Compares the previous recursive walk (with a separate CTE pass) against the
+single-pass iterative walk in elixirdb.utils.db_utils. Parsing is excluded;
+each run rewrites fresh copies of pre-parsed ASTs.
+
+    python benchmarks/bench_schema_prefix.py
+"""
+
+from __future__ import annotations
+
+import time
+import sqlglot
+from sqlglot import exp
+from elixirdb.utils.db_utils import apply_schema_prefix
+from elixirdb.utils.db_utils import is_temp_table
+
+
+ROUNDS = 5
+
+
+def recursive_apply_schema_prefix(node, schema_prefix, cte_names, dialect):
+    """The previous recursive implementation, kept for comparison."""
+    if isinstance(node, exp.Table):
+        table_name = node.this.name.lower()
+        if table_name not in cte_names and not is_temp_table(table_name, dialect):
+            node.set("db", exp.Identifier(this=schema_prefix))
+
+    for child in node.args.values():
+        if isinstance(child, exp.Expression):
+            recursive_apply_schema_prefix(child, schema_prefix, cte_names, dialect)
+        elif isinstance(child, list):
+            for item in child:
+                if isinstance(item, exp.Expression):
+                    recursive_apply_schema_prefix(
+                        item, schema_prefix, cte_names, dialect
+                    )
+
+
+def recursive(ast):
+    cte_names = {cte.alias_or_name.lower() for cte in ast.find_all(exp.CTE)}
+    recursive_apply_schema_prefix(ast, "reporting", cte_names, "mysql")
+
+
+def iterative(ast):
+    apply_schema_prefix(ast, "reporting", dialect="mysql")
+
+
+def build_corpus() -> list[str]:
+    """Generate wide and deep reporting style queries."""
+    corpus = []
+    for width in (50, 200, 400):
+        ctes = ",\n".join(
+            f"cte_{i} AS (SELECT id, SUM(amount) AS total FROM sales_{i} "
+            f"JOIN region_{i} ON sales_{i}.region_id = region_{i}.id "
+            f"WHERE sales_{i}.id IN (SELECT id FROM audit_{i}) GROUP BY id)"
+            for i in range(width)
+        )
+        unions = "\nUNION ALL\n".join(
+            f"SELECT c.id, c.total FROM cte_{i} c JOIN customers cu ON cu.id = c.id"
+            for i in range(width)
+        )
+        corpus.append(f"WITH {ctes}\n{unions}")
+
+    for depth in (20, 60):
+        query = "SELECT id FROM base_table"
+        for i in range(depth):
+            query = f"SELECT id FROM ({query}) AS t{i} JOIN lookup_{i} ON 1 = 1"
+        corpus.append(query)
+    return corpus
+
+
+def run(func, asts) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        copies = [ast.copy() for ast in asts]
+        start = time.perf_counter()
+        for ast in copies:
+            func(ast)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    asts = [sqlglot.parse_one(query, read="mysql") for query in build_corpus()]
+    nodes = sum(1 for ast in asts for _ in ast.walk())
+    print(f"corpus: {len(asts)} queries, {nodes:,} nodes")
+
+    old = run(recursive, asts)
+    new = run(iterative, asts)
+    print(f"recursive + CTE pass: {old * 1000:.1f} ms")
+    print(f"iterative single pass: {new * 1000:.1f} ms")
+    print(f"speedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,75 @@
 # SPDX-FileCopyrightText: 2024-present Victor Nguyen <victor.win86@gmail.com>
 #
 # SPDX-License-Identifier: MIT
-# ruff: noqa: F401
+# ruff: noqa: F401, RUF067
 # flake8: noqa: E501
 # pyright: ignore[reportUnusedImport, W0404]
 # pylint: disable=W0404
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import Any
+from elixirdb.base import clear_config_cache
+from elixirdb.base import discover_config
 from elixirdb.db import ElixirDB
 from elixirdb.db import ElixirDBStatements
 from elixirdb.db import StatementsMixin
 from elixirdb.db import create_db
+from elixirdb.db import result_cache
 from elixirdb.exc import print_and_raise_validation_errors
+from elixirdb.metrics import query_metrics
 from elixirdb.models.engine import EngineModel
 from elixirdb.models.manager import EngineManager
 from elixirdb.models.options import EngineOptions
 from elixirdb.models.options import ExecutionOptions
 from elixirdb.models.options import SessionOptions
+from elixirdb.registry import EngineRegistry
+from elixirdb.registry import dispose_all
+from elixirdb.registry import engine_registry
+from elixirdb.slowlog import slow_query_log
 from elixirdb.utils.files import load_config
 from elixirdb.utils.files import scan_files
 
 
+if TYPE_CHECKING:
+    from elixirdb.async_db import AsyncElixirDB
+    from elixirdb.async_db import dispose_all_async
+
+
 __all__ = [
+    "AsyncElixirDB",
     "ElixirDB",
     "ElixirDBStatements",
     "EngineManager",
     "EngineModel",
     "EngineOptions",
+    "EngineRegistry",
     "ExecutionOptions",
     "SessionOptions",
     "StatementsMixin",
+    "clear_config_cache",
     "create_db",
+    "discover_config",
+    "dispose_all",
+    "dispose_all_async",
+    "engine_registry",
     "load_config",
     "print_and_raise_validation_errors",
+    "query_metrics",
+    "result_cache",
     "scan_files",
+    "slow_query_log",
 ]
+
+
+# The async API is imported on first access so that sync users do not load
+# sqlalchemy.ext.asyncio and greenlet.
+_ASYNC_EXPORTS = frozenset({"AsyncElixirDB", "dispose_all_async"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ASYNC_EXPORTS:
+        from elixirdb import async_db  # noqa: PLC0415
+
+        return getattr(async_db, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,426 @@
+"""
+Asyncio support built on :func:`sqlalchemy.ext.asyncio.create_async_engine`.
+
+"""
+
+# ruff: noqa: D102
+# pylint: disable=W0212,W0236
+# pyright: reportIncompatibleMethodOverride=false
+from __future__ import annotations
+
+import inspect
+import os
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
+from typing import Mapping
+from typing import Sequence
+from sqlalchemy import URL
+from sqlalchemy import Result
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from typing_extensions import Self
+from elixirdb.base import ConnectionBase
+from elixirdb.bulk import DEFAULT_BATCH_SIZE
+from elixirdb.bulk import bulk_insert
+from elixirdb.db import ElixirDB
+from elixirdb.enums import ConnectionState
+from elixirdb.enums import ExecutionState
+from elixirdb.exc import CursorResultError
+from elixirdb.exc import EngineKeyNotFoundError
+from elixirdb.exc import InvalidElixirConfigError
+from elixirdb.exc import InvalidEngineTypeError
+from elixirdb.exc import NoSessionFactoryError
+from elixirdb.exc import NotConnectedError
+from elixirdb.fanout import afan_out
+from elixirdb.metrics import statement_label
+from elixirdb.models.engine import async_driver_map
+from elixirdb.models.engine import driver_map
+from elixirdb.registry import EngineRegistry
+from elixirdb.registry import engine_options_of
+from elixirdb.registry import shares_engine
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Executable
+    from sqlalchemy import Table
+    from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.expression import TableClause
+    from elixirdb.bulk import BulkInsertMethod
+    from elixirdb.bulk import BulkInsertResult
+    from elixirdb.fanout import FanOutResult
+    from elixirdb.types import DatabaseEngineConfig
+    from elixirdb.types import EngineType
+    from elixirdb.types import RowData
+
+
+# The registry of async engines shared by AsyncElixirDB instances.
+async_engine_registry = EngineRegistry(factory=create_async_engine)
+
+
+async def dispose_all_async() -> None:
+    """Dispose and close all engines in the async engine registry."""
+    await async_engine_registry.dispose_all_async()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=async_engine_registry.after_fork)
+
+
+class AsyncElixirDB(ElixirDB):
+    """
+    Asyncio version of ElixirDB, created from the same EngineModel and
+    EngineManager configurations.
+
+    Supported engine types are `direct` (an AsyncConnection) and
+    `async_session` (an AsyncSession). Connections cannot be opened while
+    constructing the instance, so use `await db.connect()` or
+    `async with AsyncElixirDB(...) as db:`.
+
+    Coroutine methods of the connection/session (e.g. `execute`, `commit`)
+    are wrapped with the same parameter, result and error handlers as
+    ElixirDB. Results of `execute` are buffered, so fetch methods such as
+    `fetchall` and `fetch_results` remain synchronous.
+    """
+
+    engine_types: tuple[str, ...] = ("direct", "async_session")
+
+    def __init__(
+        self,
+        config: DatabaseEngineConfig | None = None,
+        engine_key: str | None = None,
+        engine_type: EngineType = "direct",
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        **kwargs,
+    ):
+        """
+        Create an async connection manager from a configuration.
+
+        Args:
+            config (DatabaseEngineConfig | None): The configuration used to
+                initialize the instance.
+            engine_key (str | None): Identifier for multi-db setups.
+            engine_type (EngineType): `direct` or `async_session`.
+            session_factory (async_sessionmaker | None): Pre-configured session
+                factory.
+            **kwargs: Additional connection parameters.
+
+        Raises:
+            InvalidEngineTypeError: If engine_type is not supported.
+        """
+        if engine_type not in self.engine_types:
+            raise InvalidEngineTypeError(
+                f"Invalid engine_type '{engine_type}' for {type(self).__name__}. "
+                f"Valid engine types are: {self.engine_types}"
+            )
+        ConnectionBase.__init__(
+            self, config=config, engine_key=engine_key, **kwargs
+        )
+
+        self.debug = self.db.debug
+        self.engine_type = engine_type
+        self.session_factory = session_factory
+
+    def __enter__(self) -> Self:
+        raise TypeError("Use 'async with' with AsyncElixirDB.")
+
+    async def __aenter__(self) -> Self:
+        """Connect and enter the async context manager."""
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Rollback on error and close the connection/session."""
+        if exc_type is not None and self.has_connection():
+            await self.rollback()
+        await self.close()
+
+    def _ensure_connection(self) -> None:
+        raise NotConnectedError(
+            "AsyncElixirDB is not connected. Use 'await db.connect()' or "
+            "'async with' before accessing the connection."
+        )
+
+    def _wrap_callable(self, name: str, attribute: Callable) -> Callable:
+        """Wrap coroutine functions so they are awaited in the handler pipeline."""
+        if not inspect.iscoroutinefunction(attribute):
+            return super()._wrap_callable(name, attribute)
+
+        @wraps(attribute)
+        async def wrapper(*args, **kwargs):
+            return await self._ainvoke(name, attribute, args, kwargs)
+
+        return wrapper
+
+    async def _ainvoke(
+        self, name: str, attribute: Callable, args: tuple, kwargs: dict
+    ) -> Any:
+        """
+        Await a wrapped coroutine and run it through the handlers. Executes
+        are timed like :meth:`ElixirDB._invoke_timed` when metrics or the slow
+        query log are enabled.
+        """
+        threshold = self.db.slow_query_threshold
+        timed = name == "execute" and (self.db.metrics or threshold is not None)
+        try:
+            start = perf_counter()
+            if name == "execute":
+                args, kwargs = self._process_execute_args_kwargs(*args, **kwargs)
+            if timed:
+                self.statevars.timings.clear()
+                self._statement_label = statement_label(kwargs.get("statement"))
+                self._record_timing("params", perf_counter() - start)
+                start = perf_counter()
+            self.result = result = await attribute(*args, **kwargs)
+            if not timed:
+                return self._process_result(result)
+            self._record_timing("execute", perf_counter() - start)
+            duration = self.statevars.timings["execute"]
+            self.statevars.orm_meta.query_time = duration
+            if threshold is not None and duration >= threshold:
+                self._record_slow_query(kwargs.get("statement"), kwargs, duration)
+            start = perf_counter()
+            result = self._process_result(result)
+            self._record_timing("handlers", perf_counter() - start)
+            return result
+        except Exception as e:  # pylint: disable=broad-except
+            return self._process_error(e)
+
+    @property
+    def url_string(self) -> str | URL:
+        """
+        The connection URL. URLs built from url_params with the default
+        driver of the dialect use the dialect's async driver instead.
+        """
+        url = super().url_string
+        if (
+            isinstance(url, URL)
+            and url.drivername == driver_map.get(self.db.dialect)
+            and self.db.dialect in async_driver_map
+        ):
+            url = url.set(drivername=async_driver_map[self.db.dialect])
+        return url
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Create or return the AsyncEngine for the configuration."""
+        if not self.current_engine:
+            if shares_engine(self.db, self.url_string):
+                self.current_engine = async_engine_registry.get_engine(
+                    self.db, self.url_string, self.engine_key
+                )
+            else:
+                self.current_engine = create_async_engine(
+                    self.url_string, **engine_options_of(self.db)
+                )
+        return self.current_engine
+
+    def create_session_factory(
+        self,
+        engine: AsyncEngine | None = None,
+        engine_type: EngineType | None = None,
+        scopefunc: Any | None = None,
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Create an async session factory.
+
+        See :class:`sqlalchemy.ext.asyncio.async_sessionmaker` for more details.
+
+        Raises:
+            InvalidEngineTypeError: If the engine type is `direct`.
+        """
+        engine = engine or self.engine
+        engine_type = engine_type or self.engine_type
+        if engine_type != "async_session":
+            raise InvalidEngineTypeError(
+                "Cannot create a session factory for direct connection mode."
+            )
+        options = (
+            self.db.session_options.model_dump(
+                exclude_none=True, exclude_unset=True
+            )
+            if self.db.session_options
+            else {}
+        )
+        return async_sessionmaker(bind=engine, **options)
+
+    async def connect(self) -> Self:
+        """Open, set, and return the connection."""
+        if self.has_connection():
+            return self
+
+        if self.engine_type == "direct":
+            self.connection = await self.engine.connect()
+        else:
+            if self.session_factory is None:
+                self.session_factory = self.create_session_factory()
+            self.session = self.session_factory()
+
+        self.statevars.state = ConnectionState.CONNECTED
+        return self
+
+    async def close(self) -> None:
+        """Close the connection/session and cleanup resources."""
+        self._dispatch_cache.clear()
+        try:
+            if self.connection is not None:
+                await self.connection.close()
+                self.connection = None
+            if self.session is not None:
+                await self.session.close()
+                self.session = None
+        except Exception as e:
+            raise ConnectionError(f"Failed to close connection: {e!s}") from e
+        self.statevars.state = ConnectionState.DISCONNECTED
+
+    def new_session(self) -> Self:
+        """
+        Return a new instance with its own AsyncSession, reusing the session
+        factory and configuration of this instance.
+
+        Raises:
+            InvalidEngineTypeError: If the engine type is not `async_session`.
+            NoSessionFactoryError: If session factory is not set.
+        """
+        if self.engine_type != "async_session":
+            raise InvalidEngineTypeError(
+                "new_session only works with `async_session` engine_type."
+            )
+        if not self.session_factory:
+            raise NoSessionFactoryError(
+                "A session was never created. Use connect() first."
+            )
+        instance = self._spawn()
+        instance.session = self.session_factory()
+        instance.statevars.state = ConnectionState.CONNECTED
+        return instance
+
+    async def set_engine(self, engine_key: str) -> None:
+        """
+        Switch to another engine of a multi-engine configuration.
+
+        See :meth:`ElixirDB.set_engine`.
+        """
+        if not self.config:
+            raise InvalidElixirConfigError(
+                "Cannot set engine when there is not configuration for "
+                "multiple engines found. Review the docs for setting up "
+                "multiple engines."
+            )
+        if engine_key not in self.config.engines:
+            raise EngineKeyNotFoundError(engine_key=engine_key)
+
+        await self.close()
+        self.engine_key = engine_key
+        self.db = self.config.engines[engine_key]
+        self.current_engine = None
+        self.session_factory = None
+        if self.db.auto_connect:
+            await self.connect()
+
+    async def iter_results(
+        self,
+        statement: Executable | str | None = None,
+        parameters: _CoreAnyExecuteParams | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowData]]:
+        """
+        Stream results in batches with a server side cursor.
+
+        Async version of :meth:`ElixirDB.iter_results`. A statement is run
+        with `stream()` on the connection/session; without a statement the
+        current (buffered) result is partitioned.
+        """
+        if statement is not None:
+            args, kwargs = self._process_execute_args_kwargs(
+                statement, parameters or {}
+            )
+            kwargs["execution_options"] = {"yield_per": batch_size}
+            direct = self.engine_type == "direct"
+            source = self.connection if direct else self.session
+            if source is None:
+                self._ensure_connection()
+            result = await source.stream(*args, **kwargs)
+            partitions = (
+                result.mappings() if self.db.result_to_dict else result
+            ).partitions(batch_size)
+            try:
+                async for batch in partitions:
+                    self.statevars.exc_state = ExecutionState.FETCH
+                    yield batch
+            finally:
+                await result.close()
+                self.statevars.exc_state = ExecutionState.IDLE
+            return
+
+        if not self.result or not isinstance(self.result, Result):
+            raise CursorResultError(
+                "The result object does not exist or is not a Result."
+            )
+        for batch in super().iter_results(batch_size=batch_size):
+            yield batch
+
+    async def bulk_insert(
+        self,
+        table: str | Table | TableClause,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Sequence[str] | None = None,
+        method: BulkInsertMethod = "auto",
+    ) -> BulkInsertResult:
+        """
+        Insert rows in batches of batch_size.
+
+        Async version of :meth:`ElixirDB.bulk_insert`. The batches are written
+        through `run_sync` on the connection, so rows must be a regular (not
+        async) iterable.
+        """
+        if not self.has_connection():
+            self._ensure_connection()
+        connection = (
+            self.connection
+            if self.engine_type == "direct"
+            else await self.session.connection()
+        )
+        try:
+            result = await connection.run_sync(
+                bulk_insert,
+                table,
+                rows,
+                batch_size=batch_size,
+                columns=columns,
+                method=method,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            return self._process_error(e)
+        self.statevars.rowcount = result.rows
+        return result
+
+    async def fan_out(
+        self,
+        statement: Executable | str,
+        parameters: _CoreAnyExecuteParams | None = None,
+        engine_keys: Sequence[str] | None = None,
+        max_workers: int | None = None,
+        commit: bool = False,
+    ) -> FanOutResult:
+        """
+        Execute a statement concurrently on several engines of the
+        EngineManager configuration.
+
+        Async version of :meth:`ElixirDB.fan_out`: each engine runs on its
+        own connection, with at most max_workers engines queried at once.
+        """
+        return await afan_out(
+            self,
+            statement,
+            parameters,
+            engine_keys=engine_keys,
+            max_workers=max_workers,
+            commit=commit,
+        )
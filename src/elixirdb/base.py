@@ -9,12 +9,22 @@ Database base configuration classes.
 # pyright: reportAttributeAccessIssue=false, reportArgumentType=false, reportUnknownVariableType=false
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import warnings
+from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
+from time import perf_counter
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import ClassVar
+from typing import get_args
+from typing import get_origin
+from pydantic import BaseModel
 from pydantic import ValidationError
 from sqlalchemy import URL
 from sqlalchemy import Connection
@@ -29,15 +39,21 @@ from elixirdb.exc import ElixirFileNotFoundError
 from elixirdb.exc import EngineKeyNotDefinedError
 from elixirdb.exc import EngineKeyNotFoundError
 from elixirdb.exc import print_and_raise_validation_errors
+from elixirdb.metrics import LatencyHistogram
 from elixirdb.models.engine import EngineModel
 from elixirdb.models.manager import EngineManager
-from elixirdb.utils.files import load_config
+from elixirdb.routing import get_router
+from elixirdb.utils.cache import LRUCache
+from elixirdb.utils.files import CONFIG_ENV_VAR
+from elixirdb.utils.files import find_config_file
+from elixirdb.utils.files import read_config_file
 
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import scoped_session
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.orm.session import Session
+    from elixirdb.routing import ReplicaRouter
     from elixirdb.types import DatabaseEngineConfig
     from elixirdb.types import EngineType
     from elixirdb.types import ErrorHandlerProtocol
@@ -79,6 +95,120 @@ class CursorResultMetadata:
     execution_context: str | None = None
 
 
+def _memoized(method: Callable[[Any], Any]) -> property:
+    """A property computed once and stored in the instance's _values."""
+    name = method.__name__
+
+    def getter(self: Any) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = method(self)
+            return value
+
+    getter.__doc__ = method.__doc__
+    return property(getter)
+
+
+class LazyCursorResultMetadata:
+    """
+    CursorResultMetadata computed on first access.
+
+    Debug mode creates one per CursorResult, so construction only saves the
+    result, its execution context and the DBAPI cursor description (the
+    cursor is released once the rows are consumed). Every field is computed
+    from them when first read and then cached. The saved result is released
+    when the next statement replaces statevars.cursor_meta.
+    """
+
+    __slots__ = ("_context", "_description", "_result", "_values", "is_closed")
+
+    def __init__(self, result: CursorResult) -> None:
+        self._result = result
+        self._context = result.context
+        cursor = result.cursor
+        self._description = cursor.description if cursor is not None else None
+        self.is_closed: bool | None = result.closed
+        self._values: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return repr(self.materialize()).replace(
+            "CursorResultMetadata", type(self).__name__, 1
+        )
+
+    def materialize(self) -> CursorResultMetadata:
+        """Compute every field and return them as a CursorResultMetadata."""
+        return CursorResultMetadata(
+            columns=self.columns,
+            rows_affected=self.rows_affected,
+            last_insert_id=self.last_insert_id,
+            last_insert_rowid=self.last_insert_rowid,
+            last_insert_rowid_str=self.last_insert_rowid_str,
+            pre_format_parameters=self.pre_format_parameters,
+            parameters=self.parameters,
+            pre_format_sql_query=self.pre_format_sql_query,
+            sql_query=self.sql_query,
+            column_descriptions=self.column_descriptions,
+            generated_keys=self.generated_keys,
+            is_closed=self.is_closed,
+            execution_context=self.execution_context,
+        )
+
+    pre_format_parameters = None
+    pre_format_sql_query = None
+
+    @_memoized
+    def columns(self) -> list[str] | None:
+        return list(self._result.keys())
+
+    @_memoized
+    def rows_affected(self) -> int | None:
+        return self._result.rowcount
+
+    @_memoized
+    def last_insert_id(self) -> Any | None:
+        try:
+            return self._result.lastrowid
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    @property
+    def last_insert_rowid(self) -> Any | None:
+        return self.last_insert_id
+
+    @_memoized
+    def last_insert_rowid_str(self) -> str | None:
+        return str(self.last_insert_id)
+
+    @_memoized
+    def parameters(self) -> dict[str, Any] | list[Any] | None:
+        return getattr(self._context, "compiled_parameters", None)
+
+    @_memoized
+    def sql_query(self) -> str | None:
+        statement = getattr(self._context, "statement", None)
+        return None if statement is None else str(statement)
+
+    @_memoized
+    def column_descriptions(self) -> list[dict[str, Any]]:
+        return [
+            {"name": column[0], "type": column[1]}
+            for column in self._description or ()
+        ]
+
+    @_memoized
+    def generated_keys(self) -> list[Any] | None:
+        try:
+            return self._result.inserted_primary_key
+        except Exception:  # pylint: disable=broad-except
+            # Only available for single row INSERT statements.
+            return None
+
+    @_memoized
+    def execution_context(self) -> str | None:
+        return str(self._context)
+
+
 @dataclass(slots=True)
 class StateVars(CursorResultMetadata):
     """State variables for tracking database execution state"""
@@ -93,8 +223,146 @@ class StateVars(CursorResultMetadata):
     offset: int = 0
     rowcount: int = 0
     results: list = field(default_factory=list)
-    cursor_meta: CursorResultMetadata = field(default_factory=CursorResultMetadata)
+    cursor_meta: CursorResultMetadata | LazyCursorResultMetadata = field(
+        default_factory=CursorResultMetadata
+    )
     orm_meta: ORMResultMetadata = field(default_factory=ORMResultMetadata)
+    # Seconds spent in each phase of the last timed statement, when metrics
+    # are enabled. See :mod:`elixirdb.metrics`
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ResultTypeCache:
+    """
+    Frozen view of ConnectionConfig.result_types with a per-class decision
+    cache, so checking if a result should be handled is O(1) per class.
+    """
+
+    # A snapshot of the result_types list the cache was built from.
+    source: tuple[Any, ...] | None = None
+    # The result types as a tuple, ready for isinstance checks.
+    types: tuple[type, ...] = ()
+    # isinstance decisions, keyed by the class of the checked object.
+    decisions: dict[type, bool] = field(default_factory=dict)
+
+    def is_stale(self, result_types: list[Any]) -> bool:
+        """
+        Check if the cache no longer reflects the result_types list, which
+        may have been reassigned or mutated in place.
+        """
+        return self.source != tuple(result_types)
+
+    def rebuild(self, result_types: list[Any]) -> None:
+        """Freeze the result types and reset the decision cache."""
+        # Subscripted generics (e.g. CursorResult[Any]) cannot be used with
+        # isinstance, so check against their origin class.
+        self.source = tuple(result_types)
+        self.types = tuple(get_origin(t) or t for t in result_types)
+        self.decisions = {}
+
+    def matches(self, obj: Any) -> bool:
+        """Return True if obj is an instance of one of the result types."""
+        cls = type(obj)
+        decision = self.decisions.get(cls)
+        if decision is None:
+            decision = self.decisions[cls] = isinstance(obj, self.types)
+        return decision
+
+
+# Handler stages whose handlers are chained, each receiving the output of the
+# previous one. Parameter handlers each receive the parameters and return the
+# statement and the parameters, and error handlers are each called with the
+# error.
+_CHAINED_STAGES = frozenset({"parameter_handlers", "result_handlers"})
+
+
+def _handler_chain(handlers: Any) -> tuple[Any, ...]:
+    """Snapshot the handlers (list or single callable) of a stage."""
+    if isinstance(handlers, list):
+        return tuple(handlers)
+    return (handlers,) if handlers else ()
+
+
+def _handler_name(handler: Any) -> str:
+    """Name a handler for timings."""
+    return getattr(handler, "__qualname__", None) or type(handler).__qualname__
+
+
+@dataclass(slots=True)
+class HandlerPipeline:
+    """
+    The handlers of a stage compiled into a single callable.
+
+    Rebuilt when the handlers of the stage change (reassigned or mutated in
+    place), or when handler timing is toggled.
+    """
+
+    stage: str
+    # A snapshot of the handlers (list or single callable) the pipeline was
+    # built from.
+    source: tuple[Any, ...] | None = None
+    timed: bool = False
+    call: Callable[[Any], Any] | None = None
+    # Per-handler latency histograms, keyed by "<position>:<handler name>".
+    timings: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def is_stale(self, handlers: Any, timed: bool) -> bool:
+        """Check if the pipeline no longer reflects the handlers."""
+        return self.timed != timed or self.source != _handler_chain(handlers)
+
+    def rebuild(self, handlers: Any, timed: bool) -> None:
+        """Compile the handlers into a single callable."""
+        chain = self.source = _handler_chain(handlers)
+        self.timed = timed
+        if not chain:
+            self.call = None
+            return
+        if timed:
+            self.timings = {}
+            chain = tuple(
+                self._timed(handler, f"{i}:{_handler_name(handler)}")
+                for i, handler in enumerate(chain)
+            )
+        self.call = self._compose(chain)
+
+    def _timed(self, handler: Callable, name: str) -> Callable[[Any], Any]:
+        histogram = self.timings.setdefault(name, LatencyHistogram())
+
+        def timed_handler(data: Any) -> Any:
+            start = perf_counter()
+            try:
+                return handler(data)
+            finally:
+                histogram.record(perf_counter() - start)
+
+        return timed_handler
+
+    def _compose(self, chain: tuple[Callable, ...]) -> Callable[[Any], Any]:
+        if self.stage not in _CHAINED_STAGES:
+
+            def broadcast(error: Any) -> None:
+                for handler in chain:
+                    handler(error)
+
+            return broadcast
+        if len(chain) == 1:
+            return chain[0]
+        if self.stage == "parameter_handlers":
+
+            def parameters(params: Any) -> tuple[Any, Any]:
+                for handler in chain:
+                    statement, params = handler(params)
+                return statement, params
+
+            return parameters
+
+        def chained(data: Any) -> Any:
+            for handler in chain:
+                data = handler(data)
+            return data
+
+        return chained
 
 
 @dataclass(slots=True)
@@ -125,6 +393,13 @@ class ConnectionConfig:
     # with :class:`sqlalchemy.create_engine`
     current_engine: Engine | None = None
 
+    # Selects the replica for read statements when the engine_key is the
+    # name of a route in EngineManager.routes.
+    router: ReplicaRouter | None = None
+
+    # Connections/sessions opened on replica engines, keyed by engine_key.
+    _replicas: dict[str, Any] = field(default_factory=dict)
+
     # The result types that result_handlers will process.
     # e.g. [Result, SqlAlchemyResult, SqlAlchemyRow, SqlAlchemyRowProxy]
     # All handlers in result_handlers will process the output of any
@@ -138,6 +413,14 @@ class ConnectionConfig:
     # as Query, QueryResult, etc.
     result_types: list[Any] = field(default_factory=list)
 
+    # When set, list results are checked against result_types by sampling
+    # this many items (plus the last item) instead of scanning every item.
+    result_type_sample_size: int | None = None
+
+    # Frozen result_types and cached isinstance decisions per class. Rebuilt
+    # when result_types is reassigned or mutated.
+    _result_type_cache: ResultTypeCache = field(default_factory=ResultTypeCache)
+
     # The database connection created using a `direct` engine_type.
     connection: Connection | None = field(default=None)
 
@@ -156,6 +439,20 @@ class ConnectionConfig:
     # State tracking variables. Mainly used for debugging
     statevars: StateVars = field(default_factory=StateVars)
 
+    # Wrapped callables built by ElixirDB.__getattr__, keyed by attribute name
+    # and stored with the result/connection/session object they are bound to.
+    _dispatch_cache: dict[str, tuple[Any, Callable[..., Any]]] = field(
+        default_factory=dict
+    )
+
+    # Tables written by uncommitted statements while the result cache is
+    # enabled. None when the transaction has no writes.
+    _write_tables: set[str] | None = None
+
+    # Normalized label of the last executed statement, used to key timings
+    # when metrics are enabled.
+    _statement_label: str = ""
+
     # A custom handler to control the execution process for statements
     # such as raw SQL, Stored Procedures, etc.
     execution_handler: ExecutionProtocol | None = field(default=None)
@@ -179,6 +476,13 @@ class ConnectionConfig:
     # Future version may convert this to a dictionary mapping of :type:, Callable | list[Callable]
     result_handlers: list[ResultHandlerCallable] = field(default_factory=list)
 
+    # Record the latency of each handler. See ConnectionBase.handler_timings
+    time_handlers: bool = False
+
+    # The handlers of each stage compiled into a single callable, keyed by
+    # handler name (e.g. result_handlers).
+    _handler_pipelines: dict[str, HandlerPipeline] = field(default_factory=dict)
+
     def __post_init__(self) -> None:
         """Add in result types"""
 
@@ -216,6 +520,189 @@ class ConnectionConfig:
         return ""
 
 
+def _is_container(annotation: Any) -> bool:
+    """Check if a field annotation may hold a model, dict or list."""
+    if get_origin(annotation) in (dict, list):
+        return True
+    if isinstance(annotation, type) and issubclass(
+        annotation, (BaseModel, dict, list)
+    ):
+        return True
+    return any(_is_container(arg) for arg in get_args(annotation))
+
+
+# Sets the attributes of a model copy without going through validation.
+_object_setattr = object.__setattr__
+
+
+@lru_cache(maxsize=None)
+def _container_fields(cls: type[BaseModel]) -> tuple[str, ...]:
+    """Return the names of the fields of a model that may hold containers."""
+    return tuple(
+        name
+        for name, info in cls.model_fields.items()
+        if _is_container(info.annotation)
+    )
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return copy_model(value)
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def copy_model(model: BaseModel) -> BaseModel:
+    """
+    Copy a validated configuration model, including its nested models, dicts
+    and lists, so the copy can be changed without affecting the original.
+    Only the fields that can hold containers are visited, which makes this
+    several times faster than model_copy(deep=True).
+    """
+    cls = type(model)
+    values = model.__dict__.copy()
+    for name in _container_fields(cls):
+        values[name] = _copy_value(values[name])
+    copy = cls.__new__(cls)
+    _object_setattr(copy, "__dict__", values)
+    _object_setattr(
+        copy, "__pydantic_fields_set__", set(model.__pydantic_fields_set__)
+    )
+    _object_setattr(copy, "__pydantic_extra__", model.__pydantic_extra__)
+    private = model.__pydantic_private__
+    if private is not None:
+        # Copies of shared (frozen) models can be changed.
+        private = {**private, "_frozen": False}
+    _object_setattr(copy, "__pydantic_private__", private)
+    return copy
+
+
+def freeze_model(model: BaseModel) -> BaseModel:
+    """
+    Freeze a validated configuration model and its nested models, so setting
+    one of their fields raises a TypeError. Dicts and lists held by the
+    models are not frozen and must not be changed.
+    """
+    private = model.__pydantic_private__
+    if private is not None and "_frozen" in private:
+        private["_frozen"] = True
+    for name in _container_fields(type(model)):
+        _freeze_value(model.__dict__[name])
+    return model
+
+
+def _freeze_value(value: Any) -> None:
+    if isinstance(value, BaseModel):
+        freeze_model(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze_value(item)
+    elif isinstance(value, list):
+        for item in value:
+            _freeze_value(item)
+
+
+def validate_config(config: dict[str, Any]) -> EngineManager | EngineModel:
+    """
+    Validate a configuration mapping as an EngineManager if it has `engines`,
+    otherwise as an EngineModel.
+    """
+    # Coerce it to a regular dict if it is a TypedDict
+    config = dict(config)
+    try:
+        if config.get("engines"):
+            return EngineManager(**config)
+        # If the config does not have `engines` as a key,
+        # assume it is a single Engine configuration. If it is not
+        # an EngineModel, it will fail validation.
+        return EngineModel(**config)
+    except ValidationError as e:
+        print_and_raise_validation_errors(e)
+        raise
+
+
+# Frozen validated configurations shared by instances created with
+# share_config, keyed by a hash of the configuration mapping.
+_SHARED_CONFIGS: LRUCache[str, EngineManager | EngineModel] = LRUCache(maxsize=128)
+
+
+def config_hash(config: dict[str, Any]) -> str | None:
+    """
+    Return a hash of the content of a configuration mapping, or None if it
+    holds values that are not JSON serializable (e.g. a `creator` callable).
+    """
+    try:
+        payload = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def shared_config(config: dict[str, Any]) -> EngineManager | EngineModel:
+    """
+    Validate a configuration mapping once per process and return the frozen
+    model, shared by every caller with an identical mapping.
+
+    The model cannot be changed (see :func:`freeze_model`); use
+    :func:`copy_model` to get a copy that can. Mappings that are not JSON
+    serializable are validated on every call.
+    """
+    config = dict(config)
+    key = config_hash(config)
+    model = _SHARED_CONFIGS.get(key) if key is not None else None
+    if model is None:
+        # Validation merges the defaults into the engines of the mapping, which
+        # would change its hash.
+        if key is not None:
+            config = deepcopy(config)
+        model = freeze_model(validate_config(config))  # type: ignore[assignment]
+        if key is not None:
+            _SHARED_CONFIGS.set(key, model)  # type: ignore[arg-type]
+    elif isinstance(model, EngineManager):
+        # Validation sets the class level default engine key, which another
+        # configuration may have changed since.
+        for engine_key, engine in model.engines.items():
+            if engine.default:
+                EngineManager.set_default_engine_key(engine_key)
+    return model  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=8)
+def _discover_config(env_path: str | None) -> EngineManager | EngineModel | None:
+    # Keyed by the environment variable so changing it finds a new file.
+    path = find_config_file()
+    return validate_config(read_config_file(path)) if path else None
+
+
+def discover_config() -> EngineManager | EngineModel | None:
+    """
+    Find, parse and validate the project configuration file.
+
+    See :func:`elixirdb.utils.files.find_config_file` for the resolution
+    order. The validated configuration is cached for the process and each
+    call returns a copy of it; use :func:`clear_config_cache` after changing
+    the file.
+    """
+    config = _discover_config(os.environ.get(CONFIG_ENV_VAR))
+    return copy_model(config) if config else None  # type: ignore[return-value]
+
+
+def clear_config_cache() -> None:
+    """Forget the configuration found by :func:`discover_config`."""
+    _discover_config.cache_clear()
+
+
+def resolve_route(
+    config: EngineManager, name: str
+) -> tuple[str, ReplicaRouter | None]:
+    """Return the primary engine_key and the replica router of a route."""
+    route = config.routes[name]  # type: ignore[index]
+    return route.primary, get_router(route)
+
+
 class ConnectionBase(ConnectionConfig):
     """
     A base class that provides the base database attributes and initializes
@@ -227,6 +714,7 @@ class ConnectionBase(ConnectionConfig):
         config: DatabaseEngineConfig | None = None,
         engine_key: str | None = None,
         handlers: HandlerMapping | None = None,
+        share_config: bool = False,
         **kwargs,
     ) -> None:
         """
@@ -237,6 +725,10 @@ class ConnectionBase(ConnectionConfig):
         within the project. Assign handlers and select the active engine
         configuration to be used if the configuration has multiple engines.
 
+        With share_config, a configuration mapping is validated once per
+        process and its frozen model is shared by every instance created
+        from an identical mapping (see :func:`shared_config`).
+
         Raises:
             ConfigNotFoundError: If no configuration is found, or a 'engine_key'
                 key was provided, but no configuration matched that key.
@@ -244,7 +736,9 @@ class ConnectionBase(ConnectionConfig):
 
         # If a configuration is not provided, attempt to find it. The yaml
         # file must be prefixed with elixir. (e.g. myelixirdb.yaml, myelixirdb.yml)
-        config = config or load_config()
+        # The validated configuration is cached, so only the first instance
+        # searches for and parses the file.
+        config = config or discover_config()
         if not config:
             raise ElixirFileNotFoundError(
                 "There were no configurations found "
@@ -253,24 +747,17 @@ class ConnectionBase(ConnectionConfig):
 
         # If the provided configuration is a dictionary, then validate it.
         if isinstance(config, dict):
-            # Coerce it to a regular dict if it is a TypedDict
-            config = dict(config)
-            try:
-                if config.get("engines"):
-                    config = EngineManager(**config)
-                else:
-                    # If the config does not have `engines` as a key,
-                    # assume it is a single Engine configuration. If it is not
-                    # an EngineModel, it will fail validation.
-                    config = EngineModel(**config)
-            except ValidationError as e:
-                print_and_raise_validation_errors(e)
+            config = (
+                shared_config(config) if share_config else validate_config(config)
+            )
 
         # The config should be a pydantic model at this point.
         if isinstance(config, EngineManager):
             # Set self.config, but only if it is not already set.
             self.config = config if not self.config else self.config
             engine_key = engine_key or config.default_engine_key or None
+            if config.routes and engine_key in config.routes:
+                engine_key, kwargs["router"] = resolve_route(config, engine_key)
             if engine_key:
                 db_config = config.engines.get(engine_key)
                 if not db_config:
@@ -359,6 +846,41 @@ class ConnectionBase(ConnectionConfig):
                 # should be set directly and not as a list.
                 setattr(self, handler_name, _handler)
 
+        for handler_name in handlers:
+            self.compiled_handlers(handler_name)
+
+    def compiled_handlers(self, handler_name: str) -> Callable[[Any], Any] | None:
+        """
+        Return the handlers of a stage compiled into a single callable, or
+        None if the stage has no handlers.
+
+        Parameter and result handlers are chained, error handlers are each
+        called with the error. The callable is rebuilt only when the handlers
+        change (e.g. set_handlers, or appending to or replacing an item of
+        result_handlers), or when time_handlers is toggled.
+        """
+        pipeline = self._handler_pipelines.get(handler_name)
+        if pipeline is None:
+            pipeline = self._handler_pipelines[handler_name] = HandlerPipeline(
+                handler_name
+            )
+        handlers = getattr(self, handler_name)
+        if pipeline.is_stale(handlers, self.time_handlers):
+            pipeline.rebuild(handlers, self.time_handlers)
+        return pipeline.call
+
+    def handler_timings(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return the latency stats (count, sum, min, max, p50, p95, p99 in
+        seconds) of each handler, keyed by handler name and
+        "<position>:<handler name>". Requires time_handlers.
+        """
+        return {
+            stage: {name: h.to_dict() for name, h in pipeline.timings.items()}
+            for stage, pipeline in self._handler_pipelines.items()
+            if pipeline.timings
+        }
+
     def add_result_type(self, result_type: Any) -> None:
         """
         Add a new result type to the result types that are checked when
@@ -393,3 +915,35 @@ class ConnectionBase(ConnectionConfig):
             return
 
         self.result_types.append(result_type)
+        self._result_type_cache.rebuild(self.result_types)
+
+    def is_result_type(self, result: Any) -> bool:
+        """
+        Check if result_handlers should process the result.
+
+        A result qualifies if it is an instance of one of the result_types, or
+        if it is a list where the items are. Lists are fully scanned unless
+        result_type_sample_size is set, in which case only the first
+        result_type_sample_size items and the last item are checked.
+
+        Args:
+            result: The result returned from the database execution.
+
+        Returns:
+            bool: True if the result should be processed by result handlers.
+        """
+        cache = self._result_type_cache
+        if cache.is_stale(self.result_types):
+            cache.rebuild(self.result_types)
+
+        if cache.matches(result):
+            return True
+        if not isinstance(result, list):
+            return False
+
+        sample_size = self.result_type_sample_size
+        if sample_size is not None and len(result) > sample_size:
+            items = [*result[:sample_size], result[-1]]
+        else:
+            items = result
+        return all(cache.matches(item) for item in items)
@@ -0,0 +1,268 @@
+"""
+Bulk inserts of large or streamed row sets.
+
+Rows are pulled from any iterable in batches, so generators are never
+materialized, and each batch is written with executemany, multi-row
+INSERT ... VALUES statements or (opt-in) PostgreSQL COPY.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from dataclasses import dataclass
+from itertools import chain
+from itertools import islice
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Literal
+from typing import Mapping
+from typing import Sequence
+from sqlalchemy import Table
+from sqlalchemy import column
+from sqlalchemy import insert
+from sqlalchemy import table as table_clause
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.sql.expression import TableClause
+
+
+BulkInsertMethod = Literal["auto", "executemany", "values", "copy"]
+
+DEFAULT_BATCH_SIZE = 1000
+
+# DBAPI drivers with a COPY FROM STDIN api on their cursors.
+COPY_DRIVERS = frozenset({"psycopg2", "psycopg"})
+
+# Maximum number of bind parameters in one statement, by dialect. SQL Server
+# allows 2100 but one is used by sp_executesql for the statement itself.
+BIND_PARAMETER_LIMITS = {
+    "mssql": 2099,
+    "postgresql": 65535,
+    "mysql": 65535,
+    "mariadb": 65535,
+    "oracle": 65535,
+}
+
+
+@dataclass(slots=True)
+class BulkInsertResult:
+    """Statistics of a bulk insert."""
+
+    method: str
+    rows: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def batched(rows: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to batch_size items without materializing rows."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be greater than 0.")
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def resolve_method(connection: Connection, method: BulkInsertMethod) -> str:
+    """
+    Pick the insert method for a connection.
+
+    `auto` uses `executemany`, which SQLAlchemy batches into multi-row INSERT
+    statements (insertmanyvalues) for dialects that support it. COPY is
+    opt-in: it bypasses the bind parameter processing of column types, so
+    it is only chosen when requested.
+    """
+    dialect = connection.dialect
+    copy_supported = dialect.name == "postgresql" and dialect.driver in COPY_DRIVERS
+    if method == "auto":
+        return "executemany"
+    if method == "copy" and not copy_supported:
+        raise ValueError(
+            "COPY is only supported by PostgreSQL with the psycopg2 or psycopg "
+            f"drivers, not {dialect.name}+{dialect.driver}."
+        )
+    if method not in ("executemany", "values", "copy"):
+        raise ValueError(
+            f"Invalid bulk insert method '{method}'. Valid methods are: "
+            "auto, executemany, values, copy"
+        )
+    return method
+
+
+def _table_clause(
+    table: str | Table | TableClause, columns: Sequence[str]
+) -> Table | TableClause:
+    """Build a lightweight table clause for a (optionally schema qualified) name."""
+    if not isinstance(table, str):
+        return table
+    schema, _, name = table.rpartition(".")
+    return table_clause(name, *(column(c) for c in columns), schema=schema or None)
+
+
+def bind_parameter_limit(connection: Connection) -> int | None:
+    """
+    Return the maximum number of bind parameters in one statement for the
+    dialect of a connection, or None if it is not known.
+    """
+    dialect = connection.dialect
+    if dialect.name == "sqlite":
+        version = getattr(dialect.dbapi, "sqlite_version_info", (3, 32, 0))
+        return 32766 if version >= (3, 32, 0) else 999
+    return BIND_PARAMETER_LIMITS.get(dialect.name)
+
+
+def _array_element(value: Any) -> str:
+    """Format an element of a PostgreSQL array literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return _array_literal(value)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float)):
+        return str(value)
+    text = _copy_text(value)
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _array_literal(values: Sequence[Any]) -> str:
+    """Format a list as a PostgreSQL array literal, e.g. `{1,"a",NULL}`."""
+    return "{" + ",".join(map(_array_element, values)) + "}"
+
+
+def _copy_text(value: Any) -> str:
+    """
+    Format a value as PostgreSQL text input: dicts as JSON, lists and tuples
+    as arrays, bytes in the bytea hex format and bools as t/f.
+    """
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return _array_literal(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    return str(value)
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value for the text format of COPY FROM STDIN."""
+    if value is None:
+        return "\\N"
+    return (
+        _copy_text(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_payload(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    """Build the tab separated COPY FROM STDIN payload for rows of values."""
+    buffer = io.StringIO()
+    buffer.writelines(
+        "\t".join(map(_copy_value, row)) + "\n" for row in rows
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_batch(
+    connection: Connection,
+    target: Table | TableClause,
+    columns: Sequence[str],
+    rows: list[Sequence[Any]],
+) -> None:
+    """Write a batch with COPY through the raw DBAPI connection."""
+    preparer = connection.dialect.identifier_preparer
+    name = preparer.format_table(target)  # type: ignore[arg-type]
+    column_list = ", ".join(preparer.quote(c) for c in columns)
+    sql = f"COPY {name} ({column_list}) FROM STDIN"
+
+    cursor = connection.connection.cursor()
+    try:
+        if connection.dialect.driver == "psycopg2":
+            cursor.copy_expert(sql, copy_payload(rows))
+        else:
+            with cursor.copy(sql) as copy:  # type: ignore[attr-defined]
+                for row in rows:
+                    # psycopg adapts lists and bytes itself, but not dicts.
+                    copy.write_row(
+                        [json.dumps(v) if isinstance(v, dict) else v for v in row]
+                    )
+    finally:
+        cursor.close()
+
+
+def bulk_insert(
+    connection: Connection,
+    table: str | Table | TableClause,
+    rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: Sequence[str] | None = None,
+    method: BulkInsertMethod = "auto",
+) -> BulkInsertResult:
+    """
+    Insert rows in batches.
+
+    See :meth:`elixirdb.db.ElixirDB.bulk_insert`.
+    """
+    method = resolve_method(connection, method)  # type: ignore[assignment]
+    result = BulkInsertResult(method=method)
+    start = perf_counter()
+
+    batches = batched(rows, batch_size)
+    first = next(batches, None)
+    if first is None:
+        return result
+
+    is_mapping = isinstance(first[0], Mapping)
+    if columns is None:
+        if not is_mapping:
+            raise ValueError("columns are required when rows are sequences.")
+        columns = list(first[0].keys())
+    target = _table_clause(table, columns)
+    statement = insert(target)
+
+    # Rows per INSERT ... VALUES statement within the bind parameter limit.
+    limit = bind_parameter_limit(connection) if method == "values" else None
+    statement_rows = max(1, limit // len(columns)) if limit else batch_size
+
+    for batch in chain((first,), batches):
+        if method == "copy":
+            values = (
+                [[row[c] for c in columns] for row in batch]
+                if is_mapping
+                else batch
+            )
+            _copy_batch(connection, target, columns, values)
+        else:
+            params = (
+                batch
+                if is_mapping
+                else [dict(zip(columns, row, strict=False)) for row in batch]
+            )
+            if method == "values":
+                for start_row in range(0, len(params), statement_rows):
+                    rows_params = params[start_row : start_row + statement_rows]
+                    connection.execute(statement.values(rows_params))
+            else:
+                connection.execute(statement, params)
+        result.rows += len(batch)
+        result.batches += 1
+
+    result.elapsed = perf_counter() - start
+    return result
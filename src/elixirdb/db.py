@@ -10,21 +10,34 @@ Database connection and configuration management.
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
+from functools import partial
 from functools import wraps
+from time import perf_counter
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
+from typing import Mapping
 from typing import Sequence
+from sqlalchemy import URL
 from sqlalchemy import CursorResult
 from sqlalchemy import Executable
+from sqlalchemy import Result
 from sqlalchemy import create_engine
 from sqlalchemy import text
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.elements import TextClause
 from typing_extensions import Self
 from elixirdb.base import ConnectionBase
-from elixirdb.base import CursorResultMetadata
+from elixirdb.base import ConnectionConfig
+from elixirdb.base import LazyCursorResultMetadata
+from elixirdb.base import resolve_route
+from elixirdb.bulk import DEFAULT_BATCH_SIZE
+from elixirdb.bulk import bulk_insert
 from elixirdb.enums import ConnectionState
 from elixirdb.enums import ExecutionState
 from elixirdb.exc import CursorResultError
@@ -32,20 +45,138 @@ from elixirdb.exc import EngineKeyNotFoundError
 from elixirdb.exc import InvalidElixirConfigError
 from elixirdb.exc import InvalidEngineTypeError
 from elixirdb.exc import NoSessionFactoryError
-from elixirdb.handlers import handler as h_
+from elixirdb.fanout import fan_out
+from elixirdb.metrics import query_metrics
+from elixirdb.metrics import statement_label
 from elixirdb.models.manager import EngineModel
+from elixirdb.registry import engine_options_of
+from elixirdb.registry import engine_registry
+from elixirdb.registry import shares_engine
+from elixirdb.routing import is_read_statement
+from elixirdb.slowlog import SlowQuery
+from elixirdb.slowlog import redact_parameters
+from elixirdb.slowlog import slow_query_log
+from elixirdb.utils.cache import LRUCache
+from elixirdb.utils.cache import ResultCache
+from elixirdb.utils.cache import estimate_size
+from elixirdb.utils.columnar import DEFAULT_CHUNK_SIZE
+from elixirdb.utils.columnar import fetch_columns
+from elixirdb.utils.columnar import fetch_numpy
 from elixirdb.utils.db_utils import apply_schema_to_statement
+from elixirdb.utils.db_utils import dml_tables
+from elixirdb.utils.db_utils import statement_fingerprint
+from elixirdb.utils.db_utils import statement_tables
+from elixirdb.utils.records import fetch_records
 
 
 if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy import Table
     from sqlalchemy.engine import Engine
     from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
     from sqlalchemy.engine.row import RowMapping
     from sqlalchemy.orm.session import Session
+    from sqlalchemy.sql.expression import TableClause
+    from elixirdb.bulk import BulkInsertMethod
+    from elixirdb.bulk import BulkInsertResult
+    from elixirdb.fanout import FanOutResult
+    from elixirdb.routing import ReplicaRouter
     from elixirdb.types import DatabaseEngineConfig
     from elixirdb.types import EngineType
     from elixirdb.types import QueryResult
     from elixirdb.types import RowData
+    from elixirdb.utils.records import Record
+
+
+# Names of connection/session methods that start or end a transaction.
+_TRANSACTION_METHODS = frozenset({"begin", "begin_nested", "commit", "rollback"})
+
+# Names of result methods timed as the fetch phase when metrics are enabled.
+_FETCH_METHODS = frozenset(
+    {
+        "all",
+        "fetchall",
+        "fetchmany",
+        "fetchone",
+        "first",
+        "one",
+        "one_or_none",
+        "scalar",
+        "scalar_one",
+        "scalar_one_or_none",
+    }
+)
+
+# Execution options that stream rows from a server side cursor.
+_STREAMING_OPTIONS = frozenset({"stream_results", "yield_per", "max_row_buffer"})
+
+# Execution options that do not change the rows of a result, left out of the
+# result cache key.
+_UNKEYED_OPTIONS = frozenset({"compiled_cache", "logging_token"})
+
+# Results of read statements, shared by all instances with `result_cache`
+# enabled on their engine.
+result_cache = ResultCache()
+
+# TextClause caches shared by all instances, keyed by cache size.
+_TEXTCLAUSE_CACHES: dict[int, LRUCache[str, TextClause]] = {}
+
+
+def get_textclause_cache(maxsize: int) -> LRUCache[str, TextClause]:
+    """Return the process-wide TextClause cache for the given size."""
+    cache = _TEXTCLAUSE_CACHES.get(maxsize)
+    if cache is None:
+        cache = _TEXTCLAUSE_CACHES.setdefault(maxsize, LRUCache(maxsize))
+    return cache
+
+
+# Attribute names resolved on a type, keyed by (type, attribute name).
+_TYPE_ATTRIBUTES: dict[tuple[type, str], bool] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Convert statement parameters into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _execution_options(statement: Any, kwargs: dict) -> dict[str, Any]:
+    """Merge the execution options of a statement and of an execute call."""
+    options = dict(getattr(statement, "get_execution_options", dict)())
+    options.update(kwargs.get("execution_options") or {})
+    return options
+
+
+def _is_streaming(options: dict[str, Any]) -> bool:
+    """Check if execution options stream rows (e.g. stream_results)."""
+    return any(options.get(name) for name in _STREAMING_OPTIONS)
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> frozenset[str]:
+    """Return the ``__slots__`` of a class as a frozenset."""
+    return frozenset(getattr(cls, "__slots__", ()))
+
+
+def _has_attribute(obj: Any, name: str) -> bool:
+    """
+    Check if an object provides an attribute, caching lookups that resolve
+    on the object's type (methods, properties).
+    """
+    key = (type(obj), name)
+    found = _TYPE_ATTRIBUTES.get(key)
+    if found is None:
+        found = _TYPE_ATTRIBUTES[key] = hasattr(type(obj), name)
+    return found or hasattr(obj, name)
 
 
 class ElixirDB(ConnectionBase):
@@ -132,12 +263,15 @@ class ElixirDB(ConnectionBase):
         """
         Wrap attribute access with parameter and result handling.
 
+        Callables are wrapped once and cached in ``_dispatch_cache`` by name,
+        together with the object they were taken from. The cached wrapper is
+        reused until the underlying result, connection, or session changes.
+
         Returns:
             Any: Attribute value or wrapped callable managing state.
         """
-        attribute = None
         # Check if it's in slots
-        if name in getattr(type(self), "__slots__", []):
+        if name in _slot_names(type(self)):
             return object.__getattribute__(self, name)
 
         # Check if it's a class-level attribute
@@ -147,77 +281,367 @@ class ElixirDB(ConnectionBase):
         self.statevars.exc_state = ExecutionState.BEGIN
 
         # Fetch methods retrieve from the Result object.
-        if self.result and hasattr(self.result, name):
-            attribute = getattr(self.result, name)
+        target = None
+        if self.result and _has_attribute(self.result, name):
+            target = self.result
         else:
             if not self.session and not self.connection:
-                self.connect()
+                self._ensure_connection()
             # Get attribute from the connection or session
-            if self.engine_type == "direct":
-                if hasattr(self.connection, name):
-                    attribute = getattr(self.connection, name)
-            elif hasattr(self.session, name):
-                attribute = getattr(self.session, name)
+            direct = self.engine_type == "direct"
+            source = self.connection if direct else self.session
+            if _has_attribute(source, name):
+                target = source
+
+        # Reuse the wrapper if it was built for the same target object.
+        cached = self._dispatch_cache.get(name)
+        if cached is not None and cached[0] is target:
+            return cached[1]
 
+        attribute = getattr(target, name) if target is not None else None
         if not attribute:
             raise AttributeError(f"Attribute {name} not found")
         if callable(attribute):
+            wrapper = self._wrap_callable(name, attribute)
+            self._dispatch_cache[name] = (target, wrapper)
+            return wrapper
+        self.statevars.exc_state = ExecutionState.IDLE
+        return attribute
+
+    def _ensure_connection(self) -> None:
+        """Connect on attribute access if there is no connection/session."""
+        self.connect()
+
+    def _wrap_callable(self, name: str, attribute: Callable) -> Callable:
+        """Build the state managing wrapper for a result/connection callable."""
+
+        @wraps(attribute)
+        def wrapper(*args, **kwargs):
+            return self._invoke(name, attribute, args, kwargs)
+
+        return wrapper
+
+    def _invoke(
+        self, name: str, attribute: Callable, args: tuple, kwargs: dict
+    ) -> Any:
+        """Call a wrapped attribute and run it through the handlers."""
+        if (
+            name == "execute" and self.db.slow_query_threshold is not None
+        ) or (self.db.metrics and (name == "execute" or name in _FETCH_METHODS)):
+            return self._invoke_timed(name, attribute, args, kwargs)
+        try:
+            # Process the args/kwargs and update any based on pre-processors
+            # (e.g. applying textclause to statement strings)
+            if name == "execute":
+                # Process any param handlers and convert str statements to
+                # textclause
+                args, kwargs = self._process_execute_args_kwargs(*args, **kwargs)
+                if self.router is not None:
+                    attribute = self._route_execute(
+                        self.router, attribute, args, kwargs
+                    )
+                if self.db.result_cache:
+                    attribute = self._cache_execute(attribute, kwargs)
+            self.result = result = attribute(*args, **kwargs)
+            if self.db.result_cache and name in _TRANSACTION_METHODS:
+                self._track_transaction(name)
+            return self._process_result(result)
+        except Exception as e:  # pylint: disable=broad-except
+            return self._process_error(e)
+
+    def _invoke_timed(
+        self, name: str, attribute: Callable, args: tuple, kwargs: dict
+    ) -> Any:
+        """
+        Call a wrapped execute/fetch attribute, timing each phase.
+
+        Execute records the `params` (parameter handlers, textclause, routing
+        and result cache setup) and `execute` phases, fetch methods the
+        `fetch` phase, and both the `handlers` phase, under the label of the
+        last executed statement. Executes slower than slow_query_threshold
+        are added to the slow query log.
+        """
+        timings = self.statevars.timings
+        try:
+            start = perf_counter()
+            if name == "execute":
+                timings.clear()
+                args, kwargs = self._process_execute_args_kwargs(*args, **kwargs)
+                statement = args[0] if args else kwargs.get("statement")
+                self._statement_label = statement_label(statement)
+                if self.router is not None:
+                    attribute = self._route_execute(
+                        self.router, attribute, args, kwargs
+                    )
+                if self.db.result_cache:
+                    attribute = self._cache_execute(attribute, kwargs)
+                self._record_timing("params", perf_counter() - start)
+                start = perf_counter()
+                self.result = result = attribute(*args, **kwargs)
+                self._record_timing("execute", perf_counter() - start)
+                self.statevars.orm_meta.query_time = timings["execute"]
+                threshold = self.db.slow_query_threshold
+                if threshold is not None and timings["execute"] >= threshold:
+                    self._record_slow_query(statement, kwargs, timings["execute"])
+            else:
+                self.result = result = attribute(*args, **kwargs)
+                self._record_timing("fetch", perf_counter() - start)
+            start = perf_counter()
+            result = self._process_result(result)
+            self._record_timing("handlers", perf_counter() - start)
+            return result
+        except Exception as e:  # pylint: disable=broad-except
+            return self._process_error(e)
+
+    def _record_timing(self, phase: str, seconds: float) -> None:
+        """Record the duration of a phase of the last executed statement."""
+        self.statevars.timings[phase] = seconds
+        if self.db.metrics:
+            engine_key = self.engine_key or ""
+            query_metrics.record(engine_key, self._statement_label, phase, seconds)
+
+    def _record_slow_query(
+        self, statement: Any, kwargs: dict, duration: float
+    ) -> None:
+        """Add a statement that exceeded slow_query_threshold to the slow log."""
+        sql = self._cache_sql(statement)[0]
+        parameters = kwargs.get(
+            "parameters" if self.engine_type == "direct" else "params"
+        )
+        options = self.db.engine_options
+        if options is not None and options.hide_parameters:
+            parameters = redact_parameters(parameters)
+        slow_query_log.record(
+            SlowQuery(
+                fingerprint=statement_fingerprint(sql, self.db.dialect),
+                statement=sql,
+                duration=duration,
+                engine_key=self.engine_key or "",
+                parameters=parameters,
+            )
+        )
 
-            @wraps(attribute)
-            def wrapper(*args, **kwargs):
-                # Update state variables
+    def _cache_execute(self, attribute: Callable, kwargs: dict) -> Callable:
+        """
+        Return a callable serving a read statement from the result cache.
+
+        DML statements invalidate the cached results of the tables they touch.
+        Reads inside a transaction (after a write, an explicit begin or an
+        earlier statement that began one) and streamed reads bypass the cache.
+        A read that misses the cache ends the transaction it began once its
+        rows are buffered, so the next read can be served from the cache. In
+        session modes only raw (text) statements are cached, since ORM results
+        hold instances bound to the session.
+        """
+        statement = kwargs.get("statement")
+        if statement is None:
+            return attribute
+        param_key = "parameters" if self.engine_type == "direct" else "params"
+        sql, bound = self._cache_sql(statement)
+        scope = self._result_cache_scope()
+
+        if not is_read_statement(statement):
+            self._record_writes(dml_tables(sql))
+            return attribute
+        primary = self.connection if self.engine_type == "direct" else self.session
+        options = _execution_options(statement, kwargs)
+        if (
+            self._write_tables is not None
+            or (primary is not None and primary.in_transaction())
+            or _is_streaming(options)
+            or (
+                self.engine_type != "direct"
+                and not isinstance(statement, TextClause)
+            )
+        ):
+            return attribute
+        tables = statement_tables(sql)
+        if not tables:
+            # Without the tables read the result could never be invalidated.
+            return attribute
+
+        options_key = _freeze(
+            {k: v for k, v in options.items() if k not in _UNKEYED_OPTIONS}
+        )
+        key = (scope, sql, bound, _freeze(kwargs.get(param_key)), options_key)
+        tags = [(scope, table) for table in tables]
+        ttl = self.db.result_cache_ttl
+
+        @wraps(attribute)
+        def cached_execute(*args, **kwargs):
+            frozen = result_cache.get(key)
+            if frozen is None:
+                # Writes committed by other instances during the read must
+                # not be hidden by caching its result.
+                generation = result_cache.generation(tags)
                 try:
-                    # Process the args/kwargs and update any based on pre-processors
-                    # (e.g. applying textclause to statement strings)
-                    if name == "execute":
-                        # Process any param handlers and convert str statements to textclause
-                        new_args, new_kwargs = self._process_execute_args_kwargs(
-                            *args, **kwargs
-                        )
-                        self.result = result = attribute(*new_args, **new_kwargs)
-                    else:
-                        self.result = result = attribute(*args, **kwargs)
-                    # Add debugging information to the result
-                    if isinstance(result, CursorResult) and self.debug:
-                        self.update_cursor_meta(result)
-                    # Process results if there are result handlers and result is
-                    # a valid result type to be processed. Result types can be
-                    # added to the result_types list using cls.add_result_type()
-                    if (
-                        result
-                        and self.result_handlers
-                        and (
-                            isinstance(result, tuple(self.result_types))
-                            or (
-                                isinstance(result, list)
-                                and all(
-                                    isinstance(item, tuple(self.result_types))
-                                    for item in result
-                                )
-                            )
-                        )
-                    ):
-                        result = h_(handlers=self.result_handlers, data=result)
-                    # Return the result
-                    self.statevars.exc_state = ExecutionState.IDLE
-                    return result
-
-                except Exception as e:  # pylint: disable=broad-except
-                    self.statevars.exc_state = ExecutionState.ERROR
-                    # An error handler to capture different errors and apply
-                    # handling globally.
-                    if self.error_handlers:
-                        if isinstance(self.error_handlers, list):
-                            for handler in self.error_handlers:
-                                handler(e)
-                        else:
-                            self.error_handlers(e)
-                    else:
-                        raise e from e
+                    frozen = attribute(*args, **kwargs).freeze()
+                finally:
+                    self._end_cached_read(primary)
+                result_cache.set(
+                    key,
+                    frozen,
+                    estimate_size(frozen.data),
+                    tags=tags,
+                    ttl=ttl,
+                    generation=generation,
+                )
+            return frozen()
 
-            return wrapper
+        return cached_execute
+
+    def _end_cached_read(self, primary: Connection | Session | None) -> None:
+        """
+        End the transaction begun by a read that missed the result cache.
+
+        A session with pending changes is left as is, since a rollback would
+        discard them.
+        """
+        if primary is None or not primary.in_transaction():
+            return
+        session: Any = primary
+        if self.engine_type != "direct" and (
+            session.new or session.dirty or session.deleted
+        ):
+            return
+        primary.rollback()
+
+    def _cache_sql(self, statement: Any) -> tuple[str, Any]:
+        """Return the SQL string and frozen bound values keying a statement."""
+        if isinstance(statement, TextClause):
+            return statement.text, ()
+        if isinstance(statement, str):
+            return statement, ()
+        compiled = statement.compile(dialect=self.engine.dialect)
+        return str(compiled), _freeze(compiled.params)
+
+    def _result_cache_scope(self) -> tuple[str, str]:
+        """Identify the database of cached results and invalidation tags."""
+        return (self.engine_key, str(self.engine.url))
+
+    def _record_writes(self, tables: Iterable[str]) -> None:
+        """
+        Invalidate the cached results of written tables and bypass the result
+        cache until the transaction ends.
+        """
+        tables = set(tables)
+        self._write_tables = (self._write_tables or set()) | tables
+        scope = self._result_cache_scope()
+        result_cache.invalidate((scope, table) for table in tables)
+
+    def _track_transaction(self, name: str) -> None:
+        """Track the transaction state used to bypass the result cache."""
+        if name in ("begin", "begin_nested"):
+            if self._write_tables is None:
+                self._write_tables = set()
+            return
+        tables, self._write_tables = self._write_tables, None
+        if tables and name == "commit":
+            # Drop results cached by other instances before the commit.
+            scope = self._result_cache_scope()
+            result_cache.invalidate((scope, table) for table in tables)
+
+    def _route_execute(
+        self, router: ReplicaRouter, attribute: Callable, args: tuple, kwargs: dict
+    ) -> Callable:
+        """
+        Return the execute callable of a replica for read statements.
+
+        Statements that are not reads, streamed reads, and every statement
+        executed while the primary connection/session is in a transaction
+        (e.g. after a write that was not committed yet), run on the primary.
+
+        Routed reads are buffered and their replica transaction ends right
+        after the read, so replica connections are never left idle in a
+        transaction and every read sees the latest commits. In session mode
+        the replica session is closed, returning detached instances.
+        """
+        statement = args[0] if args else kwargs.get("statement")
+        primary = self.connection if self.engine_type == "direct" else self.session
+        if (
+            primary is None
+            or primary.in_transaction()
+            or not is_read_statement(statement)
+            or _is_streaming(_execution_options(statement, kwargs))
+        ):
+            return attribute
+
+        engines = (
+            {key: self._replica_engine(key) for key in router.replicas}
+            if router.policy == "least_checked_out"
+            else None
+        )
+        replica_key = router.choose(engines)
+        replica = self._replica(replica_key)
+
+        @wraps(replica.execute)
+        def replica_execute(*args, **kwargs):
+            start = perf_counter()
+            try:
+                frozen = replica.execute(*args, **kwargs).freeze()
+            finally:
+                router.record(replica_key, perf_counter() - start)
+                if self.engine_type == "direct":
+                    replica.rollback()
+                else:
+                    replica.close()
+            return frozen()
+
+        return replica_execute
+
+    def _replica_engine(self, engine_key: str) -> Engine:
+        """Return the shared engine of a replica."""
+        model = self.config.engines[engine_key]  # type: ignore[union-attr]
+        url = model.url or URL.create(
+            **model.url_params.model_dump()  # type: ignore[union-attr]
+        )
+        return engine_registry.get_engine(model, url, engine_key)
+
+    def _replica(self, engine_key: str) -> Connection | Session:
+        """Return the connection/session opened on a replica."""
+        replica = self._replicas.get(engine_key)
+        if replica is None:
+            engine = self._replica_engine(engine_key)
+            if self.engine_type == "direct":
+                replica = engine.connect()
+            else:
+                replica = self.create_session_factory(
+                    engine=engine, engine_type="session"
+                )()
+            self._replicas[engine_key] = replica
+        return replica
+
+    def _close_replicas(self) -> None:
+        """Close the connections/sessions opened on replicas."""
+        replicas = list(self._replicas.values())
+        self._replicas.clear()
+        for replica in replicas:
+            replica.close()
+
+    def _process_result(self, result: Any) -> Any:
+        """Record debug metadata and run the result handlers on a result."""
+        # Add debugging information to the result
+        if isinstance(result, CursorResult) and self.debug:
+            self.update_cursor_meta(result)
+        # Process results if there are result handlers and result is
+        # a valid result type to be processed. Result types can be
+        # added to the result_types list using cls.add_result_type()
+        if result and self.result_handlers and self.is_result_type(result):
+            handle = self.compiled_handlers("result_handlers")
+            result = handle(result)  # type: ignore[misc]
+        # Return the result
         self.statevars.exc_state = ExecutionState.IDLE
-        return attribute
+        return result
+
+    def _process_error(self, error: Exception) -> None:
+        """Pass an error to the error handlers, or raise it if there are none."""
+        self.statevars.exc_state = ExecutionState.ERROR
+        # An error handler to capture different errors and apply
+        # handling globally.
+        handle = self.compiled_handlers("error_handlers")
+        if handle is None:
+            raise error from error
+        handle(error)
 
     def _process_execute_args_kwargs(self, *args, **kwargs):
         """ """
@@ -232,24 +656,39 @@ class ElixirDB(ConnectionBase):
         else:
             statement = kwargs.pop("statement", None)
             params = kwargs.pop(param_key, {})
-        # Return the args and let sqlalchemy handle the execution error
-        if not statement:
+        # Return the args and let sqlalchemy handle the execution error.
+        # SQLAlchemy constructs do not support truth testing.
+        if statement is None or (isinstance(statement, str) and not statement):
             return args, kwargs
 
         if isinstance(statement, str) and self.db.apply_textclause:
-            statement = text(statement)
+            statement = self.textclause_cache.get_or_set(
+                statement, partial(text, statement)
+            )
 
         # Process any parameter handlers. This is useful to cleanse or validate
         # any parameters.
         if params and self.parameter_handlers:
-            for handler in self.parameter_handlers:
-                statement, params = handler(params)
+            handle = self.compiled_handlers("parameter_handlers")
+            statement, params = handle(params)  # type: ignore[misc]
 
         kwargs["statement"] = statement
         kwargs[param_key] = params
 
         return (), kwargs
 
+    @property
+    def textclause_cache(self) -> LRUCache[str, TextClause]:
+        """
+        The process-wide cache of TextClause objects built from raw string
+        statements, sized by `textclause_cache_size` on the engine config.
+
+        Reusing the same TextClause for a statement skips the bind parameter
+        parsing done by text() and lets SQLAlchemy's compiled cache hit.
+        Use `textclause_cache.stats()` for hit/miss counters.
+        """
+        return get_textclause_cache(self.db.textclause_cache_size)
+
     @property
     def engine(self) -> Engine:
         """
@@ -259,14 +698,15 @@ class ElixirDB(ConnectionBase):
         flask_sqlalchemy
         """
         if not self.current_engine:
-            engine_options = (
-                self.db.engine_options.model_dump(
-                    exclude_unset=True, exclude_none=True
+            if shares_engine(self.db, self.url_string):
+                # Reuse the engine (and pool) of any instance with the same config.
+                self.current_engine = engine_registry.get_engine(
+                    self.db, self.url_string, self.engine_key
+                )
+            else:
+                self.current_engine = create_engine(
+                    self.url_string, **engine_options_of(self.db)
                 )
-                if self.db.engine_options
-                else {}
-            )
-            self.current_engine = create_engine(self.url_string, **engine_options)
         return self.current_engine
 
     def has_connection(self) -> bool:
@@ -278,10 +718,14 @@ class ElixirDB(ConnectionBase):
         else:
             return True if self.session else False
 
-    def new_session(self) -> ElixirDB:
+    def new_session(self) -> Self:
         """
         Return a new session with the current configuration.
 
+        The new instance reuses the validated engine configuration, engine,
+        session factory, handlers and result types of this instance, so the
+        only work done is constructing the `Session`.
+
         If there is no session_factory, it means that there is isn't an active
         session either and using this method  will raise an exception.
 
@@ -305,18 +749,61 @@ class ElixirDB(ConnectionBase):
                 "A session was never created. Use connect() first."
             )
 
-        self.session_factory = self.create_session_factory(
-            engine=self.engine, engine_type=self.engine_type
-        )
-        config = self.config or self.db
+        instance = self._spawn()
+        instance.session = self.session_factory()
+        instance.statevars.state = ConnectionState.CONNECTED
+        return instance
 
-        return ElixirDB(
-            config=config,
-            engine_key=self.engine_key,
-            engine_type=self.engine_type,
-            session_factory=self.session_factory,
+    def _spawn(self, engine_key: str | None = None) -> Self:
+        """
+        Create an unconnected instance sharing this instance's configuration.
+
+        Bypasses ConnectionBase.__init__ (config discovery and validation) and
+        only initializes the dataclass fields from the already validated state.
+        With an engine_key of the EngineManager configuration (or a route),
+        the instance uses that engine instead, keeping the handlers, result
+        types and engine type of this instance.
+        """
+        db, router = self.db, self.router
+        engine, session_factory = self.current_engine, self.session_factory
+        if engine_key is not None and engine_key != self.engine_key:
+            if not self.config:
+                raise InvalidElixirConfigError(
+                    "An engine_key requires a configuration with multiple engines."
+                )
+            router = None
+            if self.config.routes and engine_key in self.config.routes:
+                engine_key, router = resolve_route(self.config, engine_key)
+            if engine_key not in self.config.engines:
+                raise EngineKeyNotFoundError(engine_key=engine_key)
+            db = self.config.engines[engine_key]
+            # The engine and session factory are bound to this instance's engine.
+            engine = session_factory = None
+        else:
+            engine_key = self.engine_key
+
+        instance = type(self).__new__(type(self))
+        ConnectionConfig.__init__(
+            instance,
+            db=db,
+            debug=self.debug,
+            _bypass=True,
+            engine_key=engine_key,
+            router=router,
+            current_engine=engine,
             result_types=self.result_types,
+            result_type_sample_size=self.result_type_sample_size,
+            engine_type=self.engine_type,
+            session_factory=session_factory,
+            execution_handler=self.execution_handler,
+            error_handlers=self.error_handlers,
+            parameter_handlers=list(self.parameter_handlers),
+            result_handlers=list(self.result_handlers),
+            time_handlers=self.time_handlers,
         )
+        if "config" in self.__dict__:
+            instance.config = self.config
+        return instance
 
     def connect(self) -> Self:
         """Open, set, and return the connection."""
@@ -412,20 +899,34 @@ class ElixirDB(ConnectionBase):
                 "multiple engines."
             )
 
+        router = None
+        if self.config.routes and engine_key in self.config.routes:
+            engine_key, router = resolve_route(self.config, engine_key)
+
         if engine_key not in list(self.config.engines.keys()):
             raise EngineKeyNotFoundError(engine_key=engine_key)
 
         if self.has_connection():
             self.close()
+        self._close_replicas()
+        self.router = router
 
         self.engine_key = engine_key
         self.db = self.config.engines[engine_key]
+        # The engine, session factory and session are bound to the previous
+        # engine.
+        self.current_engine = None
+        self.session_factory = None
+        self.session = None
         # Automatically connect new engine
         if self.db.auto_connect and hasattr(self, "connect"):
             self.connect()
 
     def close(self) -> None:
         """Close the connection to the database and cleanup resources."""
+        self._dispatch_cache.clear()
+        self._close_replicas()
+        self._write_tables = None
         if not self.connection:
             return
         try:
@@ -440,11 +941,22 @@ class ElixirDB(ConnectionBase):
     def fetch_results(self, fetch: int | None = None) -> Sequence[RowData]:
         """Fetch results from the result object as mappings."""
         result = self.result
-        if not result or not isinstance(self.result, CursorResult):
+        if not result or not isinstance(self.result, Result):
             raise CursorResultError(
-                "The result object does not exist or is not a CursorResult."
+                "The result object does not exist or is not a Result."
             )
 
+        if not self.db.metrics:
+            return self._fetch_results(result, fetch)
+        start = perf_counter()
+        rows = self._fetch_results(result, fetch)
+        self._record_timing("fetch", perf_counter() - start)
+        return rows
+
+    def _fetch_results(
+        self, result: Result, fetch: int | None
+    ) -> Sequence[RowData]:
+        """Fetch rows from a result as mappings or rows."""
         if self.db.result_to_dict:
             if fetch == 0:
                 return result.mappings().all()
@@ -455,24 +967,221 @@ class ElixirDB(ConnectionBase):
 
         return result.fetchmany(fetch)
 
-    def update_cursor_meta(self, result: CursorResult) -> None:
-        """Update self.statevars.cursor_meta with metadata from CursorResult."""
-        self.statevars.cursor_meta = CursorResultMetadata(
-            columns=list(result.keys()),
-            rows_affected=result.rowcount,
-            last_insert_id=result.lastrowid,
-            last_insert_rowid=result.lastrowid,
-            last_insert_rowid_str=str(result.lastrowid),
-            parameters=getattr(result.context, "compiled_parameters", None),
-            sql_query=str(getattr(result.context, "compiled_statement", None)),
-            column_descriptions=[
-                {"name": col, "type": type_}
-                for col, type_ in getattr(result.cursor, "description", []) or []
-            ],
-            generated_keys=getattr(result, "inserted_primary_key", None),
-            is_closed=result.closed,
-            execution_context=str(getattr(result, "context", None)),
+    def fetch_columns(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> dict[str, list[Any]]:
+        """
+        Fetch the remaining rows of the current result as a list per column.
+
+        See :func:`elixirdb.utils.columnar.fetch_columns`.
+        """
+        return fetch_columns(self._cursor_result(), chunk_size)
+
+    def fetch_numpy(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtypes: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch the remaining rows of the current result as a NumPy array per
+        column. Requires numpy (`pip install elixirdb[numpy]`).
+
+        See :func:`elixirdb.utils.columnar.fetch_numpy`.
+        """
+        return fetch_numpy(self._cursor_result(), chunk_size, dtypes)
+
+    def fetch_records(
+        self, size: int | None = None, name: str = "Record"
+    ) -> list[Record]:
+        """
+        Fetch rows of the current result as lightweight `__slots__` records
+        with an attribute per column, built straight from the DBAPI cursor
+        tuples when possible. Useful for read-only data that does not need
+        ORM instances or dicts.
+
+        See :func:`elixirdb.utils.records.fetch_records`.
+        """
+        result = self._cursor_result()
+        if not self.db.metrics:
+            return fetch_records(result, size, name)
+        start = perf_counter()
+        records = fetch_records(result, size, name)
+        self._record_timing("fetch", perf_counter() - start)
+        return records
+
+    def _cursor_result(self) -> Result:
+        """Return the current result, ensuring it is a Result."""
+        if not self.result or not isinstance(self.result, Result):
+            raise CursorResultError(
+                "The result object does not exist or is not a Result."
+            )
+        return self.result
+
+    def iter_results(
+        self,
+        statement: Executable | str | None = None,
+        parameters: _CoreAnyExecuteParams | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[RowData]]:
+        """
+        Stream results in batches instead of materializing the result set.
+
+        If a statement is provided, it is executed with the `stream_results`
+        and `yield_per` execution options so dialects with server side
+        cursors only buffer `batch_size` rows at a time. Without a statement,
+        the current result (self.result) is iterated.
+
+        Batches contain mappings if `result_to_dict` is enabled on the engine,
+        otherwise rows. The result is closed once the generator is exhausted
+        or closed.
+
+        Args:
+            statement: The statement to execute and stream.
+            parameters: Parameters for the statement.
+            batch_size: The number of rows per batch.
+
+        Yields:
+            Sequence[RowData]: A batch of at most `batch_size` rows.
+        """
+        if statement is not None:
+            options = {"stream_results": True, "yield_per": batch_size}
+            if parameters:
+                self.execute(statement, parameters, execution_options=options)
+            else:
+                self.execute(statement, execution_options=options)
+
+        result = self.result
+        if not result or not isinstance(result, Result):
+            raise CursorResultError(
+                "The result object does not exist or is not a Result."
+            )
+
+        source = result.mappings() if self.db.result_to_dict else result
+        try:
+            for batch in source.partitions(batch_size):
+                self.statevars.exc_state = ExecutionState.FETCH
+                yield batch
+        finally:
+            result.close()
+            self.statevars.exc_state = ExecutionState.IDLE
+
+    def bulk_insert(
+        self,
+        table: str | Table | TableClause,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Sequence[str] | None = None,
+        method: BulkInsertMethod = "auto",
+    ) -> BulkInsertResult:
+        """
+        Insert rows in batches of batch_size.
+
+        Rows can be any iterable (including generators) of mappings, or of
+        sequences when `columns` is provided. Only one batch is held in
+        memory at a time. The transaction is not committed.
+
+        Methods:
+            auto: `executemany`.
+            executemany: One execute per batch with a list of parameters.
+                SQLAlchemy sends multi-row INSERTs (insertmanyvalues) for
+                dialects that support it.
+            values: INSERT ... VALUES statements with a row per item, split
+                to stay within the bind parameter limit of the dialect.
+            copy: PostgreSQL COPY FROM STDIN through the DBAPI connection
+                (psycopg2/psycopg). Column type processing is bypassed:
+                dicts are written as JSON, lists as arrays and bytes as
+                bytea.
+
+        Parameter handlers are not applied to bulk inserted rows.
+
+        >> stats = db.bulk_insert("users", ({"id": i} for i in range(100_000)))
+        >> stats.rows_per_second
+
+        Args:
+            table: A table name (optionally schema qualified) or Table.
+            rows: The rows to insert.
+            batch_size: The number of rows written per batch.
+            columns: The column names. Defaults to the keys of the first row.
+            method: The insert method.
+
+        Returns:
+            BulkInsertResult: Rows and batches written, elapsed time and
+                rows per second.
+        """
+        if not self.has_connection():
+            self._ensure_connection()
+        connection = (
+            self.connection
+            if self.engine_type == "direct"
+            else self.session.connection()
         )
+        if self.db.result_cache:
+            name = table if isinstance(table, str) else table.name
+            self._record_writes((name.rpartition(".")[2].lower(),))
+        try:
+            result = bulk_insert(
+                connection,
+                table,
+                rows,
+                batch_size=batch_size,
+                columns=columns,
+                method=method,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            return self._process_error(e)
+        self.statevars.rowcount = result.rows
+        return result
+
+    def fan_out(
+        self,
+        statement: Executable | str,
+        parameters: _CoreAnyExecuteParams | None = None,
+        engine_keys: Sequence[str] | None = None,
+        max_workers: int | None = None,
+        commit: bool = False,
+    ) -> FanOutResult:
+        """
+        Execute a statement concurrently on several engines of the
+        EngineManager configuration (scatter-gather).
+
+        Each engine runs on its own connection in a bounded thread pool, so
+        the connection of this instance is left untouched. The workers use
+        the handlers, result types and engine type of this instance. Failures
+        are collected per engine instead of being raised. Use
+        :meth:`FanOutResult.merge` to combine the rows.
+
+        >> sql = "SELECT region, COUNT(*) AS n FROM orders GROUP BY region"
+        >> results = db.fan_out(sql)
+        >> results.merge("aggregate", group_by=["region"], aggregates={"n": sum})
+
+        Args:
+            statement: The statement to execute.
+            parameters: The parameters of the statement.
+            engine_keys: The engines to query. Defaults to every engine.
+            max_workers: The maximum number of engines queried at the same
+                time. Defaults to 8.
+            commit: Commit on each engine after executing the statement.
+
+        Returns:
+            FanOutResult: The rows, rowcount, error and elapsed time per engine.
+        """
+        return fan_out(
+            self,
+            statement,
+            parameters,
+            engine_keys=engine_keys,
+            max_workers=max_workers,
+            commit=commit,
+        )
+
+    def update_cursor_meta(self, result: CursorResult) -> None:
+        """
+        Update self.statevars.cursor_meta with metadata from CursorResult.
+
+        The metadata is computed lazily on first access, so debug mode only
+        costs an object allocation per statement.
+        """
+        self.statevars.cursor_meta = LazyCursorResultMetadata(result)
 
     def update_orm_meta(self, result: Any) -> None:
         """Update self.statevars.orm_meta with metadata from CursorResult."""
@@ -607,7 +1316,7 @@ class StatementsMixin:
             return f"{self.db.statements.schema_name}.{statement}"
 
         return apply_schema_to_statement(
-            statement, self.db.config.schema_name, self.db.dialect
+            statement, self.db.statements.schema_name, self.db.dialect
         )
 
 
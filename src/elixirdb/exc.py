@@ -155,6 +155,13 @@ class CursorResultError(Exception):
     """
 
 
+class NotConnectedError(Exception):
+    """
+    Exception raised when accessing the connection/session of an async instance
+    that has not been connected.
+    """
+
+
 class NoSessionFactoryError(Exception):
     """
     Exception raised when attempting to access a session factory.
@@ -165,3 +172,9 @@ class FlaskNotInstalledError(Exception):
     """
     Error raised when using flask related features without flask installed.
     """
+
+
+class NumpyNotInstalledError(Exception):
+    """
+    Error raised when fetching results as NumPy arrays without numpy installed.
+    """
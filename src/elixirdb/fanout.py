@@ -0,0 +1,275 @@
+"""
+Scatter-gather execution of a statement across the engines of an
+EngineManager configuration.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from operator import itemgetter
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Literal
+from typing import Sequence
+from sqlalchemy import CursorResult
+from sqlalchemy import Result
+from elixirdb.exc import InvalidElixirConfigError
+from elixirdb.models.manager import EngineManager
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Executable
+    from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
+    from elixirdb.async_db import AsyncElixirDB
+    from elixirdb.db import ElixirDB
+    from elixirdb.types import EngineKey
+    from elixirdb.types import RowData
+
+
+MergeStrategy = Literal["concatenate", "merge_sorted", "aggregate"]
+
+# The default maximum number of engines queried at the same time.
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(slots=True)
+class EngineResult:
+    """The outcome of a fanned out statement on one engine."""
+
+    engine_key: EngineKey
+    rows: Sequence[RowData] = field(default_factory=list)
+    rowcount: int = -1
+    error: Exception | None = None
+    # Seconds spent connecting, executing and fetching.
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class FanOutResult:
+    """Per engine results of :meth:`elixirdb.db.ElixirDB.fan_out`."""
+
+    # Results in the order of the engine_keys that were queried.
+    results: dict[EngineKey, EngineResult] = field(default_factory=dict)
+
+    def __getitem__(self, engine_key: EngineKey) -> EngineResult:
+        return self.results[engine_key]
+
+    def __iter__(self):
+        return iter(self.results.values())
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def errors(self) -> dict[EngineKey, Exception]:
+        """The errors raised by engines that failed."""
+        return {r.engine_key: r.error for r in self if r.error is not None}
+
+    @property
+    def rowcount(self) -> int:
+        """The total rowcount of the engines that reported one."""
+        return sum(r.rowcount for r in self if r.ok and r.rowcount > 0)
+
+    def merge(
+        self,
+        strategy: MergeStrategy = "concatenate",
+        key: str | Callable[[Any], Any] | None = None,
+        reverse: bool = False,
+        group_by: Sequence[str] = (),
+        aggregates: dict[str, Callable[[list[Any]], Any]] | None = None,
+    ) -> list[Any]:
+        """
+        Merge the rows of the engines that succeeded.
+
+        Args:
+            strategy: How rows are merged:
+                concatenate: Rows of each engine one after another.
+                merge_sorted: Rows of engines that are each sorted by `key`
+                    (e.g. with ORDER BY) are merged into one sorted list.
+                aggregate: Rows are grouped by the `group_by` columns and
+                    each column in `aggregates` is reduced with its function
+                    (e.g. {"total": sum}). Returns a dict per group.
+            key: A column name or callable to sort by with `merge_sorted`.
+            reverse: Set when each engine's rows are sorted descending.
+            group_by: The columns to group by with `aggregate`.
+            aggregates: A mapping of column name to an aggregate function
+                receiving the list of values of the group.
+
+        Returns:
+            list[Any]: The merged rows.
+
+        Raises:
+            ValueError: If the strategy is invalid or is missing arguments.
+        """
+        rows = [r.rows for r in self if r.ok]
+
+        if strategy == "concatenate":
+            return list(itertools.chain.from_iterable(rows))
+
+        if strategy == "merge_sorted":
+            if key is None:
+                raise ValueError("merge_sorted requires a key.")
+            sort_key = itemgetter(key) if isinstance(key, str) else key
+            return list(heapq.merge(*rows, key=sort_key, reverse=reverse))
+
+        if strategy == "aggregate":
+            if not aggregates:
+                raise ValueError("aggregate requires aggregates.")
+            return aggregate_rows(
+                itertools.chain.from_iterable(rows), group_by, aggregates
+            )
+
+        raise ValueError(
+            f"Invalid merge strategy '{strategy}'. Valid strategies are: "
+            "concatenate, merge_sorted, aggregate"
+        )
+
+
+def aggregate_rows(
+    rows: Iterable[Any],
+    group_by: Sequence[str],
+    aggregates: dict[str, Callable[[list[Any]], Any]],
+) -> list[dict[str, Any]]:
+    """
+    Group mapping rows by the group_by columns and reduce the values of each
+    aggregated column with its function. Groups keep first-seen order.
+    """
+    groups: dict[tuple[Any, ...], dict[str, list[Any]]] = {}
+    for row in rows:
+        group = tuple(row[column] for column in group_by)
+        values = groups.get(group)
+        if values is None:
+            values = groups[group] = {column: [] for column in aggregates}
+        for column, column_values in values.items():
+            column_values.append(row[column])
+
+    return [
+        {
+            **dict(zip(group_by, group, strict=False)),
+            **{column: aggregates[column](vals) for column, vals in values.items()},
+        }
+        for group, values in groups.items()
+    ]
+
+
+def _engine_keys(
+    db: ElixirDB, engine_keys: Sequence[EngineKey] | None
+) -> list[EngineKey]:
+    """Return the engines to fan out to, defaulting to every engine."""
+    config = db.config
+    if not isinstance(config, EngineManager):
+        raise InvalidElixirConfigError(
+            "fan_out requires a configuration with multiple engines."
+        )
+    return list(engine_keys) if engine_keys is not None else list(config.engines)
+
+
+def _collect(result: EngineResult, worker: ElixirDB, handled: Any) -> None:
+    """Set the rowcount and rows of an engine from a worker's execute."""
+    raw = worker.result
+    result.rowcount = getattr(raw, "rowcount", -1)
+    if handled is not raw:
+        # The result handlers already turned the result into the rows.
+        result.rows = handled
+    elif isinstance(raw, Result) and (
+        not isinstance(raw, CursorResult) or raw.returns_rows
+    ):
+        result.rows = worker.fetch_results(0)
+
+
+def fan_out(
+    db: ElixirDB,
+    statement: Executable | str,
+    parameters: _CoreAnyExecuteParams | None = None,
+    *,
+    engine_keys: Sequence[EngineKey] | None = None,
+    max_workers: int | None = None,
+    commit: bool = False,
+) -> FanOutResult:
+    """
+    Execute a statement on several engines concurrently.
+
+    See :meth:`elixirdb.db.ElixirDB.fan_out`.
+    """
+    keys = _engine_keys(db, engine_keys)
+    if not keys:
+        return FanOutResult()
+
+    def run(engine_key: EngineKey) -> EngineResult:
+        result = EngineResult(engine_key=engine_key)
+        start = perf_counter()
+        try:
+            # Engines are shared through the engine registry, so each worker
+            # only checks a connection out of the pool of its engine.
+            worker = db._spawn(engine_key).connect()  # noqa: SLF001
+            try:
+                handled = worker.execute(statement, parameters or {})
+                _collect(result, worker, handled)
+                if commit:
+                    worker.commit()
+            finally:
+                # close() only releases the connection of direct workers.
+                if worker.session is not None:
+                    worker.session.close()
+                worker.close()
+        except Exception as e:  # pylint: disable=broad-except
+            result.error = e
+        result.elapsed = perf_counter() - start
+        return result
+
+    workers = min(len(keys), max_workers or DEFAULT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, keys))
+
+    return FanOutResult({r.engine_key: r for r in results})
+
+
+async def afan_out(
+    db: AsyncElixirDB,
+    statement: Executable | str,
+    parameters: _CoreAnyExecuteParams | None = None,
+    *,
+    engine_keys: Sequence[EngineKey] | None = None,
+    max_workers: int | None = None,
+    commit: bool = False,
+) -> FanOutResult:
+    """
+    Execute a statement on several engines concurrently with asyncio.
+
+    See :meth:`elixirdb.async_db.AsyncElixirDB.fan_out`.
+    """
+    import asyncio  # noqa: PLC0415
+
+    keys = _engine_keys(db, engine_keys)
+    if not keys:
+        return FanOutResult()
+    semaphore = asyncio.Semaphore(max_workers or DEFAULT_MAX_WORKERS)
+
+    async def run(engine_key: EngineKey) -> EngineResult:
+        result = EngineResult(engine_key=engine_key)
+        async with semaphore:
+            start = perf_counter()
+            try:
+                async with db._spawn(engine_key) as worker:  # noqa: SLF001
+                    handled = await worker.execute(statement, parameters or {})
+                    _collect(result, worker, handled)
+                    if commit:
+                        await worker.commit()
+            except Exception as e:  # pylint: disable=broad-except
+                result.error = e
+            result.elapsed = perf_counter() - start
+        return result
+
+    results = await asyncio.gather(*(run(key) for key in keys))
+    return FanOutResult({r.engine_key: r for r in results})
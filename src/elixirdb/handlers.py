@@ -7,9 +7,27 @@ This module is for handlers you can use in the DatabaseConnection objects.
 from __future__ import annotations
 
 import re
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
-from dateutil import parser
+from typing import Collection
+from typing import Mapping
+from typing import Sequence
+from sqlalchemy import Result
+from sqlalchemy import inspect as sa_inspect
+from elixirdb.utils.lazy import LazyModule
+
+
+if TYPE_CHECKING:
+    from elixirdb.types import ColumnHandlerProtocol
+
+
+# dateutil is only imported when a date string is parsed.
+parser = LazyModule("dateutil.parser")
 
 
 def handler(
@@ -36,39 +54,147 @@ def handler(
     return data
 
 
+# English month abbreviations, as parsed by dateutil.
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            *("jan", "feb", "mar", "apr", "may", "jun"),
+            *("jul", "aug", "sep", "oct", "nov", "dec"),
+        ),
+        start=1,
+    )
+}
+
+
+def _year(value: str) -> int:
+    """
+    Convert a year token the way dateutil does: two digit years resolve to
+    the year within 50 years of the current year.
+    """
+    if len(value) == 4 and value >= "0100":  # noqa: PLR2004
+        return int(value)
+    if len(value) != 2:  # noqa: PLR2004
+        # dateutil also treats 3 digit and zero padded years below 100 as
+        # two digit years in some contexts; leave those to dateutil.
+        raise ValueError(f"Ambiguous year: {value}")
+    this_year = datetime.now().year
+    year = int(value) + this_year // 100 * 100
+    if year >= this_year + 50:
+        year -= 100
+    elif year < this_year - 50:
+        year += 100
+    return year
+
+
+def _parse_ymd(text: str, *groups: str) -> datetime:
+    """YYYY-M-D and YYYY/M/D dates, with an optional HH:MM:SS time."""
+    if len(text) in (10, 19):  # noqa: PLR2004
+        # Zero padded dates (and times) have a C parser.
+        return datetime.fromisoformat(text.replace("/", "-"))
+    return datetime(*map(int, groups))
+
+
+def _parse_mdy(text: str, first: str, second: str, year: str) -> datetime:
+    """M/D/Y and M-D-Y dates, read month first like dateutil."""
+    if int(first) > 12:  # noqa: PLR2004
+        raise ValueError(f"Day first date: {text}")
+    return datetime(_year(year), int(first), int(second))
+
+
+def _parse_d_mon_y(text: str, day: str, month: str, year: str) -> datetime:
+    """D Mon YYYY dates."""
+    return datetime(_year(year), _MONTHS[month.lower()], int(day))
+
+
+def _parse_mon_d_y(text: str, month: str, day: str, year: str) -> datetime:
+    """Mon D, YYYY dates."""
+    return datetime(_year(year), _MONTHS[month.lower()], int(day))
+
+
 class DateFormatter:
     """
     Class to recursively format date strings in a data structure.
 
+    The date patterns are combined in a single regex. Each pattern has a fast
+    parser; strings it cannot parse unambiguously the way dateutil would
+    (e.g. day first dates) fall back to dateutil. Formatted strings are
+    memoized in a bounded LRU cache.
+
     Attributes:
         date_format (str): The format to convert date strings into.
         date_patterns (list[str]): list of regex patterns to identify
             date strings.
         compiled_patterns (list[Pattern]): Compiled regex patterns.
+        pattern (Pattern): The patterns combined in a single regex.
+        columnwise (bool): Format lists of dicts by column. See
+            :meth:`process_rows`.
     """
 
-    def __init__(self, date_format: str = "%Y-%m-%d") -> None:
+    def __init__(
+        self,
+        date_format: str = "%Y-%m-%d",
+        cache_size: int = 4096,
+        columnwise: bool = False,
+        sample_size: int = 100,
+        columns: Collection[str] | None = None,
+    ) -> None:
         """
         Initializes the DateFormatter with a specific date format.
 
         Args:
             date_format (str): The desired date format for output
                 strings.
+            cache_size (int): Number of formatted date strings memoized.
+            columnwise (bool): Detect the date columns of lists of dicts
+                and only format those columns.
+            sample_size (int): Number of rows sampled to detect date columns.
+            columns (Collection[str] | None): The columns formatted when used
+                as a column handler. All columns by default.
         """
         self.date_format = date_format
-        # Define regex patterns for date/datetime strings
-        self.date_patterns = [
-            r"\b\d{4}-\d{1,2}-\d{1,2}\b",  # YYYY-M-D or YYYY-MM-DD
-            r"\b\d{1,2}/\d{1,2}/\d{2,4}\b",  # M/D/YYYY or MM/DD/YY
-            r"\b\d{1,2}-\d{1,2}-\d{2,4}\b",  # D-M-YYYY or DD-MM-YY
-            r"\b\d{4}/\d{1,2}/\d{1,2}\b",  # YYYY/M/D or YYYY/MM/DD
-            r"\b\d{4}-\d{1,2}-\d{1,2} \d{2}:\d{2}:\d{2}\b",  # YYYY-M-D HH:MM:SS
-            r"\b\d{4}/\d{1,2}/\d{1,2} \d{2}:\d{2}:\d{2}\b",  # YYYY/M/D HH:MM:SS
-            r"\b\d{1,2} \w{3} \d{4}\b",  # D Mon YYYY
-            r"\b\w{3} \d{1,2}, \d{4}\b",  # Mon D, YYYY
+        self.columns = columns
+        self.columnwise = columnwise
+        self.sample_size = sample_size
+        # Define regex patterns for date/datetime strings, with the parser
+        # of each pattern.
+        parsers: list[tuple[str, Callable[..., datetime]]] = [
+            # YYYY-M-D or YYYY-MM-DD
+            (r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b", _parse_ymd),
+            # M/D/YYYY or MM/DD/YY
+            (r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b", _parse_mdy),
+            # D-M-YYYY or DD-MM-YY
+            (r"\b(\d{1,2})-(\d{1,2})-(\d{2,4})\b", _parse_mdy),
+            # YYYY/M/D or YYYY/MM/DD
+            (r"\b(\d{4})/(\d{1,2})/(\d{1,2})\b", _parse_ymd),
+            # YYYY-M-D HH:MM:SS
+            (
+                r"\b(\d{4})-(\d{1,2})-(\d{1,2}) (\d{2}):(\d{2}):(\d{2})\b",
+                _parse_ymd,
+            ),
+            # YYYY/M/D HH:MM:SS
+            (
+                r"\b(\d{4})/(\d{1,2})/(\d{1,2}) (\d{2}):(\d{2}):(\d{2})\b",
+                _parse_ymd,
+            ),
+            # D Mon YYYY
+            (r"\b(\d{1,2}) (\w{3}) (\d{4})\b", _parse_d_mon_y),
+            # Mon D, YYYY
+            (r"\b(\w{3}) (\d{1,2}), (\d{4})\b", _parse_mon_d_y),
         ]
-
+        self.date_patterns = [p for p, _ in parsers]
         self.compiled_patterns = [re.compile(p) for p in self.date_patterns]
+        self.pattern = re.compile(
+            "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(self.date_patterns))
+        )
+        # The parser of each pattern and the slice of its groups in
+        # match.groups(), keyed by the name of the pattern group.
+        self._parsers: dict[str, tuple[Callable[..., datetime], slice]] = {}
+        for i, (regex, parse) in enumerate(parsers):
+            start = self.pattern.groupindex[f"p{i}"]
+            width = re.compile(regex).groups
+            self._parsers[f"p{i}"] = (parse, slice(start, start + width))
+        self._format = lru_cache(maxsize=cache_size)(self._format_date)
 
     def is_date_string(self, s: str) -> bool:
         """
@@ -80,7 +206,55 @@ class DateFormatter:
         Returns:
             bool: True if the string is a date, False otherwise.
         """
-        return any(pattern.fullmatch(s) for pattern in self.compiled_patterns)
+        return self.pattern.fullmatch(s) is not None
+
+    def parse(self, s: str) -> datetime:
+        """
+        Parse a date string matching one of the date patterns.
+
+        Raises:
+            ValueError: If the string is not a valid date.
+        """
+        match = self.pattern.fullmatch(s)
+        if match is None:
+            raise ValueError(f"Not a date string: {s}")
+        if s.isascii():
+            parse, groups = self._parsers[match.lastgroup]  # type: ignore[index]
+            try:
+                return parse(s, *match.groups()[groups])
+            except (ValueError, KeyError):
+                pass
+        return parser.parse(s)
+
+    def _format_date(self, s: str) -> str:
+        """Format a date string, or return it unchanged if it is not a date."""
+        try:
+            return self.parse(s).strftime(self.date_format)
+        except (ValueError, OverflowError):
+            return s
+
+    def format_string(self, s: str) -> str:
+        """Format s if it is a date string, otherwise return it unchanged."""
+        if self.pattern.fullmatch(s) is None:
+            return s
+        return self._format(s)
+
+    def format_value(self, value: Any) -> Any:
+        """Format value if it is a date string, otherwise return it unchanged."""
+        return self.format_string(value) if isinstance(value, str) else value
+
+    def column_transforms(
+        self, keys: Sequence[str], description: Sequence[Sequence[Any]] | None
+    ) -> dict[str, Callable[[Any], Any]]:
+        """
+        Column handler protocol (see :class:`ColumnResultHandler`): format the
+        values of `columns`, or of every column if columns is not set.
+        """
+        return {
+            key: self.format_value
+            for key in keys
+            if self.columns is None or key in self.columns
+        }
 
     def process_data(self, data: Any) -> Any:
         """
@@ -92,21 +266,63 @@ class DateFormatter:
         Returns:
             Any: The processed data with formatted date strings.
         """
+        if isinstance(data, str):
+            return self.format_string(data)
         if isinstance(data, dict):
             return {k: self.process_data(v) for k, v in data.items()}
         if isinstance(data, list):
+            if self.columnwise and data and isinstance(data[0], dict):
+                return self.process_rows(data)
             return [self.process_data(item) for item in data]
-        if isinstance(data, str):
-            if self.is_date_string(data):
-                try:
-                    dt = parser.parse(data)
-                    return dt.strftime(self.date_format)
-                except (ValueError, OverflowError):
-                    return data
-            else:
-                return data
-        else:
-            return data
+        return data
+
+    def date_columns(self, rows: list[dict[str, Any]]) -> list[Any]:
+        """
+        Detect the date columns of a list of dicts: the keys whose first
+        non-null value in the first sample_size rows is a date string.
+        """
+        pending = dict.fromkeys(rows[0])
+        columns = []
+        for row in rows[: self.sample_size]:
+            if not isinstance(row, dict):
+                continue
+            for key in list(pending):
+                value = row.get(key)
+                if value is None:
+                    continue
+                del pending[key]
+                if isinstance(value, str) and self.is_date_string(value):
+                    columns.append(key)
+            if not pending:
+                break
+        return columns
+
+    def process_rows(self, rows: list[Any]) -> list[Any]:
+        """
+        Format the date columns of a list of dicts (see :meth:`date_columns`).
+
+        Only the detected date columns are processed; other columns,
+        including nested values, are left unchanged. Rows that are not dicts
+        are processed recursively.
+        """
+        columns = self.date_columns(rows)
+        if not columns:
+            return rows
+        # Values of date columns skip the regex check before the cache
+        # lookup; values that are not dates are returned unchanged.
+        format_date = self._format
+        processed = []
+        for row in rows:
+            if not isinstance(row, dict):
+                processed.append(self.process_data(row))
+                continue
+            row = dict(row)
+            for key in columns:
+                value = row.get(key)
+                if isinstance(value, str):
+                    row[key] = format_date(value)
+            processed.append(row)
+        return processed
 
     def __call__(self, data: Any) -> Any:
         """
@@ -122,16 +338,278 @@ class DateFormatter:
         return self.process_data(data)
 
 
-def to_dict(obj: Any) -> dict[str, Any]:
-    """Converts a SQLAlchemy ORM object to a dictionary."""
+class ColumnHandler:
+    """
+    A column handler applying a transform to the columns selected by name,
+    DBAPI type code (cursor.description[i][1]) or predicate.
+
+    Example:
+        >>> ColumnResultHandler(ColumnHandler(str.lower, columns=["email"]))
+    """
+
+    def __init__(
+        self,
+        transform: Callable[[Any], Any],
+        columns: Collection[str] | None = None,
+        type_codes: Collection[Any] | None = None,
+        predicate: Callable[[str, Any], bool] | None = None,
+    ) -> None:
+        """
+        Args:
+            transform: Called with each value of the selected columns.
+            columns: Names of the columns to transform.
+            type_codes: DBAPI type codes of the columns to transform. Drivers
+                that do not report types (e.g. sqlite3) never match.
+            predicate: Called with the name and type code of each column,
+                returns True for the columns to transform.
+
+        A column is transformed if it matches any of the selectors.
+        """
+        if columns is None and type_codes is None and predicate is None:
+            raise ValueError("Select columns by name, type code or predicate.")
+        self.transform = transform
+        self.columns = columns
+        self.type_codes = type_codes
+        self.predicate = predicate
+
+    def column_transforms(
+        self, keys: Sequence[str], description: Sequence[Sequence[Any]] | None
+    ) -> dict[str, Callable[[Any], Any]]:
+        type_codes = (
+            [column[1] for column in description]
+            if description is not None and len(description) == len(keys)
+            else [None] * len(keys)
+        )
+        return {
+            key: self.transform
+            for key, type_code in zip(keys, type_codes, strict=False)
+            if (self.columns is not None and key in self.columns)
+            or (
+                self.type_codes is not None
+                and type_code is not None
+                and type_code in self.type_codes
+            )
+            or (self.predicate is not None and self.predicate(key, type_code))
+        }
+
+
+def _compose(transforms: Sequence[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Chain transforms, applied in order."""
+
+    def composed(value: Any) -> Any:
+        for transform in transforms:
+            value = transform(value)
+        return value
+
+    return composed
+
+
+class ColumnResultHandler:
+    """
+    Result handler applying column handlers (see
+    :class:`elixirdb.types.ColumnHandlerProtocol`) row by row.
+
+    The column handlers are asked once per result which columns they
+    transform, given result.keys() and cursor.description. The transforms are
+    compiled into a list of (column index, transform), so each row only
+    visits the columns that are transformed. Several transforms of the same
+    column are applied in the order of the handlers.
+
+    A Result is consumed and returned as a list of dicts (or tuples with
+    as_dict=False); use it before other result handlers expecting rows. A
+    list of dicts (e.g. from an earlier handler) is transformed by key.
+    Other results are returned unchanged.
+    """
+
+    def __init__(
+        self,
+        *handlers: ColumnHandlerProtocol,
+        as_dict: bool = True,
+        skip_none: bool = True,
+    ) -> None:
+        """
+        Args:
+            handlers: The column handlers.
+            as_dict: Return rows of a Result as dicts instead of tuples.
+            skip_none: Do not call transforms with None values.
+        """
+        self.handlers = handlers
+        self.as_dict = as_dict
+        self.skip_none = skip_none
+
+    def compile(
+        self, keys: Sequence[str], description: Sequence[Sequence[Any]] | None
+    ) -> list[tuple[int, Callable[[Any], Any]]]:
+        """Return the (column index, transform) pairs for a result schema."""
+        transforms: dict[str, list[Callable[[Any], Any]]] = {}
+        for handler in self.handlers:
+            for key, transform in handler.column_transforms(
+                keys, description
+            ).items():
+                transforms.setdefault(key, []).append(transform)
+        index = {key: i for i, key in enumerate(keys)}
+        return [
+            (index[key], found[0] if len(found) == 1 else _compose(found))
+            for key, found in transforms.items()
+            if key in index
+        ]
+
+    def __call__(self, result: Any) -> Any:
+        if isinstance(result, Result):
+            if not getattr(result, "returns_rows", True):
+                return result
+            return self._process_result(result)
+        if isinstance(result, list) and result and isinstance(result[0], Mapping):
+            return self._process_mappings(result)
+        return result
+
+    def _process_result(self, result: Result) -> list[Any]:
+        keys = tuple(result.keys())
+        cursor = getattr(result, "cursor", None)
+        description = cursor.description if cursor is not None else None
+        compiled = self.compile(keys, description)
+        skip_none = self.skip_none
+        rows = []
+        for row in result.all():
+            values = list(row)
+            for i, transform in compiled:
+                value = values[i]
+                if value is not None or not skip_none:
+                    values[i] = transform(value)
+            rows.append(
+                dict(zip(keys, values, strict=False))
+                if self.as_dict
+                else tuple(values)
+            )
+        return rows
+
+    def _process_mappings(self, rows: list[Mapping[str, Any]]) -> list[Any]:
+        keys = tuple(rows[0].keys())
+        compiled = [(keys[i], t) for i, t in self.compile(keys, None)]
+        if not compiled:
+            return rows
+        skip_none = self.skip_none
+        processed = []
+        for row in rows:
+            row = dict(row)
+            for key, transform in compiled:
+                if key in row:
+                    value = row[key]
+                    if value is not None or not skip_none:
+                        row[key] = transform(value)
+            processed.append(row)
+        return processed
+
+
+@lru_cache(maxsize=None)
+def _column_keys(cls: type) -> tuple[str, ...]:
+    """The column attribute names of a mapped class, in table order."""
+    mapper = sa_inspect(cls, raiseerr=False)
+    if mapper is not None and hasattr(mapper, "column_attrs"):
+        return tuple(attr.key for attr in mapper.column_attrs)
+    return tuple(c.key for c in cls.__table__.columns)  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=None)
+def _relationship_keys(cls: type) -> tuple[str, ...]:
+    """The relationship names of a mapped class."""
+    mapper = sa_inspect(cls, raiseerr=False)
+    if mapper is None or not hasattr(mapper, "relationships"):
+        return ()
+    return tuple(mapper.relationships.keys())
+
+
+@lru_cache(maxsize=1024)
+def _row_getter(
+    cls: type, columns: tuple[str, ...] | None
+) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    """
+    The keys and a getter returning their values as a tuple for a mapped
+    class, optionally restricted to a subset of columns.
+
+    Loaded column values live in the instance __dict__, so they are read
+    with an itemgetter, bypassing the instrumented attributes. Objects with
+    expired or unloaded columns are read through the attributes.
+    """
+    keys = _column_keys(cls)
+    if columns is not None:
+        keys = tuple(key for key in keys if key in columns)
+    if not keys:
+        return keys, lambda _: ()
+    if len(keys) == 1:
+        key = keys[0]
+        return keys, lambda obj: (getattr(obj, key),)
+    get_items = itemgetter(*keys)
+    get_attributes = attrgetter(*keys)
+
+    def getter(obj: Any) -> tuple[Any, ...]:
+        try:
+            return get_items(obj.__dict__)
+        except (KeyError, AttributeError):
+            return get_attributes(obj)
+
+    return keys, getter
+
+
+def to_dict(
+    obj: Any,
+    columns: Collection[str] | None = None,
+    depth: int = 0,
+) -> dict[str, Any]:
+    """
+    Converts a SQLAlchemy ORM object to a dictionary.
+
+    The column keys and an attrgetter are cached per mapped class.
+
+    Args:
+        obj: The ORM object.
+        columns: Only include these columns. All columns by default.
+        depth: Include relationships up to this depth, as dicts (or lists
+            of dicts). Relationships are loaded if they are not yet.
+    """
     if obj is None:
         return {}
-    return {c.key: getattr(obj, c.key) for c in obj.__table__.columns}
+    cls = type(obj)
+    keys, getter = _row_getter(cls, None if columns is None else tuple(columns))
+    data = dict(zip(keys, getter(obj), strict=False))
+    if depth > 0:
+        for key in _relationship_keys(cls):
+            value = getattr(obj, key)
+            if value is None:
+                data[key] = None
+            elif isinstance(value, (list, set, tuple)):
+                data[key] = [to_dict(item, depth=depth - 1) for item in value]
+            else:
+                data[key] = to_dict(value, depth=depth - 1)
+    return data
 
 
-def orm_result_to_list_of_dicts(objects: Any) -> list[Any]:
-    """Converts a list of SQLAlchemy ORM objects to a list of dictionaries."""
-    return [to_dict(obj) for obj in objects]
+def orm_result_to_list_of_dicts(
+    objects: Any,
+    columns: Collection[str] | None = None,
+    depth: int = 0,
+) -> list[Any]:
+    """
+    Converts a list of SQLAlchemy ORM objects to a list of dictionaries.
+
+    See :func:`to_dict` for columns and depth.
+    """
+    if depth > 0:
+        return [to_dict(obj, columns, depth) for obj in objects]
+    subset = None if columns is None else tuple(columns)
+    getters: dict[type, tuple[tuple[str, ...], Callable[[Any], Any]]] = {}
+    rows = []
+    for obj in objects:
+        if obj is None:
+            rows.append({})
+            continue
+        cls = type(obj)
+        found = getters.get(cls)
+        if found is None:
+            found = getters[cls] = _row_getter(cls, subset)
+        keys, getter = found
+        rows.append(dict(zip(keys, getter(obj), strict=False)))
+    return rows
 
 
 def check_to_dict_method(obj: Any) -> bool:
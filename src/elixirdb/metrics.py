@@ -0,0 +1,255 @@
+"""
+Query timing instrumentation.
+
+When `metrics` is enabled on an engine, ElixirDB records how long each phase
+of a statement takes (parameter processing, execution, fetching and result
+handlers) in :data:`query_metrics`, aggregated per engine_key and normalized
+statement in fixed-size latency histograms.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from functools import partial
+from typing import Any
+from sqlalchemy.sql.elements import TextClause
+from elixirdb.utils.cache import LRUCache
+
+
+# The phases of a statement that are timed.
+PHASES = ("params", "execute", "fetch", "handlers")
+
+# Quantiles reported for every histogram.
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Histogram bucket upper bounds in seconds: 1us to ~1000s, 4 buckets per
+# doubling (a relative error of at most ~19%).
+_BUCKET_GROWTH = 2 ** (1 / 4)
+BUCKET_BOUNDS = tuple(1e-6 * _BUCKET_GROWTH**i for i in range(121))
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Statement label used once a QueryMetrics holds max_statements statements.
+OTHER_STATEMENTS = "<other>"
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(sql: str) -> str:
+    """
+    Normalize a SQL string into a label shared by statements that only differ
+    in literal values: literals become `?`, lists of literals `(?)` and
+    whitespace is collapsed. Bind parameter names are kept.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _VALUE_LISTS.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+# Labels of SQLAlchemy statements keyed by their cache key, which is the same
+# for statements that only differ in bound values.
+_construct_labels: LRUCache[Any, str] = LRUCache(maxsize=1024)
+
+
+def _compile_label(statement: Any) -> str:
+    return normalize_statement(str(statement))
+
+
+def statement_label(statement: Any) -> str:
+    """
+    Return the normalized label of a str, TextClause or SQLAlchemy statement.
+
+    SQLAlchemy statements are compiled to a string once per cache key, not on
+    every execute.
+    """
+    if isinstance(statement, TextClause):
+        return normalize_statement(statement.text)
+    if isinstance(statement, str):
+        return normalize_statement(statement)
+    if statement is None:
+        return ""
+    generate_key = getattr(statement, "_generate_cache_key", None)
+    cache_key = generate_key() if generate_key is not None else None
+    if cache_key is None:
+        # The statement is not cacheable (e.g. a custom construct).
+        return _compile_label(statement)
+    return _construct_labels.get_or_set(
+        cache_key.key, partial(_compile_label, statement)
+    )
+
+
+class LatencyHistogram:
+    """
+    A latency histogram with fixed logarithmic buckets.
+
+    Recording is O(log buckets) and memory is constant, and histograms can be
+    merged, so quantiles can be computed for any aggregation.
+    """
+
+    __slots__ = ("count", "counts", "max", "min", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration in seconds."""
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the samples of another histogram."""
+        self.counts = [
+            a + b for a, b in zip(self.counts, other.counts, strict=False)
+        ]
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Return the estimated q-quantile (0 <= q <= 1) in seconds. The upper
+        bound of the bucket holding the quantile is returned, capped by the
+        largest recorded value.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index == len(BUCKET_BOUNDS):
+                    return self.max
+                return min(BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the count, sum, min, max and quantiles of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            **{f"p{round(q * 100)}": self.quantile(q) for q in QUANTILES},
+        }
+
+
+class QueryMetrics:
+    """
+    Thread-safe latency histograms keyed by engine_key, normalized statement
+    and phase.
+
+    At most max_statements distinct statements are tracked per engine; later
+    statements are aggregated under the `<other>` label so the number of
+    histograms stays bounded.
+    """
+
+    def __init__(self, max_statements: int = 1000) -> None:
+        self.max_statements = max_statements
+        self._histograms: dict[tuple[str, str, str], LatencyHistogram] = {}
+        self._statements: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, engine_key: str, statement: str, phase: str, seconds: float
+    ) -> None:
+        """Record the duration of a phase of a statement."""
+        key = (engine_key, statement, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                statements = self._statements.setdefault(engine_key, set())
+                if (
+                    statement not in statements
+                    and len(statements) >= self.max_statements
+                ):
+                    statement = OTHER_STATEMENTS
+                    key = (engine_key, statement, phase)
+                statements.add(statement)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def reset(self) -> None:
+        """Remove all histograms."""
+        with self._lock:
+            self._histograms.clear()
+            self._statements.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export the histograms.
+
+        Returns:
+            dict: `engines` maps engine_key -> phase -> stats aggregated over
+                all statements, and `statements` maps engine_key ->
+                statement -> phase -> stats. Stats hold the count, sum, min,
+                max, p50, p95 and p99 in seconds.
+        """
+        engines: dict[str, dict[str, LatencyHistogram]] = {}
+        statements: dict[str, dict[str, dict[str, Any]]] = {}
+        with self._lock:
+            for key, histogram in self._histograms.items():
+                engine_key, statement, phase = key
+                total = engines.setdefault(engine_key, {}).setdefault(
+                    phase, LatencyHistogram()
+                )
+                total.merge(histogram)
+                statements.setdefault(engine_key, {}).setdefault(statement, {})[
+                    phase
+                ] = histogram.to_dict()
+        return {
+            "engines": {
+                engine_key: {phase: h.to_dict() for phase, h in phases.items()}
+                for engine_key, phases in engines.items()
+            },
+            "statements": statements,
+        }
+
+    def to_prometheus(self, name: str = "elixirdb_query_duration_seconds") -> str:
+        """
+        Export the histograms in the Prometheus text exposition format, as a
+        summary with p50/p95/p99 quantiles per engine_key, statement and phase.
+        """
+        lines = [
+            f"# HELP {name} Duration of ElixirDB statement phases in seconds.",
+            f"# TYPE {name} summary",
+        ]
+        with self._lock:
+            items = [(key, h.to_dict()) for key, h in self._histograms.items()]
+        for (engine_key, statement, phase), stats in sorted(items):
+            labels = (
+                f'engine_key="{_escape(engine_key)}",'
+                f'statement="{_escape(statement)}",phase="{phase}"'
+            )
+            for q in QUANTILES:
+                value = stats[f"p{round(q * 100)}"]
+                lines.append(f'{name}{{{labels},quantile="{q}"}} {value!r}')
+            lines.append(f"{name}_sum{{{labels}}} {stats['sum']!r}")
+            lines.append(f"{name}_count{{{labels}}} {stats['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# The metrics recorded by ElixirDB instances with `metrics` enabled.
+query_metrics = QueryMetrics()
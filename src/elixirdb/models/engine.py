@@ -33,6 +33,16 @@ driver_map = {
     Dialect.SQLITE: "sqlite",
 }
 
+# Async drivers used by AsyncElixirDB in place of the default drivers above.
+async_driver_map = {
+    Dialect.MYSQL: "mysql+aiomysql",
+    Dialect.MARIADB: "mariadb+aiomysql",
+    Dialect.MSSQL: "mssql+aioodbc",
+    Dialect.POSTGRESQL: "postgresql+asyncpg",
+    Dialect.ORACLE: "oracle+oracledb_async",
+    Dialect.SQLITE: "sqlite+aiosqlite",
+}
+
 
 class UrlParams(StrictModel):
     """
@@ -166,6 +176,43 @@ class EngineModel(StrictModel):
         ),
         examples=["'SELECT 1' -> textclause('SELECT 1')"],
     )
+    textclause_cache_size: int = Field(
+        500,
+        ge=0,
+        description=(
+            "Number of TextClause objects built from raw string statements to "
+            "keep in an LRU cache. 0 disables the cache."
+        ),
+    )
+    result_cache: bool = Field(
+        False,
+        description=(
+            "Cache the results of read statements executed outside of a write "
+            "transaction. Cached results are invalidated when a DML statement "
+            "executed through ElixirDB touches one of their tables."
+        ),
+    )
+    result_cache_ttl: float = Field(
+        60.0,
+        gt=0,
+        description="Seconds a cached result is reused before it expires.",
+    )
+    metrics: bool = Field(
+        False,
+        description=(
+            "Record the parameter processing, execution, fetch and handler "
+            "time of each statement in elixirdb.metrics.query_metrics."
+        ),
+    )
+    slow_query_threshold: float | None = Field(
+        None,
+        gt=0,
+        description=(
+            "Record statements that take at least this many seconds to "
+            "execute in elixirdb.slowlog.slow_query_log. Parameters are "
+            "redacted when engine_options.hide_parameters is set."
+        ),
+    )
     url: str | None = Field(
         None,
         description=("SQLAlchemy database connection url string."),
@@ -190,6 +237,15 @@ class EngineModel(StrictModel):
         None,
         description="Options passed into create_engine. See :class:`EngineOptions`",
     )
+    shared_engine: bool | None = Field(
+        None,
+        description=(
+            "Share one engine (and connection pool) between all instances that "
+            "use the same engine_key, url and engine_options. Shared by default, "
+            "except for in-memory SQLite databases. See "
+            ":class:`elixirdb.registry.EngineRegistry`"
+        ),
+    )
     statements: Statements = Field(default_factory=Statements)
     meta: dict[str, Any] = Field(
         default_factory=dict, description="Unused dictionary field. "
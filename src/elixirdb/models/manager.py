@@ -18,6 +18,30 @@ from elixirdb.models.engine import driver_map
 from elixirdb.models.model import StrictModel
 from elixirdb.types import DriverMapping
 from elixirdb.types import EngineKey
+from elixirdb.types import ReplicaPolicy
+
+
+class ReplicaRoute(StrictModel):
+    """
+    Routing configuration for a logical database with one primary engine and
+    read replicas. Reads (SELECT statements) executed outside of a write
+    transaction are sent to a replica selected by the policy; everything else
+    goes to the primary.
+    """
+
+    primary: EngineKey = Field(description="The engine_key of the primary engine.")
+    replicas: list[EngineKey] = Field(
+        default_factory=list,
+        description="The engine_keys of the replica engines.",
+    )
+    policy: ReplicaPolicy = Field(
+        "round_robin",
+        description=(
+            "The load balancing policy used to select a replica. "
+            "`least_checked_out` uses the pool with the fewest connections in "
+            "use, `latency_weighted` favors replicas with lower average latency."
+        ),
+    )
 
 
 class EngineManager(StrictModel):
@@ -89,6 +113,17 @@ class EngineManager(StrictModel):
         description=("Controls debug mode for all engines"),
     )
 
+    routes: Mapping[str, ReplicaRoute] | None = Field(
+        None,
+        description=(
+            """
+            A mapping of logical database names to a primary engine and its
+            read replicas. Use the route name as the engine_key to enable
+            read replica routing.
+            """
+        ),
+    )
+
     @model_validator(mode="before")
     @classmethod
     def update_configs_with_default_values(
@@ -143,6 +178,26 @@ class EngineManager(StrictModel):
                 self.set_default_engine_key(engine_key)
         return self
 
+    @model_validator(mode="after")
+    def validate_routes(self) -> Self:
+        """Ensure routes reference configured engines and do not shadow them."""
+        for name, route in (self.routes or {}).items():
+            if name in self.engines:
+                raise ValueError(
+                    f"Route `{name}` has the same name as an engine. Route names "
+                    "must be different from engine keys."
+                )
+            unknown = [
+                key
+                for key in (route.primary, *route.replicas)
+                if key not in self.engines
+            ]
+            if unknown:
+                raise ValueError(
+                    f"Route `{name}` references unknown engines {unknown}."
+                )
+        return self
+
     @classmethod
     def set_default_engine_key(cls, engine_key: EngineKey) -> None:
         """
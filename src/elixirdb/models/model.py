@@ -4,8 +4,10 @@ Base Models
 
 from __future__ import annotations
 
+from typing import Any
 from pydantic import BaseModel
 from pydantic import ConfigDict
+from pydantic import PrivateAttr
 
 
 class StrictModel(BaseModel):
@@ -20,3 +22,16 @@ class StrictModel(BaseModel):
         str_strip_whitespace=True,
         use_enum_values=True,
     )
+
+    # Set on models shared between instances, see elixirdb.base.shared_config.
+    _frozen: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        private = getattr(self, "__pydantic_private__", None)
+        if private and private.get("_frozen") and not name.startswith("_"):
+            raise TypeError(
+                f"{type(self).__name__} is shared between instances (share_config) "
+                "and cannot be changed. Change a copy from "
+                "elixirdb.base.copy_model() instead."
+            )
+        super().__setattr__(name, value)
@@ -0,0 +1,189 @@
+"""
+Process-wide registry of SQLAlchemy engines.
+
+Every ElixirDB instance that targets the same engine configuration reuses a
+single :class:`sqlalchemy.engine.Engine` (and therefore a single connection
+pool) instead of creating one per instance.
+"""
+
+# pylint: disable=W0212
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from sqlalchemy import URL
+from sqlalchemy import create_engine
+from sqlalchemy import make_url
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from elixirdb.models.engine import EngineModel
+
+
+EngineRegistryKey = tuple[str, str, str]
+
+
+def engine_options_of(model: EngineModel) -> dict[str, Any]:
+    """Return the options passed to create_engine for an EngineModel."""
+    if not model.engine_options:
+        return {}
+    return model.engine_options.model_dump(exclude_unset=True, exclude_none=True)
+
+
+def shares_engine(model: EngineModel, url: str | URL) -> bool:
+    """
+    Check if the instances using an engine configuration share its engine.
+
+    Engines are shared unless `shared_engine` is False. When it is not set,
+    in-memory SQLite databases are not shared, since every instance would
+    otherwise use the same database.
+    """
+    if model.shared_engine is not None:
+        return model.shared_engine
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite":
+        return True
+    return url.database not in (None, "", ":memory:")
+
+
+def make_registry_key(
+    model: EngineModel, url: str | URL, engine_key: str | None = None
+) -> EngineRegistryKey:
+    """
+    Build the registry key for an engine configuration.
+
+    The key is made of the engine_key, the rendered url (including the
+    password, so different credentials do not share a pool) and the
+    engine_options serialized with sorted keys. Values that are not JSON
+    serializable (e.g. a `creator` callable) are keyed by their repr.
+    """
+    if isinstance(url, URL):
+        url = url.render_as_string(hide_password=False)
+    options = json.dumps(engine_options_of(model), sort_keys=True, default=repr)
+    return (engine_key or "", url, options)
+
+
+class EngineRegistry:
+    """
+    Thread-safe mapping of engine configurations to SQLAlchemy engines.
+
+    Engines are created on first request and shared afterwards. Use
+    :meth:`dispose_all` to release every pool (e.g. on application shutdown)
+    and :meth:`after_fork` in a forked child process so connections
+    inherited from the parent are never reused.
+    """
+
+    def __init__(self, factory: Callable[..., Any] = create_engine) -> None:
+        # The function used to create engines (create_engine or
+        # create_async_engine).
+        self.factory = factory
+        self._engines: dict[EngineRegistryKey, Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def __contains__(self, key: EngineRegistryKey) -> bool:
+        return key in self._engines
+
+    def get_engine(
+        self, model: EngineModel, url: str | URL, engine_key: str | None = None
+    ) -> Engine:
+        """
+        Return the shared engine for the configuration, creating it if needed.
+
+        Args:
+            model: The validated engine configuration.
+            url: The url string or URL object to connect with.
+            engine_key: The key of the engine in an EngineManager config.
+
+        Returns:
+            Engine: The engine shared by all instances using the configuration.
+        """
+        key = make_registry_key(model, url, engine_key)
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = self.factory(url, **engine_options_of(model))
+                self._engines[key] = engine
+        return engine
+
+    def dispose(self, key: EngineRegistryKey) -> None:
+        """Dispose a single engine and remove it from the registry."""
+        with self._lock:
+            engine = self._engines.pop(key, None)
+        if engine is not None:
+            _dispose(engine)
+
+    def dispose_all(self) -> None:
+        """
+        Dispose every registered engine and clear the registry.
+
+        Async engines can only drop their pooled connections without closing
+        them from synchronous code; use :meth:`dispose_all_async` to close them.
+        """
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            _dispose(engine)
+
+    async def dispose_all_async(self) -> None:
+        """Dispose every registered engine, awaiting async engines."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            if hasattr(engine, "sync_engine"):
+                await engine.dispose()
+            else:
+                engine.dispose()
+
+    def after_fork(self) -> None:
+        """
+        Reset pools in a forked child process.
+
+        Pools are disposed with ``close=False`` so the child drops the
+        connections inherited from the parent without closing them, which
+        would otherwise interfere with the parent's use of them.
+        """
+        # The lock may have been held by another thread at fork time.
+        self._lock = threading.Lock()
+        for engine in self._engines.values():
+            _sync_engine(engine).dispose(close=False)
+
+
+def _sync_engine(engine: Any) -> Engine:
+    """Return the synchronous Engine behind an engine or AsyncEngine."""
+    return getattr(engine, "sync_engine", engine)
+
+
+def _dispose(engine: Any) -> None:
+    """Dispose an engine from synchronous code."""
+    if hasattr(engine, "sync_engine"):
+        # Async connections cannot be closed without an event loop.
+        engine.sync_engine.dispose(close=False)
+    else:
+        engine.dispose()
+
+
+# The registry used by ElixirDB instances.
+engine_registry = EngineRegistry()
+
+
+def dispose_all() -> None:
+    """Dispose all engines in the process-wide registry."""
+    engine_registry.dispose_all()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=engine_registry.after_fork)
@@ -0,0 +1,143 @@
+"""
+Read replica routing.
+
+A :class:`ReplicaRouter` selects the replica engine a read statement is sent
+to, according to the load balancing policy of a
+:class:`elixirdb.models.manager.ReplicaRoute`.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+from sqlalchemy.sql.elements import TextClause
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from elixirdb.models.manager import ReplicaRoute
+    from elixirdb.types import EngineKey
+    from elixirdb.types import ReplicaPolicy
+
+
+# Leading whitespace and SQL comments before the first keyword.
+_LEADING = r"^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*"
+_READ_PATTERN = re.compile(_LEADING + r"(select|with)\b", re.IGNORECASE | re.DOTALL)
+_WRITE_PATTERN = re.compile(
+    r"\b(insert|update|delete|merge|into|for\s+update|for\s+share)\b", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def is_read_sql(sql: str) -> bool:
+    """
+    Check if a raw SQL string is a read-only query (SELECT or WITH ... SELECT)
+    that does not write, lock rows (FOR UPDATE) or select INTO a table.
+    """
+    return bool(_READ_PATTERN.match(sql)) and not _WRITE_PATTERN.search(sql)
+
+
+def is_read_statement(statement: Any) -> bool:
+    """
+    Check if a statement (str, TextClause or SQLAlchemy construct) can be
+    executed on a read replica.
+    """
+    if isinstance(statement, str):
+        return is_read_sql(statement)
+    if isinstance(statement, TextClause):
+        return is_read_sql(statement.text)
+    return bool(getattr(statement, "is_select", False)) and (
+        getattr(statement, "_for_update_arg", None) is None
+    )
+
+
+class ReplicaRouter:
+    """
+    Selects a replica for read statements and tracks replica latency.
+
+    Routers are shared by all instances using the same route (see
+    :func:`get_router`), so round robin and latency statistics are
+    process-wide.
+    """
+
+    # Weight of the latest sample in the latency moving average.
+    latency_alpha: float = 0.2
+
+    def __init__(self, replicas: list[EngineKey], policy: ReplicaPolicy) -> None:
+        if not replicas:
+            raise ValueError("A router requires at least one replica.")
+        self.replicas = list(replicas)
+        self.policy = policy
+        self.latencies: dict[EngineKey, float] = {}
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def choose(self, engines: dict[EngineKey, Engine] | None = None) -> EngineKey:
+        """
+        Select the replica for the next read.
+
+        Args:
+            engines: The replica engines by key. Used by `least_checked_out`.
+
+        Returns:
+            EngineKey: The engine_key of the selected replica.
+        """
+        if self.policy == "least_checked_out" and engines:
+            return min(
+                self.replicas, key=lambda key: _checked_out(engines.get(key))
+            )
+        if self.policy == "latency_weighted" and self.latencies:
+            return self._choose_by_latency()
+        return self._next()
+
+    def record(self, replica: EngineKey, seconds: float) -> None:
+        """Add a latency sample for a replica to its moving average."""
+        with self._lock:
+            previous = self.latencies.get(replica)
+            self.latencies[replica] = (
+                seconds
+                if previous is None
+                else previous + self.latency_alpha * (seconds - previous)
+            )
+
+    def _next(self) -> EngineKey:
+        with self._lock:
+            replica = self.replicas[self._index % len(self.replicas)]
+            self._index += 1
+        return replica
+
+    def _choose_by_latency(self) -> EngineKey:
+        # Replicas without samples yet get the best known latency so they are
+        # tried as well.
+        best = min(self.latencies.values())
+        weights = [
+            1 / max(self.latencies.get(key, best), 1e-6) for key in self.replicas
+        ]
+        return random.choices(self.replicas, weights=weights)[0]  # noqa: S311
+
+
+def _checked_out(engine: Engine | None) -> int:
+    """Return the number of connections checked out from an engine's pool."""
+    checkedout = getattr(getattr(engine, "pool", None), "checkedout", None)
+    return checkedout() if callable(checkedout) else 0
+
+
+# Routers shared by every instance using the same route.
+_ROUTERS: dict[tuple[str, tuple[str, ...], str], ReplicaRouter] = {}
+_ROUTERS_LOCK = threading.Lock()
+
+
+def get_router(route: ReplicaRoute) -> ReplicaRouter | None:
+    """Return the process-wide router for a route, or None without replicas."""
+    if not route.replicas:
+        return None
+    key = (route.primary, tuple(route.replicas), route.policy)
+    with _ROUTERS_LOCK:
+        router = _ROUTERS.get(key)
+        if router is None:
+            router = _ROUTERS[key] = ReplicaRouter(route.replicas, route.policy)
+    return router
@@ -0,0 +1,124 @@
+"""
+Slow query log.
+
+When `slow_query_threshold` is set on an engine, ElixirDB records statements
+whose execution takes at least that many seconds in :data:`slow_query_log`.
+Statements are identified by their fingerprint (see
+:func:`elixirdb.utils.db_utils.statement_fingerprint`) and only the slowest
+entries are kept, so the log stays bounded however many statements are slow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import threading
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import count
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+
+# Replaces parameter values for engines with `hide_parameters` enabled.
+REDACTED = "[REDACTED]"
+
+DEFAULT_MAX_ENTRIES = 100
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    """A statement that took longer than the slow query threshold."""
+
+    fingerprint: str
+    statement: str
+    duration: float
+    engine_key: str = ""
+    parameters: Any = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def fingerprint_id(self) -> str:
+        """A short stable hash of the fingerprint, to group entries."""
+        return hashlib.sha256(self.fingerprint.encode()).hexdigest()[:16]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "fingerprint_id": self.fingerprint_id}
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace the values of statement parameters, keeping their names."""
+    if isinstance(parameters, dict):
+        return dict.fromkeys(parameters, REDACTED)
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(p) for p in parameters]
+    return None if parameters is None else REDACTED
+
+
+class SlowQueryLog:
+    """
+    The slowest statements recorded, up to max_entries.
+
+    Entries are kept in a min-heap on duration: once the log is full, a new
+    entry replaces the fastest one if it is slower, in O(log max_entries).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0.")
+        self.max_entries = max_entries
+        self._heap: list[tuple[float, int, SlowQuery]] = []
+        self._counter = count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def record(self, entry: SlowQuery) -> None:
+        """Add an entry, dropping the fastest entry if the log is full."""
+        item = (entry.duration, next(self._counter), entry)
+        with self._lock:
+            if len(self._heap) < self.max_entries:
+                heapq.heappush(self._heap, item)
+            elif entry.duration > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def entries(self) -> list[SlowQuery]:
+        """Return the entries, slowest first."""
+        with self._lock:
+            items = sorted(self._heap, reverse=True)
+        return [entry for _, _, entry in items]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._heap.clear()
+
+    def dump_jsonl(self, destination: str | Path | IO[str]) -> int:
+        """
+        Write the entries, slowest first, as one JSON object per line.
+
+        Args:
+            destination: A path or a text file object.
+
+        Returns:
+            int: The number of entries written.
+        """
+        entries = self.entries()
+        lines = (
+            json.dumps(entry.to_dict(), default=str) + "\n" for entry in entries
+        )
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w", encoding="utf-8") as file:
+                file.writelines(lines)
+        else:
+            destination.writelines(lines)
+        return len(entries)
+
+
+# The slow statements of all ElixirDB instances with `slow_query_threshold` set.
+slow_query_log = SlowQueryLog()
@@ -60,8 +60,11 @@ DialectName: TypeAlias = str
 DriverName: TypeAlias = str  # e.g. "postgresql+psycopg2"
 DriverMapping: TypeAlias = Mapping[Dialect, DriverName]
 EngineKey: TypeAlias = str
+ReplicaPolicy: TypeAlias = Literal[
+    "round_robin", "least_checked_out", "latency_weighted"
+]
 
-EngineType: TypeAlias = Literal["direct", "session", "scoped"]
+EngineType: TypeAlias = Literal["direct", "session", "scoped", "async_session"]
 SessionType: TypeAlias = Session | Callable[[], Session]
 RowData: TypeAlias = Row[Any] | RowMapping | list[Row] | Any
 
@@ -356,6 +359,29 @@ class ResultHandlerCallable(Protocol):
     ) -> Any: ...
 
 
+class ColumnHandlerProtocol(Protocol):
+    """
+    Protocol for a column handler, a result handler variant that knows the
+    schema of a result. It is called once per result with the column names
+    (result.keys()) and the DBAPI cursor.description (None if unavailable),
+    and returns the transform to apply to each column it handles. Columns it
+    does not return are never visited.
+
+    Column handlers are applied by :class:`elixirdb.handlers.ColumnResultHandler`.
+
+    Example:
+        >>> class Lowercase(ColumnHandlerProtocol):
+        ...     def column_transforms(self, keys, description):
+        ...         return {key: str.lower for key in keys if key == "email"}
+    """
+
+    def column_transforms(
+        self,
+        keys: Sequence[str],
+        description: Sequence[Sequence[Any]] | None,
+    ) -> Mapping[str, Callable[[Any], Any]]: ...
+
+
 class ParamHandlerCallable(Protocol):
     """
     Protocol to do parameter pre-processing before a query is executed
@@ -0,0 +1,329 @@
+"""
+Bounded caches used to memoize statement construction and other work that
+is repeated for the same inputs.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Iterable
+from typing import TypeVar
+import sqlite3
+
+
+if TYPE_CHECKING:
+    import os
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass(slots=True)
+class ResultCacheStats(CacheStats):
+    """Counters for a ResultCache."""
+
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe least recently used cache with hit/miss/eviction counters.
+
+    A maxsize of 0 disables caching; every lookup is a miss and nothing
+    is stored.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater than or equal to 0.")
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for key, or default if it is not cached."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._stats.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value  # type: ignore[return-value]
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_set(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Return the cached value for key, or build it with factory and cache it.
+
+        The factory is called outside the lock, so two threads missing on the
+        same key may both build the value; the last one is kept.
+        """
+        value = self.get(key, _MISSING)  # type: ignore[arg-type]
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss/eviction counters with the size of the cache."""
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+class DiskCache:
+    """
+    A persistent string key/value cache stored in a sqlite database file.
+
+    Used as a second level behind an LRUCache so warm processes can reuse
+    values computed by earlier processes. Access is serialized with a lock,
+    so a single instance can be shared between threads.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        """Return the stored value for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value for key, replacing any existing value."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def clear(self) -> None:
+        """Remove all stored values."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the underlying sqlite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def estimate_size(rows: Iterable[Iterable[Any]]) -> int:
+    """
+    Estimate the memory used by rows of values in bytes.
+
+    Only the rows and their values are counted (not objects referenced by
+    the values), which is accurate for the scalar values returned by DBAPI
+    drivers.
+    """
+    getsizeof = sys.getsizeof
+    return sum(
+        getsizeof(row) + sum(getsizeof(value) for value in row) for row in rows
+    )
+
+
+@dataclass(slots=True)
+class _ResultCacheEntry:
+    value: Any
+    size: int
+    expires: float
+    tags: frozenset[Hashable]
+
+
+class ResultCache:
+    """
+    A thread-safe LRU cache bounded by the estimated memory of its values,
+    with a time to live per entry and invalidation by tag.
+
+    Entries are tagged (e.g. with the tables a query reads) so every entry
+    depending on a tag can be dropped with :meth:`invalidate`. Every
+    invalidation also bumps the generation of its tags, so a value read
+    before an invalidation is not cached after it (see :meth:`generation`).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 2**20,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be greater than or equal to 0.")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.bytes = 0
+        self._data: OrderedDict[Hashable, _ResultCacheEntry] = OrderedDict()
+        self._tags: dict[Hashable, set[Hashable]] = {}
+        self._generations: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._stats = ResultCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                self._remove(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def generation(self, tags: Iterable[Hashable]) -> tuple[int, ...]:
+        """
+        Return the generations of tags, to pass to :meth:`set` for a value
+        computed afterwards.
+        """
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        *,
+        tags: Iterable[Hashable] = (),
+        ttl: float | None = None,
+        generation: tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Cache a value of the estimated size in bytes, evicting the least
+        recently used entries until the cache fits in max_bytes. Values
+        larger than max_bytes are not cached, nor are values whose tags were
+        invalidated since `generation` was taken.
+        """
+        if size > self.max_bytes:
+            return
+        tags = tuple(tags)
+        expires = self.clock() + (self.ttl if ttl is None else ttl)
+        entry = _ResultCacheEntry(value, size, expires, frozenset(tags))
+        with self._lock:
+            if generation is not None and generation != tuple(
+                self._generations.get(tag, 0) for tag in tags
+            ):
+                return
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = entry
+            self.bytes += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+                self._stats.evictions += 1
+
+    def invalidate(self, tags: Iterable[Hashable]) -> int:
+        """Remove every entry tagged with one of tags. Returns the count."""
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in self._tags.pop(tag, ()):
+                    if key in self._data:
+                        self._remove(key)
+                        removed += 1
+            self._stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters with the size of the cache."""
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "size": len(self._data),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self.bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
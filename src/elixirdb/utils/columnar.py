@@ -0,0 +1,162 @@
+"""
+Columnar fetching of results. Rows are pulled in fetchmany chunks and
+transposed into one container per column, avoiding the per-row dict
+creation of mappings.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from elixirdb.exc import NumpyNotInstalledError
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Result
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def fetch_columns(
+    result: Result, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict[str, list[Any]]:
+    """
+    Fetch the remaining rows of a result into a list per column.
+
+    Args:
+        result: The result to fetch from.
+        chunk_size: The number of rows to fetch per fetchmany call.
+
+    Returns:
+        dict[str, list[Any]]: A mapping of column name to column values.
+    """
+    keys = list(result.keys())
+    columns: list[list[Any]] = [[] for _ in keys]
+    while chunk := result.fetchmany(chunk_size):
+        for column, values in zip(columns, zip(*chunk, strict=False), strict=False):
+            column.extend(values)
+    return dict(zip(keys, columns, strict=False))
+
+
+def _import_numpy() -> Any:
+    """Import numpy, raising NumpyNotInstalledError if it is missing."""
+    try:
+        import numpy as np  # noqa: PLC0415 # pyright: ignore[reportMissingImports]
+    except ImportError:
+        raise NumpyNotInstalledError(  # noqa: B904
+            "NumPy is not installed. Install elixirdb[numpy] to fetch results "
+            "as NumPy arrays."
+        )
+    return np
+
+
+def infer_dtype(values: tuple[Any, ...]) -> str:
+    """
+    Infer a NumPy dtype from a sample of column values.
+
+    Integer columns with NULLs become float64 (NULL -> NaN). Columns mixing
+    types, or holding anything other than bool/int/float, use object.
+    """
+    types = {type(value) for value in values}
+    has_null = type(None) in types
+    types.discard(type(None))
+
+    if types == {bool}:
+        return "object" if has_null else "bool"
+    if types == {int}:
+        return "float64" if has_null else "int64"
+    if types and types <= {int, float}:
+        return "float64"
+    return "object"
+
+
+def _widen_dtype(np: Any, current: Any, values: tuple[Any, ...]) -> Any:
+    """
+    Return the dtype an array of `current` dtype needs to also hold `values`:
+    unchanged if their inferred dtype casts safely to it, float64 for mixed
+    numbers or NULLs in an int array, otherwise object.
+    """
+    if all(value is None for value in values):
+        incoming = np.dtype("float64" if current.kind in "iuf" else object)
+    else:
+        incoming = np.dtype(infer_dtype(values))
+    if np.can_cast(incoming, current, casting="safe"):
+        return current
+    if current.kind in "iuf" and incoming.kind in "iuf":
+        return np.result_type(current, incoming, np.float64)
+    return np.dtype(object)
+
+
+def fetch_numpy(
+    result: Result,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtypes: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch the remaining rows of a result into a NumPy array per column.
+
+    The dtype of each column is taken from `dtypes` if provided, otherwise it
+    is inferred from the first chunk (see :func:`infer_dtype`) and widened
+    (to float64, then object) when a later chunk does not cast safely to it.
+    Arrays are pre-allocated and filled chunk by chunk, doubling in capacity
+    when full, and trimmed to the number of rows fetched.
+
+    Args:
+        result: The result to fetch from.
+        chunk_size: The number of rows to fetch per fetchmany call.
+        dtypes: Optional mapping of column name to NumPy dtype.
+
+    Returns:
+        dict[str, numpy.ndarray]: A mapping of column name to array.
+
+    Raises:
+        NumpyNotInstalledError: If numpy is not installed.
+    """
+    np = _import_numpy()
+    dtypes = dtypes or {}
+    keys = list(result.keys())
+
+    chunk = result.fetchmany(chunk_size)
+    if not chunk:
+        return {
+            key: np.empty(0, dtype=dtypes.get(key, "object")) for key in keys
+        }
+
+    capacity = max(len(chunk), chunk_size)
+    arrays = [
+        np.empty(capacity, dtype=dtypes.get(key) or infer_dtype(values))
+        for key, values in zip(keys, zip(*chunk, strict=False), strict=False)
+    ]
+    inferred = [key not in dtypes for key in keys]
+    size = 0
+
+    while chunk:
+        count = len(chunk)
+        if size + count > capacity:
+            capacity = max(capacity * 2, size + count)
+            arrays = [np.resize(array, capacity) for array in arrays]
+        for index, column in enumerate(zip(*chunk, strict=False)):
+            array = arrays[index]
+            values = column
+            if inferred[index] and array.dtype != object:
+                dtype = _widen_dtype(np, array.dtype, column)
+                if dtype != array.dtype:
+                    array = arrays[index] = array.astype(dtype)
+            if array.dtype.kind == "f" and None in values:
+                # NULLs in float columns become NaN.
+                values = [np.nan if value is None else value for value in values]
+            try:
+                array[size : size + count] = values
+            except (TypeError, ValueError, OverflowError):
+                # The values do not fit the dtype (e.g. NULLs in a given int
+                # dtype or ints beyond int64), fall back to an object array.
+                array = arrays[index] = array.astype(object)
+                array[size : size + count] = column
+        size += count
+        chunk = result.fetchmany(chunk_size)
+
+    return {
+        key: array[:size] if size == capacity else array[:size].copy()
+        for key, array in zip(keys, arrays, strict=False)
+    }
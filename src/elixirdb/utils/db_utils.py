@@ -8,17 +8,26 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 from typing import Any
-import sqlglot
-from sqlglot import exp
+from elixirdb.metrics import normalize_statement
+from elixirdb.utils.cache import DiskCache
+from elixirdb.utils.cache import LRUCache
+from elixirdb.utils.lazy import LazyModule
 
 
 if TYPE_CHECKING:
+    import os
+    import sqlglot
+    from sqlglot import exp
     from elixirdb.types import DialectName
     from elixirdb.types import HandlerSequence
     from elixirdb.types import SchemaName
     from elixirdb.types import SQLStatement
     from elixirdb.types import TableName
     from elixirdb.types import _CoreAnyExecuteParams
+else:
+    # sqlglot is only imported when a statement is parsed.
+    sqlglot = LazyModule("sqlglot")
+    exp = LazyModule("sqlglot.expressions")
 
 
 def is_stored_procedure(query: SQLStatement) -> bool:
@@ -154,34 +163,83 @@ def return_mapped_dialect(dialect: DialectName) -> str:
 def apply_schema_prefix(
     node: exp.Expression,
     schema_prefix: SchemaName,
-    cte_names: set[str],
-    dialect: DialectName,
+    cte_names: set[str] | None = None,
+    dialect: DialectName = "",
 ) -> None:
     """
     Apply schema prefix to table nodes within SQL AST.
 
+    The AST is walked iteratively with an explicit stack, so deeply nested
+    queries do not hit the recursion limit. Table nodes are collected during
+    the walk and prefixed afterwards, which allows the CTE names to be
+    collected in the same pass when cte_names is not provided.
+
     Args:
-        node: Current node in SQL AST
+        node: Root node of the SQL AST
         schema_prefix: Schema prefix to apply
-        cte_names: Set of CTE names to exclude from prefixing
+        cte_names: Set of CTE names to exclude from prefixing. Collected from
+            the AST if not provided.
         dialect: SQL dialect in use
     """
-    match node:
-        case exp.Table():
-            table_name = node.this.name.lower()
-            if table_name not in cte_names and not is_temp_table(
-                table_name, dialect
-            ):
-                node.set("db", exp.Identifier(this=schema_prefix))
+    # Resolve the node classes once; exp is a lazy proxy and attribute lookups
+    # through it are too slow for the per-node loop.
+    table_class = exp.Table
+    cte_class = exp.CTE
+    expression_class = exp.Expression
+
+    collect_ctes = cte_names is None
+    excluded: set[str] = set() if cte_names is None else cte_names
+    tables: list[exp.Table] = []
+    stack: list[exp.Expression] = [node]
+    push = stack.append
+    extend = stack.extend
+
+    while stack:
+        current = stack.pop()
+        if isinstance(current, table_class):
+            tables.append(current)
+        elif collect_ctes and isinstance(current, cte_class):
+            excluded.add(current.alias_or_name.lower())
+
+        for child in current.args.values():
+            if isinstance(child, expression_class):
+                push(child)
+            elif isinstance(child, list):
+                extend(item for item in child if isinstance(item, expression_class))
+
+    for table in tables:
+        table_name = table.this.name.lower()
+        if table_name not in excluded and not is_temp_table(table_name, dialect):
+            table.set("db", exp.Identifier(this=schema_prefix))
+
+
+# Memoized results of apply_schema_to_statement keyed on
+# (query, schema_prefix, dialect).
+schema_statement_cache: LRUCache[tuple[str, str, str], str] = LRUCache(maxsize=1024)
+
+# Optional persistent cache behind schema_statement_cache.
+_schema_disk_cache: DiskCache | None = None
+
+
+def set_schema_cache(
+    maxsize: int | None = None, path: str | os.PathLike[str] | None = None
+) -> None:
+    """
+    Configure the caches used by apply_schema_to_statement.
 
-    for child in node.args.values():
-        match child:
-            case exp.Expression():
-                apply_schema_prefix(child, schema_prefix, cte_names, dialect)
-            case list():
-                for item in child:
-                    if isinstance(item, exp.Expression):
-                        apply_schema_prefix(item, schema_prefix, cte_names, dialect)
+    Args:
+        maxsize: Number of rewritten statements to keep in memory. 0 disables
+            the in-memory cache.
+        path: Path of a sqlite file used to persist rewritten statements
+            across processes. Pass an empty string to disable it.
+    """
+    global schema_statement_cache, _schema_disk_cache  # noqa: PLW0603
+    if maxsize is not None:
+        schema_statement_cache = LRUCache(maxsize=maxsize)
+    if path is not None:
+        if _schema_disk_cache is not None:
+            _schema_disk_cache.close()
+        _schema_disk_cache = DiskCache(path) if path else None
 
 
 def apply_schema_to_statement(
@@ -190,6 +248,42 @@ def apply_schema_to_statement(
     """
     Modify SQL query by applying schema prefix to table references.
 
+    Results are memoized in memory (see `schema_statement_cache`) and,
+    if configured with `set_schema_cache(path=...)`, on disk.
+
+    Args:
+        query: Original SQL query to modify
+        schema_prefix: Schema prefix to apply
+        dialect: SQL dialect in use
+
+    Returns:
+        Modified SQL query with schema prefixes applied
+    """
+    key = (query, schema_prefix, dialect)
+    statement = schema_statement_cache.get(key)
+    if statement is not None:
+        return statement
+
+    disk_key = "\x00".join(key)
+    if _schema_disk_cache is not None:
+        statement = _schema_disk_cache.get(disk_key)
+
+    if statement is None:
+        statement = rewrite_statement_schema(query, schema_prefix, dialect)
+        if _schema_disk_cache is not None:
+            _schema_disk_cache.set(disk_key, statement)
+
+    schema_statement_cache.set(key, statement)
+    return statement
+
+
+def rewrite_statement_schema(
+    query: SQLStatement, schema_prefix: SchemaName, dialect: DialectName = "mysql"
+) -> SQLStatement:
+    """
+    Parse the query and apply the schema prefix to table references without
+    using the statement caches.
+
     Args:
         query: Original SQL query to modify
         schema_prefix: Schema prefix to apply
@@ -200,8 +294,7 @@ def apply_schema_to_statement(
     """
     dialect = return_mapped_dialect(dialect)
     ast = sqlglot.parse_one(query, read=dialect)
-    cte_names = {cte.alias_or_name.lower() for cte in ast.find_all(exp.CTE)}
-    apply_schema_prefix(ast, schema_prefix, cte_names, dialect)
+    apply_schema_prefix(ast, schema_prefix, dialect=dialect)
     return ast.sql(dialect=dialect)
 
 
@@ -231,6 +324,107 @@ def is_dml_query(statement: SQLStatement) -> bool:
         return False
 
 
+# Tables referenced by statements, keyed by SQL string.
+_statement_tables_cache: LRUCache[str, frozenset[str]] = LRUCache(maxsize=1024)
+_dml_tables_cache: LRUCache[str, frozenset[str]] = LRUCache(maxsize=1024)
+
+
+def _parse_tables(statement: SQLStatement) -> frozenset[str]:
+    try:
+        parsed = sqlglot.parse_one(statement)
+    except Exception:  # pylint: disable=broad-except
+        return frozenset()
+    ctes = {cte.alias_or_name.lower() for cte in parsed.find_all(exp.CTE)}
+    return frozenset(
+        name
+        for table in parsed.find_all(exp.Table)
+        if (name := table.name.lower()) and name not in ctes
+    )
+
+
+def statement_tables(statement: SQLStatement) -> frozenset[str]:
+    """
+    Return the lowercased names of the tables referenced by a statement.
+
+    CTE names are excluded. Returns an empty set if the statement cannot be
+    parsed. Results are memoized by statement.
+    """
+    return _statement_tables_cache.get_or_set(
+        statement, lambda: _parse_tables(statement)
+    )
+
+
+def dml_tables(statement: SQLStatement) -> frozenset[str]:
+    """
+    Return the tables referenced by a DML statement (see :func:`is_dml_query`),
+    or an empty set for other statements. Results are memoized by statement.
+    """
+    return _dml_tables_cache.get_or_set(
+        statement,
+        lambda: (
+            statement_tables(statement) if is_dml_query(statement) else frozenset()
+        ),
+    )
+
+
+# Fingerprints of statements, keyed by (SQL string, sqlglot dialect).
+_fingerprint_cache: LRUCache[tuple[str, str], str] = LRUCache(maxsize=1024)
+
+# The format/pyformat bind parameters of DBAPI drivers (e.g. psycopg2, pymysql),
+# which sqlglot does not parse for every dialect.
+_PYFORMAT_PARAMETER = re.compile(r"%\((\w+)\)s|%s")
+
+
+def _strip_literal(node: exp.Expression) -> exp.Expression:
+    """
+    Replace a literal with `?`, collapse IN lists of literals and render bind
+    parameters as `?` (positional) or `:name` (named) in every dialect.
+    """
+    if isinstance(node, exp.Literal):
+        return exp.Var(this="?")
+    if isinstance(node, exp.Placeholder):
+        name = node.this
+        if isinstance(name, exp.Identifier):
+            name = name.name
+        return exp.Var(this=f":{name}" if name else "?")
+    if isinstance(node, exp.Parameter) and isinstance(node.this, exp.Literal):
+        # Numbered parameters, e.g. $1.
+        return exp.Var(this="?")
+    if isinstance(node, exp.In) and node.expressions and all(
+        isinstance(e, (exp.Literal, exp.Placeholder)) for e in node.expressions
+    ):
+        node.set("expressions", [exp.Var(this="?")])
+    return node
+
+
+def _fingerprint(statement: SQLStatement, dialect: str) -> str:
+    statement = _PYFORMAT_PARAMETER.sub(
+        lambda match: f":{match[1]}" if match[1] else "?", statement
+    )
+    try:
+        parsed = sqlglot.parse_one(statement, read=dialect or None)
+        return parsed.transform(_strip_literal).sql(dialect=dialect or None)
+    except Exception:  # pylint: disable=broad-except
+        # Fall back to a regex normalization for statements sqlglot rejects.
+        return normalize_statement(statement)
+
+
+def statement_fingerprint(
+    statement: SQLStatement, dialect: DialectName | str = ""
+) -> str:
+    """
+    Return the fingerprint of a statement: the statement with every literal
+    replaced by `?`, IN lists of literals collapsed to `IN (?)` and formatting
+    normalized, so statements that only differ in values share a fingerprint.
+    Bind parameters are kept, written as `?` or `:name` whatever the dialect's
+    paramstyle. Results are memoized by statement and dialect.
+    """
+    dialect = return_mapped_dialect(dialect) or dialect  # type: ignore[arg-type]
+    return _fingerprint_cache.get_or_set(
+        (statement, dialect), lambda: _fingerprint(statement, dialect)
+    )
+
+
 def is_list_of_type(obj: Any, type_: type, subclass: bool = False) -> bool:
     """
     Check if an object is a list where all elements are of a specific type.
@@ -1,15 +1,61 @@
 """
-Module for parsing YAML/JSON configuration files. Support is present only for
-one file, but future iterations may parse entire directories and merge them
-as well as support for specific loading configurations in pyproject.toml.
+Module for finding and parsing YAML/JSON configuration files. Support is
+present only for one file, but future iterations may parse entire directories
+and merge them.
 """
 
 import json
+import os
+import tomllib
 from pathlib import Path
 from typing import Any
 from typing import Literal
-import yaml
-from pyrootutils import find_root
+from elixirdb.utils.lazy import LazyModule
+
+
+# yaml is only imported when a configuration file is read.
+yaml = LazyModule("yaml")
+
+
+# Environment variable with the path of the configuration file.
+CONFIG_ENV_VAR = "ELIXIRDB_CONFIG"
+
+# Directories never searched for configuration files.
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "env",
+        ".tox",
+        ".nox",
+        "node_modules",
+        "site-packages",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "build",
+        "dist",
+        ".eggs",
+    }
+)
+
+# How many directory levels below the project root are searched.
+DEFAULT_SEARCH_DEPTH = 3
+
+
+def find_root(*args: Any, **kwargs: Any) -> Path:
+    """
+    Find the project root. See :func:`pyrootutils.find_root`.
+
+    pyrootutils is imported on first use.
+    """
+    from pyrootutils import find_root as _find_root  # noqa: PLC0415
+
+    return _find_root(*args, **kwargs)
 
 
 def scan_files(partial: str, type: str | None = None) -> list[Path]:
@@ -28,6 +74,131 @@ def scan_files(partial: str, type: str | None = None) -> list[Path]:
     return list(base_dir.rglob(f"*{partial}*"))
 
 
+def search_files(
+    base_dir: Path,
+    partial: str,
+    type: str | None = None,
+    max_depth: int = DEFAULT_SEARCH_DEPTH,
+    excluded_dirs: frozenset[str] = EXCLUDED_DIRS,
+) -> list[Path]:
+    """
+    Find files matching the given partial name, walking at most max_depth
+    levels below base_dir and skipping excluded and hidden directories.
+
+    Args:
+        base_dir (Path): The directory to search.
+        partial (str): The partial string to search for in filenames.
+        type (str | None): The file extension/suffix to match.
+        max_depth (int): The number of directory levels to descend.
+        excluded_dirs (frozenset[str]): Directory names that are not searched.
+
+    Returns:
+        list[Path]: The matching files, sorted.
+    """
+    suffix = type or ""
+    matches = []
+    base_depth = len(base_dir.parts)
+    for root, dirs, files in os.walk(base_dir):
+        if len(Path(root).parts) - base_depth >= max_depth:
+            dirs.clear()
+        else:
+            dirs[:] = [
+                d for d in dirs if d not in excluded_dirs and not d.startswith(".")
+            ]
+        matches.extend(
+            Path(root, name)
+            for name in files
+            if partial in name and name.endswith(suffix)
+        )
+    return sorted(matches)
+
+
+def pyproject_config_path(root: Path) -> Path | None:
+    """
+    Return the configuration path set in pyproject.toml, if any.
+
+        [tool.elixirdb]
+        config = "config/elixir.yaml"
+
+    Relative paths are resolved from the project root.
+    """
+    pyproject = root / "pyproject.toml"
+    if not pyproject.is_file():
+        return None
+    with open(pyproject, "rb") as f:
+        tool = tomllib.load(f).get("tool", {}).get("elixirdb", {})
+    path = tool.get("config")
+    return root / path if path else None
+
+
+def find_config_file(
+    partial: str = "elixir",
+    file_type: Literal["json", "yaml", "yml"] = "yaml",
+    max_depth: int = DEFAULT_SEARCH_DEPTH,
+) -> Path | None:
+    """
+    Find the configuration file of the project.
+
+    Resolution order:
+        1. The path in the `ELIXIRDB_CONFIG` environment variable.
+        2. The `config` path of `[tool.elixirdb]` in the project pyproject.toml.
+        3. A search of the project root, max_depth levels deep, for files
+           matching the partial name (see :func:`search_files`).
+
+    Raises:
+        FileNotFoundError: If the environment variable or pyproject.toml
+            point to a file that does not exist.
+        ValueError: If the search finds more than one matching file.
+    """
+    env_path = os.environ.get(CONFIG_ENV_VAR)
+    if env_path:
+        path = Path(env_path)
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"The configuration file in {CONFIG_ENV_VAR} does not exist: {path}"
+            )
+        return path
+
+    root = find_root()
+    path = pyproject_config_path(root)
+    if path:
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"The configuration file in pyproject.toml does not exist: {path}"
+            )
+        return path
+
+    files = search_files(root, partial, file_type, max_depth=max_depth)
+    if len(files) > 1:
+        raise ValueError(
+            "elixir-db only supports one configuration file at the moment. "
+            "Please aggregate configurations into one file."
+        )
+    return files[0] if files else None
+
+
+def read_config_file(file: Path) -> dict[str, Any]:
+    """
+    Parse a YAML/JSON configuration file.
+
+    Raises:
+        ValueError: If the file type is unsupported or the content is not a
+            mapping.
+    """
+    if file.suffix in [".yaml", ".yml"]:
+        with open(file, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=yaml.SafeLoader)
+            if isinstance(data, dict):
+                return data
+            else:
+                raise ValueError("YAML content not parsed to dictionary.")
+    elif file.suffix == ".json":
+        with open(file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    else:
+        raise ValueError(f"Unsupported file type: {file.suffix}")
+
+
 def load_config(
     partial: str = "elixir", file_type: Literal["json", "yaml", "yml"] = "yaml"
 ) -> dict[str, Any] | None:
@@ -56,17 +227,5 @@ def load_config(
             "Please aggregate configurations into one file."
         )
     if files:
-        file = files[0]
-        if file.suffix in [".yaml", ".yml"]:
-            with open(file, "r", encoding="utf-8") as f:
-                data = yaml.load(f, Loader=yaml.SafeLoader)
-                if isinstance(data, dict):
-                    return data
-                else:
-                    raise ValueError("YAML content not parsed to dictionary.")
-        elif file.suffix == ".json":
-            with open(file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        else:
-            raise ValueError(f"Unsupported file type: {file.suffix}")
+        return read_config_file(files[0])
     return None
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from typing import Any
+from elixirdb.handlers import ColumnHandler
 
 
 def capitalize(string: str) -> str:
@@ -31,6 +33,19 @@ def lowercase_nested_data(data: str | dict | list) -> str | dict | list:
         return data
 
 
+def _lowercase(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+def lowercase_columns(*columns: str) -> ColumnHandler:
+    """
+    Column handler lowercasing the string values of columns. Unlike
+    lowercase_nested_data, keys are left unchanged and other columns are
+    not visited. See :class:`elixirdb.handlers.ColumnResultHandler`.
+    """
+    return ColumnHandler(_lowercase, columns=frozenset(columns))
+
+
 def flatten_str(message: str) -> str:
     """Removes line breaks and excess spaces from the string"""
     return " ".join(message.split())
@@ -0,0 +1,38 @@
+"""
+Deferred imports for dependencies that are slow to import and only needed by
+some features (e.g. sqlglot for schema rewriting).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+class LazyModule:
+    """
+    A module proxy that imports the module on first attribute access.
+
+    >> sqlglot = LazyModule("sqlglot")
+    >> sqlglot.parse_one("SELECT 1")  # sqlglot is imported here
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not set on the proxy itself.
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
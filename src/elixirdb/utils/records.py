@@ -0,0 +1,153 @@
+"""
+Lightweight record fetching. A `__slots__` record class is built once per
+set of result columns, and rows are instantiated straight from the DBAPI
+cursor tuples when SQLAlchemy has no result processing to apply, skipping
+both ORM hydration and Row/RowMapping objects.
+"""
+
+from __future__ import annotations
+
+import keyword
+from functools import lru_cache
+from itertools import starmap
+from typing import TYPE_CHECKING
+from typing import Any
+from sqlalchemy import CursorResult
+from sqlalchemy.engine.cursor import CursorFetchStrategy
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Result
+
+
+def _field_names(keys: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Attribute names for result keys. Keys that are not identifiers, are
+    keywords, start with an underscore or repeat an earlier key are renamed
+    to their position (e.g. `count(*)` -> `_0`), like namedtuple(rename=True).
+    """
+    seen: set[str] = set()
+    names = []
+    for index, key in enumerate(keys):
+        if (
+            not key.isidentifier()
+            or keyword.iskeyword(key)
+            or key.startswith("_")
+            or key in seen
+        ):
+            key = f"_{index}"
+        seen.add(key)
+        names.append(key)
+    return tuple(names)
+
+
+class Record:
+    """
+    Base class of the record classes built by :func:`record_class`.
+
+    Records hold one value per column in `__slots__`, so they are smaller
+    and faster to build than ORM instances or dicts.
+    """
+
+    __slots__ = ()
+
+    # The attribute name of each column, and the original result keys.
+    _fields: tuple[str, ...] = ()
+    _keys: tuple[str, ...] = ()
+
+    def __iter__(self):
+        for name in self._fields:
+            yield getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)  # type: ignore[arg-type]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._fields
+        )
+        return f"{type(self).__name__}({values})"
+
+    def _asdict(self) -> dict[str, Any]:
+        """Return the record as a dict keyed by the original result keys."""
+        return dict(zip(self._keys, self, strict=False))
+
+
+@lru_cache(maxsize=256)
+def record_class(keys: tuple[str, ...], name: str = "Record") -> type[Record]:
+    """
+    Build (or return the cached) record class for a tuple of result keys.
+
+    The class has a slot per key and an `__init__` taking the values
+    positionally, generated the way dataclasses generates its methods.
+    """
+    fields = _field_names(keys)
+    # The instance is named _self, which cannot collide with a field since
+    # keys starting with an underscore are renamed (e.g. a `self` column).
+    args = "".join(f", {field}" for field in fields)
+    body = "\n".join(f"    _self.{field} = {field}" for field in fields)
+    namespace: dict[str, Any] = {}
+    exec(  # noqa: S102
+        f"def __init__(_self{args}):\n{body or '    pass'}\n", {}, namespace
+    )
+    return type(
+        name,
+        (Record,),
+        {
+            "__slots__": fields,
+            "__init__": namespace["__init__"],
+            "_fields": fields,
+            "_keys": keys,
+        },
+    )
+
+
+def _raw_cursor(result: Result) -> Any | None:
+    """
+    Return the DBAPI cursor of a result if its rows can be read from it
+    directly: an unbuffered CursorResult whose columns have no result
+    processors (e.g. type conversions).
+    """
+    if not isinstance(result, CursorResult) or result.cursor is None:
+        return None
+    if type(result.cursor_strategy) is not CursorFetchStrategy:
+        return None
+    processors = getattr(result._metadata, "_processors", None)  # noqa: SLF001
+    if processors is None or any(processors):
+        return None
+    return result.cursor
+
+
+def fetch_records(
+    result: Result, size: int | None = None, name: str = "Record"
+) -> list[Record]:
+    """
+    Fetch rows of a result as records.
+
+    Args:
+        result: The result to fetch from.
+        size: The number of rows to fetch. All remaining rows by default.
+        name: The name of the record class.
+
+    Returns:
+        list[Record]: One record per row, with an attribute per column.
+    """
+    cls = record_class(tuple(result.keys()), name)
+    cursor = _raw_cursor(result)
+    if cursor is None:
+        rows = result.all() if size is None else result.fetchmany(size)
+        return list(starmap(cls, rows))
+
+    rows = cursor.fetchall() if size is None else cursor.fetchmany(size)
+    if size is None or len(rows) < size:
+        # The cursor is exhausted; release it like SQLAlchemy would. A soft
+        # close keeps the result usable, so later fetches return no rows.
+        result._soft_close()  # noqa: SLF001
+    return list(starmap(cls, rows))
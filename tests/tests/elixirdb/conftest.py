@@ -188,3 +188,24 @@ def parameter_db():
         if db is not None and db.has_connection():
             db.rollback()
             db.close()
+
+
+@pytest.fixture
+def sqlite_db() -> Generator[ElixirDB, None, None]:
+    """
+    Create and yield an in-memory sqlite ElixirDB instance seeded with a small
+    table. Used for tests that do not require one of the docker databases.
+    """
+    db = None
+    try:
+        db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite:///:memory:"})
+        db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute(
+            "INSERT INTO test_data (id, name) VALUES (:id, :name)",
+            [{"id": i, "name": f"name_{i}"} for i in range(1, 11)],
+        )
+        yield db
+    finally:
+        if db is not None and db.has_connection():
+            db.rollback()
+            db.close()
@@ -1,4 +1,6 @@
+from typing import Any
 import pytest
+from sqlalchemy import CursorResult
 from sqlalchemy import Result
 
 
@@ -21,3 +23,48 @@ def test_add_invalid_result_type(parameter_db):
     """
     with pytest.raises(TypeError):
         parameter_db.add_result_type("invalid_type")
+
+
+def test_is_result_type_cache(sqlite_db):
+    """
+    The frozen result types are rebuilt when add_result_type is used and
+    decisions are cached per class.
+    """
+    sqlite_db.result_types = [Result]
+    assert not sqlite_db.is_result_type(1)
+
+    sqlite_db.add_result_type(int)
+
+    assert sqlite_db.is_result_type(1)
+    assert sqlite_db._result_type_cache.decisions[int] is True
+
+
+def test_is_result_type_cache_mutated_in_place(sqlite_db):
+    """Replacing result types in place, at the same length, rebuilds the cache."""
+    sqlite_db.result_types = [Result, str]
+    result = sqlite_db.execute("SELECT 1")
+    assert sqlite_db.is_result_type(result)
+
+    sqlite_db.result_types[:] = [int, str]
+    assert not sqlite_db.is_result_type(result)
+    assert sqlite_db.is_result_type(1)
+
+
+def test_is_result_type_list(sqlite_db):
+    """Lists are checked item by item, or sampled when configured."""
+    sqlite_db.result_types = [int]
+
+    assert sqlite_db.is_result_type([1, 2, 3])
+    assert not sqlite_db.is_result_type([1, "2", 3])
+
+    sqlite_db.result_type_sample_size = 1
+    assert sqlite_db.is_result_type([1, "2", 3])
+    assert not sqlite_db.is_result_type([1, 2, "3"])
+
+
+def test_is_result_type_subscripted_generic(sqlite_db):
+    """Subscripted generics in result_types are checked by their origin."""
+    sqlite_db.result_types = [CursorResult[Any]]
+
+    assert sqlite_db.is_result_type(sqlite_db.execute("SELECT 1"))
+    assert not sqlite_db.is_result_type([object()])
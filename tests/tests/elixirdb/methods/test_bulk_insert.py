@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from elixirdb import bulk
+from elixirdb.bulk import bind_parameter_limit
+from elixirdb.bulk import copy_payload
+from elixirdb.bulk import resolve_method
+
+
+def count(db) -> int:
+    return db.execute("SELECT COUNT(*) FROM test_data").scalar()
+
+
+@pytest.mark.parametrize("method", ["auto", "executemany", "values"])
+def test_bulk_insert_generator(sqlite_db, method):
+    consumed = []
+
+    def rows():
+        for i in range(11, 261):
+            consumed.append(i)
+            yield {"id": i, "name": f"name_{i}"}
+
+    result = sqlite_db.bulk_insert(
+        "test_data", rows(), batch_size=100, method=method
+    )
+
+    assert result.method == ("executemany" if method == "auto" else method)
+    assert (result.rows, result.batches) == (250, 3)
+    assert result.rows_per_second > 0
+    assert len(consumed) == 250  # noqa: PLR2004
+    assert count(sqlite_db) == 260  # noqa: PLR2004
+
+
+def test_bulk_insert_streams_batches(sqlite_db):
+    """Rows are pulled from the iterable one batch at a time."""
+    pulled = []
+
+    def rows():
+        for i in range(11, 31):
+            pulled.append(i)
+            yield (i, f"name_{i}")
+
+    seen = []
+    execute = sqlite_db.connection.execute
+
+    def spy(statement, params=None):
+        seen.append(len(pulled))
+        return execute(statement, params)
+
+    sqlite_db.connection.execute = spy
+    sqlite_db.bulk_insert("test_data", rows(), batch_size=5, columns=["id", "name"])
+
+    assert seen == [5, 10, 15, 20]
+
+
+def test_bulk_insert_table_object(sqlite_db):
+    test_data = Table(
+        "test_data",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+    )
+    result = sqlite_db.bulk_insert(test_data, [{"id": 11, "name": "x"}])
+
+    assert result.rows == 1
+    assert count(sqlite_db) == 11  # noqa: PLR2004
+
+
+def test_bulk_insert_empty_and_invalid(sqlite_db):
+    assert sqlite_db.bulk_insert("test_data", iter([])).rows == 0
+
+    with pytest.raises(ValueError, match="columns are required"):
+        sqlite_db.bulk_insert("test_data", [(11, "x")])
+    with pytest.raises(ValueError, match="COPY"):
+        sqlite_db.bulk_insert("test_data", [{"id": 11}], method="copy")
+    with pytest.raises(ValueError, match="batch_size"):
+        sqlite_db.bulk_insert("test_data", [{"id": 11}], batch_size=0)
+
+
+def test_copy_payload_escaping():
+    payload = copy_payload([(1, None, "a\tb\\c\nd")])
+    assert payload.read() == "1\t\\N\ta\\tb\\\\c\\nd\n"
+
+
+def test_copy_payload_encodes_json_bytes_and_arrays():
+    row = ({"a": [1, "x"]}, b"\x00\xff", [1, None, 'q"'], True)
+    payload = copy_payload([row])
+    assert payload.read() == (
+        '{"a": [1, "x"]}\t\\\\x00ff\t{1,NULL,"q\\\\""}\tt\n'
+    )
+
+
+def test_auto_does_not_pick_copy():
+    connection = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql", driver="psycopg2")
+    )
+    assert resolve_method(connection, "auto") == "executemany"
+    assert resolve_method(connection, "copy") == "copy"
+
+
+def test_bind_parameter_limit():
+    def limit(name, dbapi=None):
+        dialect = SimpleNamespace(name=name, dbapi=dbapi)
+        return bind_parameter_limit(SimpleNamespace(dialect=dialect))
+
+    assert limit("mssql") == 2099  # noqa: PLR2004
+    old_sqlite = SimpleNamespace(sqlite_version_info=(3, 31, 1))
+    new_sqlite = SimpleNamespace(sqlite_version_info=(3, 45, 0))
+    assert limit("sqlite", old_sqlite) == 999  # noqa: PLR2004
+    assert limit("sqlite", new_sqlite) == 32766  # noqa: PLR2004
+    assert limit("unknown") is None
+
+
+def test_bulk_insert_values_split_by_bind_limit(sqlite_db, monkeypatch):
+    monkeypatch.setattr(bulk, "bind_parameter_limit", lambda connection: 10)
+    statements = []
+    execute = sqlite_db.connection.execute
+
+    def spy(statement, params=None):
+        statements.append(statement)
+        return execute(statement, params)
+
+    sqlite_db.connection.execute = spy
+    rows = ({"id": i, "name": f"name_{i}"} for i in range(11, 36))
+    result = sqlite_db.bulk_insert(
+        "test_data", rows, batch_size=20, method="values"
+    )
+
+    # 2 columns and 10 parameters: 5 rows per statement, 2 batches.
+    assert (result.rows, result.batches) == (25, 2)
+    assert len(statements) == 5  # noqa: PLR2004
+    assert count(sqlite_db) == 35  # noqa: PLR2004
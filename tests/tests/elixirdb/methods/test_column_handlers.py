@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import text
+from elixirdb import ElixirDB
+from elixirdb.handlers import ColumnHandler
+from elixirdb.handlers import ColumnResultHandler
+from elixirdb.handlers import DateFormatter
+from elixirdb.utils.formatters import lowercase_columns
+
+
+@pytest.fixture
+def column_db():
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://"})
+    db.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, created TEXT)"
+    )
+    db.execute(
+        "INSERT INTO users VALUES (1, 'A@X.COM', '1/5/2024'), (2, NULL, NULL)"
+    )
+    yield db
+    db.close()
+
+
+def test_column_result_handler(column_db):
+    column_db.set_handlers(
+        {
+            "result_handlers": ColumnResultHandler(
+                lowercase_columns("email"), DateFormatter(columns=["created"])
+            )
+        }
+    )
+
+    assert column_db.execute("SELECT * FROM users ORDER BY id") == [
+        {"id": 1, "email": "a@x.com", "created": "2024-01-05"},
+        {"id": 2, "email": None, "created": None},
+    ]
+
+
+def test_schema_is_read_once_and_untouched_columns_are_skipped():
+    calls = []
+
+    class Recorder:
+        def column_transforms(self, keys, description):
+            calls.append((tuple(keys), description))
+            return {"b": lambda value: value * 10}
+
+    handler = ColumnResultHandler(Recorder(), ColumnHandler(str, columns=["b"]))
+    rows = [{"a": "x", "b": 1}, {"a": "y", "b": None}, {"a": "z"}]
+
+    assert handler(rows) == [
+        {"a": "x", "b": "10"},
+        {"a": "y", "b": None},
+        {"a": "z"},
+    ]
+    assert calls == [(("a", "b"), None)]
+    assert rows[0]["b"] == 1
+
+
+def test_transforms_by_predicate_and_type_code():
+    keys = ["total_amount", "name"]
+    description = [("total_amount", 1700), ("name", 25)]
+
+    by_predicate = ColumnHandler(
+        round, predicate=lambda name, _: name.endswith("_amount")
+    )
+    by_type_code = ColumnHandler(str.upper, type_codes={25})
+
+    assert list(by_predicate.column_transforms(keys, description)) == [
+        "total_amount"
+    ]
+    assert list(by_type_code.column_transforms(keys, description)) == ["name"]
+    assert not by_type_code.column_transforms(keys, None)
+
+
+def test_column_handler_requires_a_selector():
+    with pytest.raises(ValueError, match="Select columns"):
+        ColumnHandler(str)
+
+
+def test_tuples_and_non_row_results(column_db):
+    handler = ColumnResultHandler(lowercase_columns("email"), as_dict=False)
+
+    result = column_db.connection.execute(
+        text("SELECT email FROM users ORDER BY id")
+    )
+    assert handler(result) == [("a@x.com",), (None,)]
+    assert handler("text") == "text"
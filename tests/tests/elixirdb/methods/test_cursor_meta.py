@@ -0,0 +1,49 @@
+from unittest.mock import patch
+import pytest
+from elixirdb import ElixirDB
+from elixirdb.base import CursorResultMetadata
+from elixirdb.base import LazyCursorResultMetadata
+from elixirdb.registry import engine_registry
+
+
+@pytest.fixture
+def debug_db():
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://", "debug": True})
+    db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+    yield db
+    db.close()
+    engine_registry.dispose_all()
+
+
+def test_cursor_meta_is_lazy(debug_db):
+    with patch.object(
+        LazyCursorResultMetadata, "execution_context", property(lambda _: 1 / 0)
+    ):
+        debug_db.execute("SELECT * FROM test_data")
+    assert isinstance(debug_db.statevars.cursor_meta, LazyCursorResultMetadata)
+
+
+def test_cursor_meta_after_rows_are_consumed(debug_db):
+    debug_db.execute("INSERT INTO test_data (name) VALUES (:name)", {"name": "a"})
+    meta = debug_db.statevars.cursor_meta
+    assert meta.rows_affected == 1
+    assert meta.last_insert_id == meta.last_insert_rowid == 1
+    assert meta.parameters == [{"name": "a"}]
+
+    debug_db.execute("SELECT id, name FROM test_data")
+    debug_db.fetchall()
+    meta = debug_db.statevars.cursor_meta
+    assert meta.columns == ["id", "name"]
+    assert [d["name"] for d in meta.column_descriptions] == ["id", "name"]
+    assert meta.sql_query == "SELECT id, name FROM test_data"
+    assert meta.is_closed is False
+    assert meta.columns is meta.columns
+
+
+def test_materialize(debug_db):
+    debug_db.execute("SELECT 1 AS one")
+    meta = debug_db.statevars.cursor_meta.materialize()
+
+    assert isinstance(meta, CursorResultMetadata)
+    assert meta.columns == ["one"]
+    assert meta.generated_keys is None
@@ -0,0 +1,24 @@
+def test_dispatch_reuses_wrapper(sqlite_db):
+    """Repeated attribute access returns the same cached wrapper."""
+    assert sqlite_db.execute is sqlite_db.execute
+    assert "execute" in sqlite_db._dispatch_cache
+
+
+def test_dispatch_rebinds_on_new_result(sqlite_db):
+    """Result methods are rebound when the result object changes."""
+    sqlite_db.execute("SELECT id FROM test_data WHERE id = 1")
+    first = sqlite_db.fetchall
+    assert first() == [(1,)]
+
+    sqlite_db.execute("SELECT id FROM test_data WHERE id = 2")
+    second = sqlite_db.fetchall
+    assert second is not first
+    assert second() == [(2,)]
+
+
+def test_dispatch_cache_cleared_on_close(sqlite_db):
+    """Closing the connection drops wrappers bound to it."""
+    sqlite_db.execute("SELECT 1")
+    sqlite_db.close()
+
+    assert not sqlite_db._dispatch_cache
@@ -0,0 +1,114 @@
+import pytest
+from elixirdb.utils.columnar import fetch_numpy
+from elixirdb.utils.columnar import infer_dtype
+
+
+def test_fetch_columns(sqlite_db):
+    sqlite_db.execute("SELECT id, name FROM test_data ORDER BY id")
+    columns = sqlite_db.fetch_columns(chunk_size=3)
+
+    assert list(columns) == ["id", "name"]
+    assert columns["id"] == list(range(1, 11))
+    assert columns["name"][0] == "name_1"
+
+
+def test_fetch_numpy(sqlite_db):
+    np = pytest.importorskip("numpy")
+    sqlite_db.execute(
+        "SELECT id, id * 0.5 AS half, name FROM test_data ORDER BY id"
+    )
+    # A small chunk size forces the arrays to grow.
+    arrays = sqlite_db.fetch_numpy(chunk_size=3)
+
+    assert arrays["id"].dtype == np.int64
+    assert arrays["half"].dtype == np.float64
+    assert arrays["name"].dtype == object
+    assert arrays["id"].tolist() == list(range(1, 11))
+    assert arrays["half"][1] == pytest.approx(1.0)
+
+
+def test_fetch_numpy_nulls_and_dtypes(sqlite_db):
+    np = pytest.importorskip("numpy")
+    sqlite_db.execute(
+        "SELECT id, CASE WHEN id > 5 THEN NULL ELSE id END AS maybe "
+        "FROM test_data ORDER BY id"
+    )
+    arrays = sqlite_db.fetch_numpy(chunk_size=5, dtypes={"id": "int32"})
+
+    assert arrays["id"].dtype == np.int32
+    # The NULLs appear after the int dtype was inferred from the first chunk,
+    # so the array is widened to float64 like an int column with NULLs.
+    assert arrays["maybe"].dtype == np.float64
+    assert arrays["maybe"][:5].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert np.isnan(arrays["maybe"][-1])
+
+
+@pytest.mark.parametrize(
+    ("later", "dtype", "expected"),
+    [
+        ("5.7", "float64", 5.7),
+        ("'text'", "object", "text"),
+    ],
+)
+def test_fetch_numpy_widens_for_later_chunks(sqlite_db, later, dtype, expected):
+    np = pytest.importorskip("numpy")
+    sqlite_db.execute(
+        f"SELECT CASE WHEN id = 10 THEN {later} ELSE id END AS value "
+        "FROM test_data ORDER BY id"
+    )
+    arrays = sqlite_db.fetch_numpy(chunk_size=5)
+
+    # The dtype is inferred as int64 from the first chunk, the last chunk
+    # holds a value that does not fit it.
+    assert arrays["value"].dtype == np.dtype(dtype)
+    assert arrays["value"][:9].tolist() == list(range(1, 10))
+    assert arrays["value"][-1] == expected
+
+
+class _ChunkedResult:
+    """A result stub returning preset chunks from fetchmany."""
+
+    def __init__(self, keys, chunks):
+        self._keys = keys
+        self._chunks = list(chunks)
+
+    def keys(self):
+        return self._keys
+
+    def fetchmany(self, size):
+        return self._chunks.pop(0) if self._chunks else []
+
+
+@pytest.mark.parametrize(
+    ("first", "later", "expected"),
+    [
+        ([(True,), (False,)], [(2,)], object),
+        ([(1,), (2,)], [(2**63,)], object),
+        ([(1,), (2,)], [(None,)], "float64"),
+        ([(1.5,), (2.5,)], [(3,)], "float64"),
+    ],
+)
+def test_fetch_numpy_later_chunk_dtypes(first, later, expected):
+    np = pytest.importorskip("numpy")
+
+    arrays = fetch_numpy(_ChunkedResult(["value"], [first, later]), chunk_size=2)
+
+    assert arrays["value"].dtype == np.dtype(expected)
+    assert len(arrays["value"]) == 3  # noqa: PLR2004
+    if expected is object:
+        assert arrays["value"].tolist() == [row[0] for row in first + later]
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ((1, 2), "int64"),
+        ((1, None), "float64"),
+        ((1, 2.5), "float64"),
+        ((True, False), "bool"),
+        (("a", 1), "object"),
+        ((None, None), "object"),
+    ],
+)
+def test_infer_dtype(values, expected):
+    assert infer_dtype(values) == expected
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+from sqlalchemy import Date
+from sqlalchemy import column
+from sqlalchemy import select
+from sqlalchemy import table
+from elixirdb.utils import records
+from elixirdb.utils.records import record_class
+
+
+def test_fetch_records(sqlite_db):
+    sqlite_db.execute("SELECT id, name FROM test_data ORDER BY id")
+    rows = sqlite_db.fetch_records()
+
+    assert len(rows) == 10  # noqa: PLR2004
+    assert (rows[0].id, rows[0].name) == (1, "name_1")
+    assert rows[0]._asdict() == {"id": 1, "name": "name_1"}
+    assert type(rows[0]) is type(rows[1])
+    assert not hasattr(rows[0], "__dict__")
+
+
+def test_fetch_records_in_batches(sqlite_db):
+    sqlite_db.execute("SELECT id FROM test_data ORDER BY id")
+    assert [r.id for r in sqlite_db.fetch_records(4)] == [1, 2, 3, 4]
+    assert [r.id for r in sqlite_db.fetch_records()] == list(range(5, 11))
+
+
+def test_fetch_records_batch_loop(sqlite_db):
+    sqlite_db.execute("SELECT id FROM test_data ORDER BY id")
+    batches = []
+    while batch := sqlite_db.fetch_records(3):
+        batches.append([r.id for r in batch])
+
+    # The last batch is short; the result stays usable after it.
+    assert batches == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    assert sqlite_db.fetch_records(3) == []
+    assert sqlite_db.fetchall() == []
+
+
+def test_raw_cursor_is_used_without_processors(sqlite_db):
+    with patch.object(records, "starmap", wraps=records.starmap) as mock:
+        sqlite_db.execute("SELECT id FROM test_data")
+        sqlite_db.fetch_records()
+    assert type(mock.call_args.args[1][0]) is tuple
+    assert sqlite_db.result.cursor is None
+
+
+def test_processed_columns_use_rows(sqlite_db):
+    sqlite_db.execute("CREATE TABLE days (day DATE)")
+    sqlite_db.execute("INSERT INTO days VALUES ('2024-01-05')")
+    days = table("days", column("day", Date))
+
+    sqlite_db.execute(select(days.c.day))
+    (row,) = sqlite_db.fetch_records()
+    assert row.day.isoformat() == "2024-01-05"
+
+
+def test_record_class_renames_invalid_keys():
+    cls = record_class(("id", "count(*)", "id", "class", "_x"))
+    record = cls(1, 2, 3, 4, 5)
+
+    assert cls._fields == ("id", "_1", "_2", "_3", "_4")
+    assert record._asdict() == {"id": 3, "count(*)": 2, "class": 4, "_x": 5}
+    assert list(record) == [1, 2, 3, 4, 5]
+    assert record == cls(1, 2, 3, 4, 5)
+    assert repr(record) == "Record(id=1, _1=2, _2=3, _3=4, _4=5)"
+    assert record_class(("id", "count(*)", "id", "class", "_x")) is cls
+
+
+def test_record_class_self_column(sqlite_db):
+    sqlite_db.execute("SELECT 1 AS self, 2 AS _self")
+    (record,) = sqlite_db.fetch_records()
+
+    assert record.self == 1
+    assert record._asdict() == {"self": 1, "_self": 2}
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import text
+from elixirdb import ElixirDB
+from elixirdb.registry import engine_registry
+
+
+def add(n):
+    def handler(rows):
+        return [*rows, n]
+
+    return handler
+
+
+def to_list(result):
+    if isinstance(result, list):
+        return result
+    return [tuple(row) for row in result]
+
+
+@pytest.fixture
+def pipeline_db():
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://"})
+    yield db
+    db.close()
+    engine_registry.dispose_all()
+
+
+def test_result_handlers_are_chained(pipeline_db):
+    pipeline_db.set_handlers({"result_handlers": [to_list, add(1), add(2)]})
+    assert pipeline_db.execute("SELECT 0") == [(0,), 1, 2]
+
+
+def test_pipeline_is_rebuilt_only_when_handlers_change(pipeline_db):
+    pipeline_db.set_handlers({"result_handlers": [to_list, add(1)]})
+    compiled = pipeline_db.compiled_handlers("result_handlers")
+    assert pipeline_db.compiled_handlers("result_handlers") is compiled
+
+    pipeline_db.result_handlers.append(add(2))
+    assert pipeline_db.compiled_handlers("result_handlers") is not compiled
+    assert pipeline_db.execute("SELECT 0") == [(0,), 1, 2]
+
+    pipeline_db.result_handlers = [to_list]
+    assert pipeline_db.compiled_handlers("result_handlers") is to_list
+
+
+def test_pipeline_is_rebuilt_when_handlers_are_replaced(pipeline_db):
+    pipeline_db.set_handlers({"result_handlers": [to_list, add(1)]})
+    assert pipeline_db.execute("SELECT 0") == [(0,), 1]
+
+    # Same length, different handlers.
+    pipeline_db.result_handlers[1] = add(2)
+    assert pipeline_db.execute("SELECT 0") == [(0,), 2]
+
+    pipeline_db.result_handlers.clear()
+    pipeline_db.result_handlers.extend([to_list, add(3)])
+    assert pipeline_db.execute("SELECT 0") == [(0,), 3]
+
+
+def test_parameter_and_error_handlers(pipeline_db):
+    errors = []
+    pipeline_db.set_handlers(
+        {
+            "parameter_handlers": [
+                lambda p: (text("SELECT :x"), {**p, "x": p["x"] + 1}),
+                lambda p: (text("SELECT :x * 10"), p),
+            ],
+            "error_handlers": [errors.append, errors.append],
+        }
+    )
+    # Each parameter handler returns the statement and the parameters.
+    result = pipeline_db.execute("SELECT :x", {"x": 1})
+    assert result.scalar() == 20  # noqa: PLR2004
+
+    pipeline_db.execute("SELECT * FROM missing")
+    assert len(errors) == 2  # noqa: PLR2004
+    assert errors[0] is errors[1]
+
+
+def test_errors_are_raised_without_handlers(pipeline_db):
+    assert pipeline_db.compiled_handlers("error_handlers") is None
+    with pytest.raises(Exception, match="missing"):
+        pipeline_db.execute("SELECT * FROM missing")
+
+
+def test_handler_timings(pipeline_db):
+    assert pipeline_db.handler_timings() == {}
+
+    pipeline_db.time_handlers = True
+    pipeline_db.set_handlers({"result_handlers": [to_list, add(1)]})
+    for _ in range(3):
+        pipeline_db.execute("SELECT 0")
+
+    timings = pipeline_db.handler_timings()["result_handlers"]
+    assert list(timings) == ["0:to_list", "1:add.<locals>.handler"]
+    assert all(stats["count"] == 3 for stats in timings.values())  # noqa: PLR2004
@@ -0,0 +1,38 @@
+import pytest
+from elixirdb.exc import CursorResultError
+
+
+def test_iter_results_batches(sqlite_db):
+    """Rows are yielded in batches of batch_size as mappings."""
+    statement = "SELECT id, name FROM test_data ORDER BY id"
+    batches = list(sqlite_db.iter_results(statement, batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert batches[0][0] == {"id": 1, "name": "name_1"}
+    assert sqlite_db.result.closed
+
+
+def test_iter_results_rows_and_parameters(sqlite_db):
+    """Rows are returned as tuples when result_to_dict is disabled."""
+    sqlite_db.db.result_to_dict = False
+    batches = list(
+        sqlite_db.iter_results(
+            "SELECT id FROM test_data WHERE id > :id ORDER BY id", {"id": 8}
+        )
+    )
+
+    assert batches == [[(9,), (10,)]]
+
+
+def test_iter_results_current_result(sqlite_db):
+    """Without a statement the current result is streamed."""
+    sqlite_db.execute("SELECT id FROM test_data")
+    rows = [row for batch in sqlite_db.iter_results(batch_size=3) for row in batch]
+
+    assert len(rows) == 10  # noqa: PLR2004
+
+
+def test_iter_results_without_result(sqlite_db):
+    sqlite_db.result = None
+    with pytest.raises(CursorResultError):
+        next(sqlite_db.iter_results())
@@ -61,3 +61,20 @@ def test_invalid_new_session_without_session(parameter_db):
     parameter_db.session_factory = None
     with pytest.raises(NoSessionFactoryError):
         new_session = parameter_db.new_session()
+
+
+def test_new_session_reuses_factory(sqlite_db):
+    """New sessions share the factory, engine and config of the parent."""
+    sqlite_db.engine_type = "session"
+    sqlite_db.session_factory = sqlite_db.create_session_factory()
+    factory = sqlite_db.session_factory
+
+    new_session = sqlite_db.new_session()
+
+    assert sqlite_db.session_factory is factory
+    assert new_session.session_factory is factory
+    assert new_session.db is sqlite_db.db
+    assert new_session.engine is sqlite_db.engine
+    assert new_session.session is not None
+    assert new_session.execute("SELECT 1").scalar() == 1
+    new_session.session.close()
@@ -0,0 +1,124 @@
+from unittest.mock import patch
+import pytest
+from sqlalchemy import column
+from sqlalchemy import select
+from sqlalchemy import table
+from elixirdb import ElixirDB
+from elixirdb import metrics as metrics_module
+from elixirdb.metrics import LatencyHistogram
+from elixirdb.metrics import QueryMetrics
+from elixirdb.metrics import normalize_statement
+from elixirdb.metrics import query_metrics
+from elixirdb.metrics import statement_label
+from elixirdb.registry import engine_registry
+
+
+@pytest.fixture
+def timed_db():
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://", "metrics": True})
+    db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+    db.execute("INSERT INTO test_data VALUES (1, 'one'), (2, 'two')")
+    query_metrics.reset()
+    yield db
+    db.close()
+    query_metrics.reset()
+    engine_registry.dispose_all()
+
+
+def test_normalize_statement():
+    assert normalize_statement(
+        "SELECT *  FROM t\n WHERE id IN (1, 2, 3) AND name = 'o''k' AND x = :x"
+    ) == "SELECT * FROM t WHERE id IN (?) AND name = ? AND x = :x"
+
+
+def test_statement_label_compiles_once():
+    test_data = table("test_data", column("id"), column("name"))
+    metrics_module._construct_labels.clear()
+    with patch.object(
+        metrics_module, "_compile_label", wraps=metrics_module._compile_label
+    ) as compile_label:
+        labels = {
+            statement_label(select(test_data.c.name).where(test_data.c.id == id_))
+            for id_ in (1, 2, 3)
+        }
+
+    # Statements only differing in bound values share a label and a compile.
+    label = "SELECT test_data.name FROM test_data WHERE test_data.id = :id_1"
+    assert labels == {label}
+    assert compile_label.call_count == 1
+
+
+def test_histogram_quantiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    stats = histogram.to_dict()
+    assert stats["count"] == 100  # noqa: PLR2004
+    assert stats["min"] == pytest.approx(0.001)
+    assert stats["max"] == pytest.approx(0.1)
+    # Buckets grow by 2 ** (1/4), so estimates are within ~19%.
+    assert 0.05 <= stats["p50"] <= 0.05 * 1.19  # noqa: PLR2004
+    assert 0.095 <= stats["p95"] <= 0.1  # noqa: PLR2004
+    assert stats["p99"] <= stats["max"]
+
+
+def test_statements_are_bounded():
+    metrics = QueryMetrics(max_statements=2)
+    for statement in ("a", "b", "c", "d"):
+        metrics.record("db", statement, "execute", 0.001)
+
+    statements = metrics.to_dict()["statements"]["db"]
+    assert set(statements) == {"a", "b", "<other>"}
+    assert statements["<other>"]["execute"]["count"] == 2  # noqa: PLR2004
+
+
+def test_execute_and_fetch_are_timed(timed_db):
+    for id_ in (1, 2):
+        timed_db.execute(f"SELECT name FROM test_data WHERE id = {id_}")
+        timed_db.fetchall()
+
+    timings = timed_db.statevars.timings
+    assert set(timings) == {"params", "execute", "fetch", "handlers"}
+    assert timed_db.statevars.orm_meta.query_time == timings["execute"]
+
+    exported = query_metrics.to_dict()
+    statement = "SELECT name FROM test_data WHERE id = ?"
+    phases = exported["statements"][""][statement]
+    assert {phase: stats["count"] for phase, stats in phases.items()} == {
+        "params": 2,
+        "execute": 2,
+        "fetch": 2,
+        "handlers": 4,
+    }
+    assert exported["engines"][""]["execute"]["count"] == 2  # noqa: PLR2004
+
+
+def test_timed_fetch_sets_result(timed_db):
+    timed_db.execute("SELECT name FROM test_data ORDER BY id")
+    rows = timed_db.fetchall()
+
+    assert timed_db.result == rows == [("one",), ("two",)]
+
+
+def test_fetch_results_is_timed(timed_db):
+    timed_db.execute("SELECT * FROM test_data")
+    assert len(timed_db.fetch_results(0)) == 2  # noqa: PLR2004
+    assert "fetch" in timed_db.statevars.timings
+
+
+def test_prometheus_export(timed_db):
+    timed_db.execute("SELECT 1")
+
+    text = query_metrics.to_prometheus()
+    assert "# TYPE elixirdb_query_duration_seconds summary" in text
+    labels = 'engine_key="",statement="SELECT ?",phase="execute"'
+    assert f'elixirdb_query_duration_seconds{{{labels},quantile="0.99"}}' in text
+    assert f"elixirdb_query_duration_seconds_count{{{labels}}} 1" in text
+
+
+def test_metrics_disabled_by_default(sqlite_db):
+    query_metrics.reset()
+    sqlite_db.execute("SELECT 1")
+    assert not sqlite_db.statevars.timings
+    assert query_metrics.to_dict() == {"engines": {}, "statements": {}}
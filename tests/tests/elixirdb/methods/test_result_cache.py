@@ -0,0 +1,148 @@
+import pytest
+from sqlalchemy import column
+from sqlalchemy import select
+from sqlalchemy import table
+from elixirdb import ElixirDB
+from elixirdb.db import result_cache
+from elixirdb.registry import engine_registry
+
+
+QUERY = "SELECT name FROM test_data WHERE id = :id"
+
+
+@pytest.fixture
+def cached_db(tmp_path):
+    config = {
+        "dialect": "sqlite",
+        "url": f"sqlite:///{tmp_path / 'cache.db'}",
+        "result_cache": True,
+    }
+    db = ElixirDB(config=config)
+    db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+    db.execute("INSERT INTO test_data VALUES (1, 'one'), (2, 'two')")
+    db.commit()
+    result_cache.clear()
+    yield db
+    db.close()
+    result_cache.clear()
+    engine_registry.dispose_all()
+
+
+def hits() -> int:
+    return result_cache.stats()["hits"]
+
+
+def test_reads_are_cached(cached_db):
+    before = hits()
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+    assert cached_db.execute(QUERY, {"id": 2}).scalar() == "two"
+
+    assert hits() - before == 1
+
+
+def test_fetch_results_from_cache(cached_db):
+    cached_db.execute("SELECT * FROM test_data ORDER BY id")
+    cached_db.execute("SELECT * FROM test_data ORDER BY id")
+    assert cached_db.fetch_results(0) == [
+        {"id": 1, "name": "one"},
+        {"id": 2, "name": "two"},
+    ]
+
+
+def test_core_statements_are_cached(cached_db):
+    test_data = table("test_data", column("id"), column("name"))
+    before = hits()
+    for id_ in (1, 1, 2):
+        statement = select(test_data.c.name).where(test_data.c.id == id_)
+        cached_db.execute(statement)
+
+    assert hits() - before == 1
+
+
+def test_dml_invalidates_and_bypasses(cached_db):
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+
+    cached_db.execute("UPDATE test_data SET name = 'uno' WHERE id = 1")
+    assert len(result_cache) == 0
+
+    # Uncommitted writes are read from the database, not the cache.
+    before = hits()
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "uno"
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "uno"
+    assert hits() == before
+    assert len(result_cache) == 0
+
+    cached_db.commit()
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "uno"
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "uno"
+    assert hits() - before == 1
+
+
+def test_cache_disabled_by_default(sqlite_db):
+    sqlite_db.execute("SELECT * FROM test_data")
+    assert len(result_cache) == 0
+
+
+def test_streamed_reads_bypass(cached_db):
+    options = {"stream_results": True, "yield_per": 1}
+    result = cached_db.execute(QUERY, {"id": 1}, execution_options=options)
+
+    assert result.scalar() == "one"
+    assert len(result_cache) == 0
+
+
+def test_execution_options_are_keyed(cached_db):
+    before = hits()
+    for schema in ("a", "b", "b"):
+        options = {"schema_translate_map": {schema: None}}
+        cached_db.execute(QUERY, {"id": 1}, execution_options=options)
+
+    assert len(result_cache) == 2  # noqa: PLR2004
+    assert hits() - before == 1
+
+
+def test_open_transaction_bypasses(cached_db):
+    # A miss ends the transaction it began, so later reads can hit.
+    cached_db.execute(QUERY, {"id": 1})
+    assert not cached_db.connection.in_transaction()
+
+    # A transaction begun outside ElixirDB also bypasses the cache.
+    cached_db.connection.exec_driver_sql("SELECT 1")
+    before = hits()
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+    assert hits() == before
+    assert cached_db.connection.in_transaction()
+
+    cached_db.rollback()
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+    assert hits() - before == 1
+
+
+def test_bulk_insert_invalidates(cached_db):
+    count = "SELECT COUNT(*) FROM test_data"
+    assert cached_db.execute(count).scalar() == 2  # noqa: PLR2004
+
+    rows = ({"id": i, "name": f"name_{i}"} for i in range(3, 8))
+    cached_db.bulk_insert("test_data", rows)
+    assert len(result_cache) == 0
+    # The uncommitted rows are read from the database.
+    assert cached_db.execute(count).scalar() == 7  # noqa: PLR2004
+
+    cached_db.commit()
+    assert cached_db.execute(count).scalar() == 7  # noqa: PLR2004
+    assert cached_db.execute(count).scalar() == 7  # noqa: PLR2004
+
+
+def test_read_during_invalidation_is_not_cached(cached_db, monkeypatch):
+    generation = result_cache.generation
+
+    def invalidated_generation(tags):
+        taken = generation(tags)
+        # Another instance writes to the table while the read runs.
+        result_cache.invalidate(tags)
+        return taken
+
+    monkeypatch.setattr(result_cache, "generation", invalidated_generation)
+    assert cached_db.execute(QUERY, {"id": 1}).scalar() == "one"
+    assert len(result_cache) == 0
@@ -0,0 +1,109 @@
+import io
+import json
+import pytest
+from elixirdb import ElixirDB
+from elixirdb.registry import engine_registry
+from elixirdb.slowlog import SlowQuery
+from elixirdb.slowlog import SlowQueryLog
+from elixirdb.slowlog import slow_query_log
+from elixirdb.utils.db_utils import statement_fingerprint
+
+
+QUERY = "SELECT name FROM test_data WHERE id = :id AND name != 'x'"
+
+
+def make_db(**config) -> ElixirDB:
+    db = ElixirDB(config={"dialect": "sqlite", "url": "sqlite://", **config})
+    db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+    slow_query_log.clear()
+    return db
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    slow_query_log.clear()
+    engine_registry.dispose_all()
+
+
+def test_statement_fingerprint():
+    assert (
+        statement_fingerprint(
+            "select * from t where a in (1, 2, 3) and b = 'x' and c = :c", "sqlite"
+        )
+        == "SELECT * FROM t WHERE a IN (?) AND b = ? AND c = :c"
+    )
+
+
+def test_statement_fingerprint_placeholders():
+    query = "SELECT * FROM t WHERE a = 1 AND b IN ('x', 'y') AND c = :c"
+    expected = "SELECT * FROM t WHERE a = ? AND b IN (?) AND c = :c"
+    assert statement_fingerprint(query, "sqlite") == expected
+    assert statement_fingerprint(query, "postgres") == expected
+
+    # DBAPI bind parameters of compiled statements are normalized too.
+    pyformat = "SELECT * FROM t WHERE a = %s AND c = %(c)s"
+    assert (
+        statement_fingerprint(pyformat, "postgres")
+        == "SELECT * FROM t WHERE a = ? AND c = :c"
+    )
+    assert (
+        statement_fingerprint("SELECT * FROM t WHERE a = $1 AND b = ?", "postgres")
+        == "SELECT * FROM t WHERE a = ? AND b = ?"
+    )
+
+
+def test_log_keeps_the_slowest_entries():
+    log = SlowQueryLog(max_entries=2)
+    for duration in (0.3, 0.1, 0.5, 0.2):
+        log.record(SlowQuery("SELECT ?", "SELECT 1", duration))
+
+    assert [entry.duration for entry in log.entries()] == [0.5, 0.3]
+
+
+def test_slow_statements_are_recorded():
+    db = make_db(slow_query_threshold=1e-9)
+    db.execute(QUERY, {"id": 1})
+
+    (entry,) = slow_query_log.entries()
+    assert entry.statement == QUERY
+    assert entry.fingerprint == (
+        "SELECT name FROM test_data WHERE id = :id AND name <> ?"
+    )
+    assert entry.parameters == {"id": 1}
+    assert entry.duration == db.statevars.timings["execute"]
+    db.close()
+
+
+def test_fast_statements_are_not_recorded():
+    db = make_db(slow_query_threshold=60)
+    db.execute(QUERY, {"id": 1})
+    assert not slow_query_log.entries()
+    db.close()
+
+
+def test_parameters_are_redacted():
+    db = make_db(
+        slow_query_threshold=1e-9, engine_options={"hide_parameters": True}
+    )
+    db.execute(QUERY, {"id": 1})
+
+    assert slow_query_log.entries()[0].parameters == {"id": "[REDACTED]"}
+    db.close()
+
+
+def test_dump_jsonl(tmp_path):
+    db = make_db(slow_query_threshold=1e-9)
+    db.execute(QUERY, {"id": 1})
+    db.execute(QUERY, {"id": 2})
+
+    path = tmp_path / "slow.jsonl"
+    assert slow_query_log.dump_jsonl(path) == 2  # noqa: PLR2004
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert {line["parameters"]["id"] for line in lines} == {1, 2}
+    assert len({line["fingerprint_id"] for line in lines}) == 1
+
+    buffer = io.StringIO()
+    slow_query_log.dump_jsonl(buffer)
+    assert buffer.getvalue() == path.read_text()
+    db.close()
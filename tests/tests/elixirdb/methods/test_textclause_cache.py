@@ -0,0 +1,23 @@
+from elixirdb.db import get_textclause_cache
+
+
+def test_textclause_reused(sqlite_db):
+    """The same raw statement string resolves to the same TextClause."""
+    statement = "SELECT name FROM test_data WHERE id = :id"
+    cache = sqlite_db.textclause_cache
+    hits = cache.stats()["hits"]
+
+    assert sqlite_db.execute(statement, {"id": 1}).scalar() == "name_1"
+    clause = cache.get(statement)
+    assert sqlite_db.execute(statement, {"id": 2}).scalar() == "name_2"
+
+    assert cache.get(statement) is clause
+    assert cache.stats()["hits"] > hits
+
+
+def test_textclause_cache_size_from_config(sqlite_db):
+    """The cache is sized from the engine configuration."""
+    assert sqlite_db.textclause_cache is get_textclause_cache(
+        sqlite_db.db.textclause_cache_size
+    )
+    assert get_textclause_cache(0).maxsize == 0
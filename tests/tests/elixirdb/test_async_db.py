@@ -0,0 +1,135 @@
+"Tests for AsyncElixirDB using aiosqlite."
+
+import asyncio
+import pytest
+from sqlalchemy import text
+from elixirdb import AsyncElixirDB
+from elixirdb.async_db import async_engine_registry
+from elixirdb.exc import InvalidEngineTypeError
+from elixirdb.exc import NotConnectedError
+
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_config():
+    return {"dialect": "sqlite", "url": "sqlite+aiosqlite:///:memory:"}
+
+
+def run(coro):
+    """Run a coroutine and dispose the async engines afterwards."""
+
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await async_engine_registry.dispose_all_async()
+
+    return asyncio.run(runner())
+
+
+async def seed(db: AsyncElixirDB) -> None:
+    await db.execute("CREATE TABLE test_data (id INTEGER PRIMARY KEY, name TEXT)")
+    await db.execute(
+        "INSERT INTO test_data (id, name) VALUES (:id, :name)",
+        [{"id": i, "name": f"name_{i}"} for i in range(1, 6)],
+    )
+
+
+@pytest.mark.parametrize("engine_type", ["direct", "async_session"])
+def test_async_execute(async_config, engine_type):
+    async def main():
+        async with AsyncElixirDB(
+            config=async_config, engine_type=engine_type
+        ) as db:
+            await seed(db)
+            await db.execute("SELECT name FROM test_data WHERE id = :id", {"id": 2})
+            return db.fetch_results(0)
+
+    assert run(main()) == [{"name": "name_2"}]
+
+
+def test_async_handlers(async_config):
+    """The parameter, result and error handlers run for awaited calls."""
+    errors = []
+    statement = text("SELECT name FROM test_data WHERE id = :id")
+
+    def double_id(params):
+        return statement, {"id": params["id"] * 2}
+
+    def first_value(result):
+        return result.scalar() if result.returns_rows else result
+
+    handlers = {
+        "parameter_handlers": [double_id],
+        "result_handlers": [first_value],
+        "error_handlers": [errors.append],
+    }
+
+    async def main():
+        async with AsyncElixirDB(config=async_config) as db:
+            await seed(db)
+            db.set_handlers(handlers)
+            name = await db.execute(statement, {"id": 2})
+            await db.execute("SELECT * FROM missing_table")
+            return name
+
+    assert run(main()) == "name_4"
+    assert len(errors) == 1
+
+
+def test_async_iter_results(async_config):
+    async def main():
+        async with AsyncElixirDB(config=async_config) as db:
+            await seed(db)
+            return [
+                len(batch)
+                async for batch in db.iter_results(
+                    "SELECT * FROM test_data", batch_size=2
+                )
+            ]
+
+    assert run(main()) == [2, 2, 1]
+
+
+@pytest.mark.parametrize("engine_type", ["direct", "async_session"])
+@pytest.mark.parametrize("method", ["executemany", "values"])
+def test_async_bulk_insert(async_config, engine_type, method):
+    async def main():
+        async with AsyncElixirDB(
+            config=async_config, engine_type=engine_type
+        ) as db:
+            await seed(db)
+            rows = ({"id": i, "name": f"name_{i}"} for i in range(6, 11))
+            result = await db.bulk_insert(
+                "test_data", rows, batch_size=2, method=method
+            )
+            await db.execute("SELECT COUNT(*) FROM test_data")
+            return result, db.result.scalar()
+
+    result, count = run(main())
+    assert (result.rows, result.batches) == (5, 3)
+    assert count == 10  # noqa: PLR2004
+
+
+def test_async_not_connected(async_config):
+    db = AsyncElixirDB(config=async_config)
+    with pytest.raises(NotConnectedError):
+        db.execute  # noqa: B018
+
+
+def test_async_invalid_engine_type(async_config):
+    with pytest.raises(InvalidEngineTypeError):
+        AsyncElixirDB(config=async_config, engine_type="scoped")
+
+
+def test_async_url_params_driver():
+    """url_params with the default driver are switched to the async driver."""
+    db = AsyncElixirDB(
+        config={
+            "dialect": "postgres",
+            "url_params": {"host": "localhost", "port": 5432, "database": "db"},
+        }
+    )
+    assert db.url_string.drivername == "postgresql+asyncpg"
@@ -0,0 +1,147 @@
+import asyncio
+import pytest
+from sqlalchemy import text
+from elixirdb import AsyncElixirDB
+from elixirdb import ElixirDB
+from elixirdb.async_db import async_engine_registry
+from elixirdb.exc import InvalidElixirConfigError
+from elixirdb.registry import engine_registry
+
+
+REGIONS = {"east": [(1, 10), (4, 5)], "west": [(2, 7), (3, 1)]}
+
+
+@pytest.fixture
+def regional_db(tmp_path):
+    """An EngineManager config with one sqlite file database per region."""
+    engines = {}
+    for key, rows in REGIONS.items():
+        engines[key] = {
+            "dialect": "sqlite",
+            "url": f"sqlite:///{tmp_path / key}.db",
+        }
+        db = ElixirDB(config=engines[key])
+        db.execute("CREATE TABLE orders (id INTEGER, total INTEGER, status TEXT)")
+        for id_, total in rows:
+            db.execute(
+                "INSERT INTO orders VALUES (:id, :total, 'open')",
+                {"id": id_, "total": total},
+            )
+        db.commit()
+        db.close()
+
+    db = ElixirDB({"engines": engines}, engine_key="east")
+    yield db
+    db.close()
+    engine_registry.dispose_all()
+
+
+def test_fan_out_concatenate(regional_db):
+    results = regional_db.fan_out("SELECT id FROM orders ORDER BY id")
+
+    assert list(results.results) == ["east", "west"]
+    assert not results.errors
+    ids = [row["id"] for row in results.merge()]
+    assert ids == [1, 4, 2, 3]
+
+
+def test_fan_out_merge_sorted(regional_db):
+    results = regional_db.fan_out("SELECT id FROM orders ORDER BY id DESC")
+
+    rows = results.merge("merge_sorted", key="id", reverse=True)
+    assert [row["id"] for row in rows] == [4, 3, 2, 1]
+
+
+def test_fan_out_aggregate(regional_db):
+    results = regional_db.fan_out(
+        "SELECT status, SUM(total) AS total, COUNT(*) AS n FROM orders "
+        "GROUP BY status"
+    )
+
+    rows = results.merge(
+        "aggregate", group_by=["status"], aggregates={"total": sum, "n": sum}
+    )
+    assert rows == [{"status": "open", "total": 23, "n": 4}]
+
+
+def test_fan_out_collects_errors(regional_db):
+    regional_db.execute("SELECT 1")  # The instance connection is not used.
+    results = regional_db.fan_out(
+        "SELECT id FROM orders WHERE id > :id", {"id": 1}, engine_keys=["west"]
+    )
+    assert [row["id"] for row in results["west"].rows] == [2, 3]
+
+    results = regional_db.fan_out("SELECT * FROM missing", max_workers=1)
+    assert set(results.errors) == {"east", "west"}
+    assert results.merge() == []
+
+
+def test_fan_out_commit(regional_db):
+    results = regional_db.fan_out(
+        "UPDATE orders SET status = 'closed'", commit=True
+    )
+    assert results.rowcount == 4  # noqa: PLR2004
+
+    results = regional_db.fan_out("SELECT DISTINCT status FROM orders")
+    assert [row["status"] for row in results.merge()] == ["closed", "closed"]
+
+
+def test_fan_out_requires_engine_manager():
+    db = ElixirDB({"dialect": "sqlite", "url": "sqlite://"})
+    with pytest.raises(InvalidElixirConfigError):
+        db.fan_out("SELECT 1")
+    db.close()
+
+
+def test_fan_out_uses_handlers(regional_db):
+    calls = []
+    statement = text("SELECT id FROM orders WHERE id >= :id ORDER BY id")
+
+    def double_id(params):
+        calls.append(params)
+        return statement, {"id": params["id"] * 2}
+
+    def ids(result):
+        return [row.id for row in result] if result.returns_rows else result
+
+    regional_db.set_handlers(
+        {"parameter_handlers": [double_id], "result_handlers": [ids]}
+    )
+    results = regional_db.fan_out(statement, {"id": 1})
+
+    assert len(calls) == 2  # noqa: PLR2004
+    # The parameter handler doubled the id and the result handler made the rows.
+    assert results.merge() == [4, 2, 3]
+
+
+def test_fan_out_session_workers(regional_db):
+    db = ElixirDB(regional_db.config, engine_key="east", engine_type="session")
+    try:
+        results = db.fan_out("SELECT id FROM orders ORDER BY id")
+        assert not results.errors
+        assert [row["id"] for row in results.merge()] == [1, 4, 2, 3]
+    finally:
+        db.close()
+
+
+def test_async_fan_out(tmp_path, regional_db):
+    pytest.importorskip("aiosqlite")
+    engines = {
+        key: {
+            "dialect": "sqlite",
+            "url": f"sqlite+aiosqlite:///{tmp_path / key}.db",
+        }
+        for key in REGIONS
+    }
+
+    async def main():
+        try:
+            db = AsyncElixirDB({"engines": engines}, engine_key="east")
+            async with db:
+                return await db.fan_out("SELECT id FROM orders ORDER BY id")
+        finally:
+            await async_engine_registry.dispose_all_async()
+
+    results = asyncio.run(main())
+    assert not results.errors
+    assert [row["id"] for row in results.merge()] == [1, 4, 2, 3]
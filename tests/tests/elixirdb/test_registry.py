@@ -0,0 +1,100 @@
+import pytest
+from elixirdb import ElixirDB
+from elixirdb.models.engine import EngineModel
+from elixirdb.registry import EngineRegistry
+from elixirdb.registry import engine_registry
+from elixirdb.registry import make_registry_key
+
+
+@pytest.fixture
+def sqlite_config():
+    return {"dialect": "sqlite", "url": "sqlite:///:memory:", "auto_connect": False}
+
+
+@pytest.fixture
+def registry():
+    registry = EngineRegistry()
+    yield registry
+    registry.dispose_all()
+
+
+def test_instances_share_engine(tmp_path):
+    """Instances with the same configuration reuse one engine."""
+    config = {
+        "dialect": "sqlite",
+        "url": f"sqlite:///{tmp_path / 'shared.db'}",
+        "auto_connect": False,
+    }
+    try:
+        db1 = ElixirDB(config=config)
+        db2 = ElixirDB(config=config)
+
+        assert db1.engine is db2.engine
+    finally:
+        engine_registry.dispose_all()
+
+
+@pytest.mark.parametrize("shared_engine", [False, None])
+def test_unshared_engine(sqlite_config, shared_engine):
+    """
+    shared_engine=False creates an engine per instance, as does the default
+    for in-memory SQLite databases.
+    """
+    if shared_engine is not None:
+        sqlite_config["shared_engine"] = shared_engine
+    db1 = ElixirDB(config=sqlite_config)
+    db2 = ElixirDB(config=sqlite_config)
+
+    assert db1.engine is not db2.engine
+    key = make_registry_key(db1.db, db1.url_string, db1.engine_key)
+    assert key not in engine_registry
+
+
+def test_shared_in_memory_engine(sqlite_config):
+    """shared_engine=True shares an in-memory SQLite engine and database."""
+    sqlite_config["shared_engine"] = True
+    try:
+        db1 = ElixirDB(config=sqlite_config)
+        db2 = ElixirDB(config=sqlite_config)
+
+        assert db1.engine is db2.engine
+        assert make_registry_key(db1.db, db1.url_string) in engine_registry
+    finally:
+        engine_registry.dispose_all()
+
+
+def test_registry_key_includes_options(sqlite_config):
+    """Different engine options or engine keys result in different keys."""
+    model = EngineModel(**sqlite_config)
+    echo_model = EngineModel(**sqlite_config, engine_options={"echo": True})
+    url = model.url
+
+    assert make_registry_key(model, url) == make_registry_key(model, url)
+    assert make_registry_key(model, url) != make_registry_key(echo_model, url)
+    assert make_registry_key(model, url, "a") != make_registry_key(model, url, "b")
+
+
+def test_registry_dispose(registry, sqlite_config):
+    """Engines are removed from the registry once disposed."""
+    model = EngineModel(**sqlite_config)
+    engine = registry.get_engine(model, model.url)
+
+    assert registry.get_engine(model, model.url) is engine
+    assert len(registry) == 1
+
+    registry.dispose(make_registry_key(model, model.url))
+    assert len(registry) == 0
+    assert registry.get_engine(model, model.url) is not engine
+
+    registry.dispose_all()
+    assert len(registry) == 0
+
+
+def test_registry_after_fork(registry, sqlite_config):
+    """after_fork keeps the engines registered."""
+    model = EngineModel(**sqlite_config)
+    engine = registry.get_engine(model, model.url)
+
+    registry.after_fork()
+
+    assert registry.get_engine(model, model.url) is engine
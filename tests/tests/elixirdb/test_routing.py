@@ -0,0 +1,134 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy import table
+from sqlalchemy import text
+from elixirdb import ElixirDB
+from elixirdb.models.manager import EngineManager
+from elixirdb.registry import engine_registry
+from elixirdb.routing import ReplicaRouter
+from elixirdb.routing import is_read_statement
+
+
+@pytest.fixture
+def routed_config(tmp_path):
+    """A primary and two replicas, each a sqlite file named after its key."""
+    engines = {}
+    for key in ("primary", "replica1", "replica2"):
+        engines[key] = {
+            "dialect": "sqlite",
+            "url": f"sqlite:///{tmp_path / key}.db",
+        }
+        db = ElixirDB(config=engines[key])
+        db.execute("CREATE TABLE source (name TEXT)")
+        db.execute("INSERT INTO source VALUES (:name)", {"name": key})
+        db.commit()
+        db.close()
+    yield {
+        "engines": engines,
+        "routes": {
+            "app": {"primary": "primary", "replicas": ["replica1", "replica2"]}
+        },
+    }
+    engine_registry.dispose_all()
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT * FROM t", True),
+        ("  -- comment\n select 1", True),
+        ("WITH x AS (SELECT 1) SELECT * FROM x", True),
+        ("SELECT * FROM t FOR UPDATE", False),
+        ("INSERT INTO t VALUES (1)", False),
+        ("WITH x AS (SELECT 1) DELETE FROM t", False),
+        (text("select 1"), True),
+        (select(table("t")), True),
+        (select(table("t")).with_for_update(), False),
+    ],
+)
+def test_is_read_statement(statement, expected):
+    assert is_read_statement(statement) is expected
+
+
+def test_route_validation(routed_config):
+    """Routes must reference configured engines and not shadow engine keys."""
+    routed_config["routes"]["app"]["replicas"].append("missing")
+    with pytest.raises(ValidationError):
+        EngineManager(**routed_config)
+
+    routed_config["routes"] = {"primary": {"primary": "primary"}}
+    with pytest.raises(ValidationError):
+        EngineManager(**routed_config)
+
+
+@pytest.mark.parametrize("engine_type", ["direct", "session"])
+def test_reads_round_robin_over_replicas(routed_config, engine_type):
+    db = ElixirDB(routed_config, engine_key="app", engine_type=engine_type)
+    try:
+        assert db.engine_key == "primary"
+        names = [
+            db.execute("SELECT name FROM source").scalar() for _ in range(4)
+        ]
+        assert sorted(names) == ["replica1", "replica1", "replica2", "replica2"]
+    finally:
+        db.close()
+
+
+def test_writes_and_transactions_use_primary(routed_config):
+    db = ElixirDB(routed_config, engine_key="app")
+    try:
+        db.execute("INSERT INTO source VALUES ('written')")
+        # The primary is in a transaction, so reads see the uncommitted write.
+        rows = db.execute("SELECT name FROM source").scalars().all()
+        assert rows == ["primary", "written"]
+        db.commit()
+
+        assert db.execute("SELECT name FROM source").scalar() != "primary"
+    finally:
+        db.close()
+
+
+def test_latency_weighted_prefers_faster_replica():
+    router = ReplicaRouter(["fast", "slow"], "latency_weighted")
+    router.record("fast", 0.001)
+    router.record("slow", 1.0)
+
+    choices = [router.choose() for _ in range(200)]
+    assert choices.count("fast") > choices.count("slow")
+
+
+def test_least_checked_out(routed_config):
+    routed_config["routes"]["app"]["policy"] = "least_checked_out"
+    db = ElixirDB(routed_config, engine_key="app")
+    try:
+        # replica1 holds the connection opened by the first read.
+        assert db.execute("SELECT name FROM source").scalar() == "replica1"
+        assert db.execute("SELECT name FROM source").scalar() == "replica2"
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("engine_type", ["direct", "session"])
+def test_replica_transaction_ends_after_read(routed_config, engine_type):
+    routed_config["routes"]["app"]["replicas"] = ["replica1"]
+    db = ElixirDB(routed_config, engine_key="app", engine_type=engine_type)
+    writer = ElixirDB(routed_config, engine_key="replica1")
+    try:
+        assert db.execute("SELECT name FROM source").scalars().all() == [
+            "replica1"
+        ]
+        assert not db._replicas["replica1"].in_transaction()
+
+        writer.execute("INSERT INTO source VALUES ('committed')")
+        writer.commit()
+
+        # The second read sees the commit made after the first read.
+        assert db.execute("SELECT name FROM source").scalars().all() == [
+            "replica1",
+            "committed",
+        ]
+        assert not db._replicas["replica1"].in_transaction()
+    finally:
+        writer.close()
+        db.close()
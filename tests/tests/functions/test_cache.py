@@ -0,0 +1,112 @@
+import pytest
+from elixirdb.utils.cache import LRUCache
+from elixirdb.utils.cache import ResultCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry.
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+    assert cache.stats() == {
+        "hits": 3,
+        "misses": 0,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_lru_cache_get_or_set():
+    cache = LRUCache(maxsize=2)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    assert len(calls) == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.set("a", 1)
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError, match="maxsize"):
+        LRUCache(maxsize=-1)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_result_cache_ttl():
+    clock = FakeClock()
+    cache = ResultCache(ttl=10, clock=clock)
+    cache.set("a", 1, size=10)
+    cache.set("b", 2, size=10, ttl=20)
+
+    clock.now = 15
+    assert cache.get("a") is None
+    assert cache.get("b") == 2  # noqa: PLR2004
+    assert cache.stats()["expirations"] == 1
+    assert cache.bytes == 10  # noqa: PLR2004
+
+
+def test_result_cache_max_bytes():
+    cache = ResultCache(max_bytes=100)
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.get("a")
+    cache.set("c", 3, size=40)
+    cache.set("huge", 4, size=101)
+
+    assert "b" not in cache
+    assert "huge" not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes == 80  # noqa: PLR2004
+
+
+def test_result_cache_invalidate():
+    cache = ResultCache()
+    cache.set("a", 1, size=1, tags=["users"])
+    cache.set("b", 2, size=1, tags=["users", "orders"])
+    cache.set("c", 3, size=1, tags=["orders"])
+
+    assert cache.invalidate(["users"]) == 2  # noqa: PLR2004
+    assert list(cache._data) == ["c"]
+    assert cache.invalidate(["users"]) == 0
+    assert cache.stats()["invalidations"] == 2  # noqa: PLR2004
+
+
+def test_result_cache_generation():
+    cache = ResultCache()
+    generation = cache.generation(["users", "orders"])
+    assert generation == (0, 0)
+
+    # A value read before an invalidation of one of its tags is not cached.
+    cache.invalidate(["orders"])
+    cache.set("a", 1, size=1, tags=["users", "orders"], generation=generation)
+    assert "a" not in cache
+
+    generation = cache.generation(["users", "orders"])
+    cache.set("a", 1, size=1, tags=["users", "orders"], generation=generation)
+    assert cache.get("a") == 1
@@ -0,0 +1,67 @@
+import pytest
+from dateutil import parser
+from elixirdb.handlers import DateFormatter
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-1-5",
+        "2024-01-05",
+        "1/5/2024",
+        "01/05/24",
+        "13/01/2024",
+        "1-5-2024",
+        "2024/01/05",
+        "2024-01-05 13:45:10",
+        "2024/1/5 13:45:10",
+        "5 Jan 2024",
+        "jan 5, 2024",
+        "Feb 5, 0024",
+    ],
+)
+def test_matches_dateutil(value):
+    formatter = DateFormatter("%Y-%m-%d %H:%M:%S")
+    assert formatter(value) == parser.parse(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.mark.parametrize(
+    "value", ["2024-02-30", "13/13/2024", "5 Foo 2024", "hello", "2024-01-05x"]
+)
+def test_invalid_dates_are_unchanged(value):
+    assert DateFormatter()(value) == value
+
+
+def test_repeated_strings_are_cached():
+    formatter = DateFormatter()
+    formatter(["2024-01-05"] * 10)
+    info = formatter._format.cache_info()  # pylint: disable=protected-access
+    assert (info.hits, info.misses) == (9, 1)
+
+
+def test_nested_data():
+    data = {
+        "rows": [{"day": "1/5/2024", "note": "text", "n": 1}],
+        "at": "5 Jan 2024",
+    }
+    assert DateFormatter()(data) == {
+        "rows": [{"day": "2024-01-05", "note": "text", "n": 1}],
+        "at": "2024-01-05",
+    }
+
+
+def test_columnwise():
+    rows = [
+        {"id": 1, "day": None, "note": "2024-01-05", "nested": ["2024-01-05"]},
+        {"id": 2, "day": "1/5/2024", "note": "text", "nested": []},
+        {"id": 3, "day": "not a date", "note": "text", "nested": []},
+    ]
+    formatter = DateFormatter(columnwise=True)
+
+    assert formatter.date_columns(rows) == ["note", "day"]
+    assert formatter(rows) == [
+        {"id": 1, "day": None, "note": "2024-01-05", "nested": ["2024-01-05"]},
+        {"id": 2, "day": "2024-01-05", "note": "text", "nested": []},
+        {"id": 3, "day": "not a date", "note": "text", "nested": []},
+    ]
+    assert rows[1]["day"] == "1/5/2024"
@@ -1,7 +1,13 @@
 # ruff: noqa: PT006
+import sys
+from unittest.mock import patch
 import pytest
+import sqlglot
+from sqlglot import exp
+from elixirdb.utils.db_utils import apply_schema_prefix
 from elixirdb.utils.db_utils import apply_schema_to_statement
 from elixirdb.utils.db_utils import build_sql_proc_params
+from elixirdb.utils.db_utils import dml_tables
 from elixirdb.utils.db_utils import has_paging
 from elixirdb.utils.db_utils import has_sorting
 from elixirdb.utils.db_utils import is_dml_query
@@ -10,6 +16,9 @@ from elixirdb.utils.db_utils import is_stored_procedure
 from elixirdb.utils.db_utils import is_temp_table
 from elixirdb.utils.db_utils import process_params
 from elixirdb.utils.db_utils import return_mapped_dialect
+from elixirdb.utils.db_utils import rewrite_statement_schema
+from elixirdb.utils.db_utils import set_schema_cache
+from elixirdb.utils.db_utils import statement_tables
 
 
 @pytest.mark.parametrize(
@@ -128,3 +137,76 @@ def test_is_dml_query(statement, expected):
 )
 def test_is_list_of_type(obj, type_, subclass, expected):
     assert is_list_of_type(obj, type_, subclass) == expected
+
+
+def test_apply_schema_to_statement_memoized():
+    query = "SELECT * FROM memo_table"
+    expected = "SELECT * FROM my_schema.memo_table"
+
+    with patch(
+        "elixirdb.utils.db_utils.rewrite_statement_schema",
+        wraps=rewrite_statement_schema,
+    ) as rewrite:
+        assert apply_schema_to_statement(query, "my_schema") == expected
+        assert apply_schema_to_statement(query, "my_schema") == expected
+        assert apply_schema_to_statement(query, "other") == (
+            "SELECT * FROM other.memo_table"
+        )
+
+    assert rewrite.call_count == 2  # noqa: PLR2004
+
+
+def test_apply_schema_to_statement_disk_cache(tmp_path):
+    query = "SELECT * FROM disk_table"
+    expected = "SELECT * FROM my_schema.disk_table"
+    try:
+        set_schema_cache(maxsize=16, path=tmp_path / "schema_cache.db")
+        assert apply_schema_to_statement(query, "my_schema") == expected
+
+        # A new in-memory cache (e.g. a new process) reads from disk.
+        set_schema_cache(maxsize=16)
+        with patch("elixirdb.utils.db_utils.rewrite_statement_schema") as rewrite:
+            assert apply_schema_to_statement(query, "my_schema") == expected
+        rewrite.assert_not_called()
+    finally:
+        set_schema_cache(maxsize=1024, path="")
+
+
+def test_apply_schema_prefix_collects_ctes():
+    ast = sqlglot.parse_one(
+        "WITH recent AS (SELECT * FROM orders) "
+        "SELECT * FROM recent JOIN customers ON recent.id = customers.id"
+    )
+    apply_schema_prefix(ast, "my_schema")
+
+    assert ast.sql() == (
+        "WITH recent AS (SELECT * FROM my_schema.orders) "
+        "SELECT * FROM recent JOIN my_schema.customers "
+        "ON recent.id = customers.id"
+    )
+
+
+def test_apply_schema_prefix_deep_nesting():
+    """The walk does not recurse, so depth is not bound by the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    node = exp.select("id").from_("base_table")
+    for _ in range(depth):
+        node = exp.Paren(this=node)
+    ast = exp.select("id").from_(exp.Subquery(this=node))
+
+    apply_schema_prefix(ast, "my_schema")
+
+    table = next(ast.find_all(exp.Table, bfs=True))
+    assert table.db == "my_schema"
+
+
+def test_statement_tables():
+    sql = "WITH x AS (SELECT * FROM a) SELECT * FROM x JOIN s.B ON x.id = B.id"
+    assert statement_tables(sql) == {"a", "b"}
+    assert statement_tables("not sql at all (") == frozenset()
+
+
+def test_dml_tables():
+    assert dml_tables("UPDATE users SET name = :name") == {"users"}
+    assert dml_tables("INSERT INTO logs SELECT * FROM users") == {"logs", "users"}
+    assert dml_tables("SELECT * FROM users") == frozenset()
@@ -2,8 +2,13 @@ from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
 import pytest
+from elixirdb.base import clear_config_cache
+from elixirdb.base import discover_config
+from elixirdb.utils.files import CONFIG_ENV_VAR
+from elixirdb.utils.files import find_config_file
 from elixirdb.utils.files import load_config
 from elixirdb.utils.files import scan_files
+from elixirdb.utils.files import search_files
 
 
 @pytest.fixture
@@ -100,3 +105,71 @@ def test_load_config_no_files_found(mock_find_root, mock_rglob):
     result = load_config(partial="config", file_type="yaml")
 
     assert result is None
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project root with the environment variable unset."""
+    monkeypatch.delenv(CONFIG_ENV_VAR, raising=False)
+    with patch("elixirdb.utils.files.find_root", return_value=tmp_path):
+        yield tmp_path
+    clear_config_cache()
+
+
+def test_search_files_skips_excluded_and_deep_dirs(project):
+    (project / "config").mkdir()
+    (project / "config" / "elixir.yaml").touch()
+    for excluded in (".venv", "node_modules"):
+        (project / excluded).mkdir()
+        (project / excluded / "elixir.yaml").touch()
+    deep = project / "a" / "b" / "c" / "d"
+    deep.mkdir(parents=True)
+    (deep / "elixir.yaml").touch()
+
+    assert search_files(project, "elixir", "yaml") == [
+        project / "config" / "elixir.yaml"
+    ]
+    found = search_files(project, "elixir", "yaml", max_depth=4)
+    assert len(found) == 2  # noqa: PLR2004
+
+
+def test_find_config_file_resolution_order(project, monkeypatch):
+    searched = project / "elixir.yaml"
+    searched.touch()
+    assert find_config_file() == searched
+
+    (project / "pyproject.toml").write_text(
+        '[tool.elixirdb]\nconfig = "conf/db.yaml"\n'
+    )
+    with pytest.raises(FileNotFoundError, match=r"pyproject\.toml"):
+        find_config_file()
+    (project / "conf").mkdir()
+    (project / "conf" / "db.yaml").touch()
+    assert find_config_file() == project / "conf" / "db.yaml"
+
+    env = project / "env.yaml"
+    env.touch()
+    monkeypatch.setenv(CONFIG_ENV_VAR, str(env))
+    assert find_config_file() == env
+
+
+def test_discover_config_is_cached(project, monkeypatch):
+    (project / "elixir.yaml").write_text("dialect: sqlite\nurl: sqlite://\n")
+
+    with patch(
+        "elixirdb.base.find_config_file", wraps=find_config_file
+    ) as mock_find:
+        config = discover_config()
+        # Each call returns a copy, so callers cannot change each other's.
+        copy = discover_config()
+        assert copy == config
+        assert copy is not config
+        assert mock_find.call_count == 1
+
+        other = project / "other.yaml"
+        other.write_text("dialect: sqlite\nurl: sqlite:///other.db\n")
+        monkeypatch.setenv(CONFIG_ENV_VAR, str(other))
+        assert discover_config().url == "sqlite:///other.db"
+        assert mock_find.call_count == 2  # noqa: PLR2004
+
+    assert config.url == "sqlite://"
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+import pytest
+from elixirdb.utils.lazy import LazyModule
+
+
+DEFERRED = (
+    "sqlglot",
+    "dateutil",
+    "yaml",
+    "pyrootutils",
+    # The async API. asyncio itself is imported by sqlalchemy.
+    "elixirdb.async_db",
+    "sqlalchemy.ext.asyncio",
+    "greenlet",
+)
+
+
+def within(module: str, packages: tuple[str, ...]) -> bool:
+    return any(module == p or module.startswith(f"{p}.") for p in packages)
+
+
+def imported_modules(code: str) -> dict[str, int]:
+    """Run code in a new interpreter and return -X importtime cumulative us."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_defers_optional_dependencies():
+    modules = imported_modules("import elixirdb")
+
+    assert "elixirdb" in modules
+    loaded = [m for m in modules if within(m, DEFERRED)]
+    assert not loaded, f"Imported eagerly: {loaded}"
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        (
+            (
+                "from elixirdb.utils.db_utils import is_dml_query; "
+                "is_dml_query('DELETE FROM t')"
+            ),
+            "sqlglot",
+        ),
+        (
+            (
+                "from elixirdb.handlers import DateFormatter; "
+                "DateFormatter()('13/01/2024')"
+            ),
+            "dateutil",
+        ),
+        (
+            "from elixirdb import AsyncElixirDB",
+            "sqlalchemy.ext.asyncio",
+        ),
+    ],
+)
+def test_deferred_modules_load_on_use(code, module):
+    assert any(within(m, (module,)) for m in imported_modules(code))
+
+
+def test_lazy_module():
+    json = LazyModule("json")
+    assert "not loaded" in repr(json)
+    assert json.dumps([1]) == "[1]"
+    assert "loaded" in repr(json)
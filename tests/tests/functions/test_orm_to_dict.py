@@ -0,0 +1,95 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from elixirdb.handlers import orm_result_to_list_of_dicts
+from elixirdb.handlers import to_dict
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    books: Mapped[list["Book"]] = relationship(back_populates="author")
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column("book_title")
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"))
+    author: Mapped[Author | None] = relationship(back_populates="books")
+
+
+def make_author() -> Author:
+    author = Author(id=1, name="Ann")
+    author.books = [Book(id=1, title="One", author_id=1)]
+    return author
+
+
+def test_to_dict_uses_attribute_names():
+    assert to_dict(Book(id=1, title="One", author_id=None)) == {
+        "id": 1,
+        "title": "One",
+        "author_id": None,
+    }
+    assert to_dict(None) == {}
+
+
+def test_to_dict_columns_subset():
+    book = Book(id=1, title="One", author_id=2)
+    assert to_dict(book, columns=["title"]) == {"title": "One"}
+    assert to_dict(book, columns=["id", "title"]) == {"id": 1, "title": "One"}
+    assert to_dict(book, columns=[]) == {}
+
+
+def test_to_dict_relationship_depth():
+    author = make_author()
+
+    assert "books" not in to_dict(author)
+    assert to_dict(author, depth=1) == {
+        "id": 1,
+        "name": "Ann",
+        "books": [{"id": 1, "title": "One", "author_id": 1}],
+    }
+    nested = to_dict(author, depth=2)["books"][0]["author"]
+    assert nested == {"id": 1, "name": "Ann"}
+    assert to_dict(Book(id=2, title="Two"), depth=1)["author"] is None
+
+
+def test_orm_result_to_list_of_dicts_mixed_classes():
+    author = make_author()
+    objects = [author, author.books[0], None]
+
+    assert orm_result_to_list_of_dicts(objects, columns=["id"]) == [
+        {"id": 1},
+        {"id": 1},
+        {},
+    ]
+    assert orm_result_to_list_of_dicts([author], depth=1) == [
+        to_dict(author, depth=1)
+    ]
+
+
+def test_expired_objects_are_loaded():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Book(id=1, title="One"))
+        session.commit()
+        book = session.get(Book, 1)
+        session.expire(book)
+
+        assert orm_result_to_list_of_dicts([book]) == [
+            {"id": 1, "title": "One", "author_id": None}
+        ]
+    engine.dispose()
@@ -5,7 +5,11 @@ from __future__ import annotations
 
 import pytest
 from pydantic import ValidationError
+from elixirdb import ElixirDB
 from elixirdb import EngineModel
+from elixirdb.base import copy_model
+from elixirdb.base import shared_config
+from elixirdb.base import validate_config
 from elixirdb.enums import Dialect
 from elixirdb.models.engine import Statements
 from elixirdb.models.engine import UrlParams
@@ -135,3 +139,69 @@ class TestStatements:
             Statements(prefix_raw_statements=True)
         with pytest.raises(ValidationError):
             Statements(prefix_procedures=True)
+
+
+def test_models_are_mutable():
+    config = {"dialect": "sqlite", "url": "sqlite:///mutable.db"}
+    model = validate_config(config)
+    model.debug = True
+
+    assert model.debug
+    assert not validate_config(config).debug
+
+
+def test_copy_model():
+    manager = validate_config(
+        {
+            "engines": {
+                "a": {
+                    "dialect": "sqlite",
+                    "url": "sqlite://",
+                    "engine_options": {"connect_args": {"timeout": 5}},
+                }
+            }
+        }
+    )
+    copy = copy_model(manager)
+    assert copy == manager
+    assert copy.model_fields_set == manager.model_fields_set
+
+    # Nested models, dicts and lists are copied.
+    copy.engines["a"].engine_options.connect_args["timeout"] = 10
+    copy.engines["a"].debug = True
+    assert manager.engines["a"].engine_options.connect_args == {"timeout": 5}
+    assert not manager.engines["a"].debug
+
+
+def test_shared_config():
+    config = {"dialect": "sqlite", "url": "sqlite:///shared.db"}
+    model = shared_config(config)
+
+    assert shared_config(dict(config)) is model
+    assert shared_config({**config, "debug": True}) is not model
+    with pytest.raises(TypeError, match="shared"):
+        model.debug = True
+    with pytest.raises(TypeError, match="shared"):
+        model.engine_options = None
+
+    # Copies of a shared model can be changed.
+    copy = copy_model(model)
+    copy.debug = True
+    assert not model.debug
+
+
+def test_shared_config_instances():
+    config = {
+        "defaults": {"auto_connect": False},
+        "engines": {
+            "a": {"dialect": "sqlite", "url": "sqlite:///a.db", "default": True},
+            "b": {"dialect": "sqlite", "url": "sqlite:///b.db"},
+        },
+    }
+    db1 = ElixirDB(config, share_config=True)
+    db2 = ElixirDB(config, share_config=True)
+
+    assert db1.config is db2.config
+    assert db1.db is db2.db
+    assert db1.engine_key == "a"
+    assert ElixirDB(config).config is not db1.config